@@ -0,0 +1,97 @@
+# backend/algorithms/array_states.py
+"""
+Bulk element-state encoding for array visualizations.
+
+Array tracers describe element states with a default plus a few ranges
+derived from their pointers (e.g. "excluded before left", "examining at
+mid"). paint_states() applies those ranges with slice assignment instead
+of calling a Python state function per element, and element_rows() builds
+the row-oriented [{'index', 'value', 'state'}, ...] payload in one pass.
+
+state_runs() / expand_state_runs() convert a state list to and from a
+run-length form ([[start, stop, state], ...]) for compact columnar
+payloads, where the array values are sent once and only state runs change
+per step.
+"""
+
+from itertools import groupby
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+# (start, stop, state): half-open index range [start, stop)
+StateRange = Tuple[int, int, str]
+
+
+def point(index: Optional[int], state: str) -> StateRange:
+    """Range covering a single index (empty if index is None)."""
+    if index is None:
+        return (0, 0, state)
+    return (index, index + 1, state)
+
+
+def paint_states(size: int, default: str, ranges: Iterable[StateRange]) -> List[str]:
+    """
+    Return per-element states for an array of the given size.
+
+    Every element starts as 'default'; each range then overwrites its
+    elements in order, so later ranges take priority. Ranges are clamped to
+    [0, size), so out-of-bounds pointers (e.g. -1 or size) have no effect.
+
+    Args:
+        size: Number of elements
+        default: State of elements no range covers
+        ranges: (start, stop, state) half-open ranges, lowest priority first
+
+    Returns:
+        list: State string per element
+    """
+    states = [default] * size
+    for start, stop, state in ranges:
+        start, stop = max(start, 0), min(stop, size)
+        if start < stop:
+            states[start:stop] = [state] * (stop - start)
+    return states
+
+
+def element_rows(values: Sequence[Any], states: Sequence[str], **columns: Sequence[Any]) -> List[dict]:
+    """
+    Build [{'index': i, 'value': v, 'state': s, **extra}, ...] rows.
+
+    Args:
+        values: Element values
+        states: Element states (same length as values)
+        **columns: Extra per-element columns, added after 'state' in order
+
+    Returns:
+        list: One dict per element
+    """
+    if not columns:
+        return [
+            {'index': i, 'value': value, 'state': state}
+            for i, value, state in zip(range(len(values)), values, states)
+        ]
+    keys = ('index', 'value', 'state', *columns)
+    return [dict(zip(keys, row)) for row in zip(range(len(values)), values, states, *columns.values())]
+
+
+def state_runs(states: Sequence[str]) -> List[list]:
+    """
+    Run-length encode a state list as [[start, stop, state], ...].
+
+    Runs are maximal, contiguous and cover the whole list in order.
+    """
+    runs = []
+    start = 0
+    for state, group in groupby(states):
+        stop = start + sum(1 for _ in group)
+        runs.append([start, stop, state])
+        start = stop
+    return runs
+
+
+def expand_state_runs(runs: Iterable[Sequence[Any]]) -> List[str]:
+    """Inverse of state_runs()."""
+    states = []
+    for start, stop, state in runs:
+        states.extend([state] * (stop - start))
+    return states
@@ -13,7 +13,9 @@ Version: 2.0 - Added narrative generation requirement (WORKFLOW.md v2.0)
 
 from abc import ABC, abstractmethod
 from typing import Any, List, Dict
-from dataclasses import dataclass, asdict
+from collections import Counter
+from dataclasses import dataclass
+import heapq
 import time
 
 
@@ -24,13 +26,34 @@ class TraceStep:
 
     This structure is shared across all algorithms to ensure consistent
     visualization on the frontend.
+
+    Slotted to avoid a per-instance __dict__ (traces can hold thousands of
+    steps). dataclasses.asdict() still works, but it deep-copies 'data';
+    use to_dict() for serialization.
     """
+    __slots__ = ('step', 'type', 'timestamp', 'data', 'description')
+
     step: int
     type: str
     timestamp: float
     data: dict
     description: str
 
+    def to_dict(self) -> dict:
+        """
+        Shallow dict view of this step.
+
+        'data' is shared, not copied: step data is never modified after
+        _add_step() records it.
+        """
+        return {
+            'step': self.step,
+            'type': self.type,
+            'timestamp': self.timestamp,
+            'data': self.data,
+            'description': self.description,
+        }
+
 
 class AlgorithmTracer(ABC):
     """
@@ -48,16 +71,104 @@ class AlgorithmTracer(ABC):
     - Safety limits (MAX_STEPS to prevent infinite loops)
     - Common serialization utilities
     - Consistent metadata structure
+    - Coarse-grained tracing via set_granularity()
+    - Step-type index of recorded steps via step_indices()
     """
 
     MAX_STEPS = 10000
 
+    # Trace granularity levels:
+    # - fine: every step (default)
+    # - phase: first step, PHASE_STEP_TYPES steps, last step
+    # - summary: first and last step only
+    GRANULARITIES = ('fine', 'phase', 'summary')
+
+    # Step types that close a phase (a pass, a node finalization, a merge...).
+    # Subclasses override; with no phase types 'phase' behaves like 'summary'.
+    PHASE_STEP_TYPES = frozenset()
+
+    # Step types where the algorithm commits to a decision (swap or not, keep
+    # or cover, relax an edge...). Trace sampling always keeps these steps.
+    DECISION_STEP_TYPES = frozenset()
+
+    # Execution modes:
+    # - trace: record steps at the chosen granularity (default)
+    # - result_only: record no steps, only compute the result
+    MODES = ('trace', 'result_only')
+
     def __init__(self):
         """Initialize tracer with empty trace and reset counters."""
         self.trace = []
         self.step_count = 0
+        self._step_type_index: Dict[str, List[int]] = {}
         self.start_time = time.time()
         self.metadata = {}
+        self.granularity = 'fine'
+        self.mode = 'trace'
+        self.fine_step_count = 0
+        self._pending_step = None
+        self._pending_types = Counter()
+
+    def set_granularity(self, granularity: str):
+        """
+        Choose how many steps are recorded. Must be called before execute().
+
+        At 'phase' and 'summary' granularity, steps that are not recorded are
+        folded into the next recorded step: its data gets an 'aggregated'
+        entry ({'fine_steps': int, 'step_types': {type: count}}) covering
+        itself and every skipped step before it. The last step is always
+        recorded, with visualization state taken at the end of execution.
+        Skipped steps don't count towards MAX_STEPS.
+
+        Coarse traces have no prediction points: get_prediction_points()
+        reads the step after a question as its answer, which only holds
+        when every step is recorded.
+
+        Args:
+            granularity: 'fine' | 'phase' | 'summary'
+
+        Raises:
+            ValueError: If granularity is not one of GRANULARITIES
+        """
+        if granularity not in self.GRANULARITIES:
+            raise ValueError(
+                f"Invalid granularity '{granularity}'. "
+                f"Expected one of: {', '.join(self.GRANULARITIES)}"
+            )
+        self.granularity = granularity
+
+    def set_mode(self, mode: str):
+        """
+        Choose whether steps are recorded at all. Must be called before execute().
+
+        In 'result_only' mode _add_step() only counts the step: no
+        visualization state is computed and no TraceStep is created. The
+        result has the usual 'result' and 'metadata' with empty trace steps
+        and no prediction points; metadata gains 'mode' and 'fine_steps'.
+        Like skipped steps at coarse granularity, uncounted steps don't
+        count towards MAX_STEPS. Granularity has no effect in this mode.
+
+        Args:
+            mode: 'trace' | 'result_only'
+
+        Raises:
+            ValueError: If mode is not one of MODES
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Invalid mode '{mode}'. "
+                f"Expected one of: {', '.join(self.MODES)}"
+            )
+        self.mode = mode
+
+    @property
+    def _records_end_steps_only(self) -> bool:
+        """
+        True when no step between the first and the last is recorded
+        ('summary' granularity or 'result_only' mode), so tracers may
+        fast-forward through the middle of the algorithm.
+        """
+        return self.mode == 'result_only' or self.granularity == 'summary'
 
     @abstractmethod
     def execute(self, input_data: Any) -> dict:
@@ -284,7 +395,57 @@ class AlgorithmTracer(ABC):
             merged into the step data under the 'visualization' key. This allows
             the frontend to access consistent visualization state without requiring
             algorithms to manually include it in every _add_step() call.
+
+            At coarse granularity, skipped steps return before visualization
+            state is computed. In 'result_only' mode every step is skipped.
         """
+        if self.mode == 'result_only':
+            self.fine_step_count += 1
+            return
+
+        if self.granularity != 'fine':
+            self.fine_step_count += 1
+            self._pending_types[step_type] += 1
+            keep = self.step_count == 0 or (
+                self.granularity == 'phase' and step_type in self.PHASE_STEP_TYPES
+            )
+            if not keep:
+                self._pending_step = (step_type, data, description)
+                return
+            data = {**data, 'aggregated': self._take_aggregate()}
+
+        self._record_step(step_type, data, description)
+
+    def _skip_steps(self, step_counts: Dict[str, int]):
+        """
+        Account for steps a tracer fast-forwarded past without emitting them.
+
+        Only valid after the first step while _records_end_steps_only, where
+        none of these steps would have been recorded: they are folded into
+        the next recorded step's 'aggregated' entry exactly as if each had
+        been passed to _add_step(). The tracer must emit at least one more
+        step.
+
+        Args:
+            step_counts: Skipped step count per type, in first-occurrence order
+        """
+        for step_type, count in step_counts.items():
+            if count:
+                self.fine_step_count += count
+                self._pending_types[step_type] += count
+
+    def _take_aggregate(self) -> dict:
+        """Return and reset the counts of fine steps since the last recorded step."""
+        aggregate = {
+            'fine_steps': sum(self._pending_types.values()),
+            'step_types': dict(self._pending_types)
+        }
+        self._pending_step = None
+        self._pending_types = Counter()
+        return aggregate
+
+    def _record_step(self, step_type: str, data: dict, description: str):
+        """Append a TraceStep (enforcing MAX_STEPS and visualization enrichment)."""
         if self.step_count >= self.MAX_STEPS:
             raise RuntimeError(
                 f"Trace generation aborted: Exceeded maximum of {self.MAX_STEPS} steps. "
@@ -298,6 +459,7 @@ class AlgorithmTracer(ABC):
         else:
             enriched_data = data
 
+        self._step_type_index.setdefault(step_type, []).append(self.step_count)
         self.trace.append(TraceStep(
             step=self.step_count,
             type=step_type,
@@ -307,6 +469,26 @@ class AlgorithmTracer(ABC):
         ))
         self.step_count += 1
 
+    def step_indices(self, *step_types: str) -> List[int]:
+        """
+        Indices of the recorded steps of the given types, in trace order.
+
+        The index is kept as steps are recorded, so get_prediction_points()
+        (and other consumers of self.trace) can visit just the candidate
+        steps instead of scanning the whole trace.
+
+        Args:
+            *step_types: Step types to look up (repeated types count once)
+
+        Returns:
+            list: Ascending step indices (with one type, the index's own
+                  list: callers must not modify it)
+        """
+        step_types = tuple(dict.fromkeys(step_types))
+        if len(step_types) == 1:
+            return self._step_type_index.get(step_types[0], [])
+        return list(heapq.merge(*(self._step_type_index.get(t, []) for t in step_types)))
+
     def _serialize_value(self, value):
         """
         Convert Python values to JSON-safe values.
@@ -339,8 +521,24 @@ class AlgorithmTracer(ABC):
         Returns:
             dict: Standardized result with trace and metadata
         """
-        # Generate prediction points after trace is complete
-        prediction_points = self.get_prediction_points()
+        # At coarse granularity the last step may have been skipped
+        if self._pending_step is not None:
+            step_type, data, description = self._pending_step
+            self._record_step(step_type, {**data, 'aggregated': self._take_aggregate()}, description)
+
+        if self.mode == 'result_only':
+            self.metadata['mode'] = self.mode
+            self.metadata['fine_steps'] = self.fine_step_count
+        elif self.granularity != 'fine':
+            self.metadata['granularity'] = self.granularity
+            self.metadata['fine_steps'] = self.fine_step_count
+
+        # Generate prediction points after trace is complete. Tracers read
+        # the step after a question as its answer, so only fine traces qualify.
+        if self.mode == 'trace' and self.granularity == 'fine':
+            prediction_points = self.get_prediction_points()
+        else:
+            prediction_points = []
 
         # Add prediction points to metadata
         self.metadata["prediction_points"] = prediction_points
@@ -348,7 +546,7 @@ class AlgorithmTracer(ABC):
         return {
             "result": algorithm_result,
             "trace": {
-                "steps": [asdict(s) for s in self.trace],
+                "steps": [s.to_dict() for s in self.trace],
                 "total_steps": len(self.trace),
                 "duration": time.time() - self.start_time
             },
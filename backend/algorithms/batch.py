@@ -0,0 +1,175 @@
+# backend/algorithms/batch.py
+"""
+Batch execution of one tracer over many inputs, without Flask.
+
+Offline jobs (answer validation, corpus statistics) run a tracer over
+thousands of inputs. run_batch() runs them in a process pool and streams
+one record per input, in input order, while keeping at most max_in_flight
+inputs submitted at a time, so neither the input iterable nor the results
+are held in memory all at once.
+
+Each record is built in the worker, and only 'trace' builds or pickles
+back the full trace:
+
+- 'trace':       the trace result, as returned by execute()
+- 'result':      {'result': ..., 'metadata': ...}, computed in 'result_only'
+                 mode, so no trace is built (metadata has 'mode' and
+                 'fine_steps'; granularity has no effect)
+- 'step_counts': {'total_steps': int, 'fine_steps': int,
+                  'step_types': {type: count}}
+
+step_types counts every fine step, including those folded into
+'aggregated' entries at 'phase' and 'summary' granularity. 'step_counts'
+therefore runs the tracer at 'summary' (only the first and last steps are
+built) and reports fine_steps as the fine total_steps; only 'phase' needs
+its own run, as its recorded step count depends on where the phase steps
+fall. Counts at 'fine' are not limited by MAX_STEPS.
+
+Inputs the tracer rejects (ValueError) or aborts (RuntimeError, e.g. the
+MAX_STEPS limit) yield {'error': str} instead of stopping the batch, as
+the unified endpoint answers them with a 400.
+
+Example:
+    for record in run_batch('binary-search', inputs, output='result'):
+        ...
+"""
+
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Optional
+
+from .base_tracer import AlgorithmTracer
+from .registry import registry
+
+
+BATCH_OUTPUTS = ('trace', 'result', 'step_counts')
+
+
+def _step_counts(trace_result: dict) -> dict:
+    """Recorded and fine step counts of a trace result."""
+    step_types = Counter()
+    for step in trace_result['trace']['steps']:
+        aggregated = step['data'].get('aggregated')
+        if aggregated is not None:
+            step_types.update(aggregated['step_types'])
+        else:
+            step_types[step['type']] += 1
+    return {
+        'total_steps': trace_result['trace']['total_steps'],
+        'fine_steps': sum(step_types.values()),
+        'step_types': dict(step_types)
+    }
+
+
+def _run_one(algorithm_name: str, input_data: Any, output: str = 'trace',
+             granularity: str = 'fine') -> dict:
+    """
+    Execute one input and build its batch record.
+
+    Args:
+        algorithm_name: Registered algorithm name
+        input_data: Tracer input
+        output: One of BATCH_OUTPUTS
+        granularity: Tracer granularity
+
+    Returns:
+        dict: The record, or {'error': str} if the tracer raised
+              ValueError or RuntimeError
+    """
+    tracer = registry.get(algorithm_name)()
+    try:
+        if output == 'result':
+            # Only the answer is kept: don't build the trace at all
+            tracer.set_mode('result_only')
+        elif output == 'step_counts' and granularity != 'phase':
+            # The counts come from 'aggregated' entries: no need for a fine trace
+            tracer.set_granularity('summary')
+        else:
+            tracer.set_granularity(granularity)
+        trace_result = tracer.execute(input_data)
+    except (ValueError, RuntimeError) as e:
+        return {'error': str(e)}
+
+    if output == 'result':
+        return {'result': trace_result['result'], 'metadata': trace_result['metadata']}
+    if output == 'step_counts':
+        counts = _step_counts(trace_result)
+        if granularity == 'fine':
+            counts['total_steps'] = counts['fine_steps']
+        return counts
+    return trace_result
+
+
+def run_batch(
+    algorithm_name: str,
+    inputs: Iterable[Any],
+    output: str = 'trace',
+    granularity: str = 'fine',
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Run a tracer over every input and yield one record per input, in order.
+
+    Inputs are consumed lazily: at most max_in_flight of them are submitted
+    to the pool and not yet yielded. Closing the generator early cancels
+    inputs that have not started.
+
+    Args:
+        algorithm_name: Registered algorithm name
+        inputs: Tracer inputs (any iterable, e.g. a generator)
+        output: 'trace' | 'result' | 'step_counts' (see module docstring)
+        granularity: 'fine' | 'phase' | 'summary'
+        workers: Worker processes (default: os.cpu_count()); 0 runs every
+                 input in this process, without a pool
+        max_in_flight: Submitted but not yet yielded inputs (default: 2 * workers)
+
+    Yields:
+        dict: The record for each input
+
+    Raises:
+        KeyError: If algorithm_name is not registered
+        ValueError: If output, granularity, workers or max_in_flight is invalid
+    """
+    registry.get(algorithm_name)
+    if output not in BATCH_OUTPUTS:
+        raise ValueError(
+            f"Invalid output '{output}'. "
+            f"Expected one of: {', '.join(BATCH_OUTPUTS)}"
+        )
+    if granularity not in AlgorithmTracer.GRANULARITIES:
+        raise ValueError(
+            f"Invalid granularity '{granularity}'. "
+            f"Expected one of: {', '.join(AlgorithmTracer.GRANULARITIES)}"
+        )
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 0:
+        raise ValueError(f"workers must be at least 0, got {workers}")
+    max_in_flight = max(2 * workers, 1) if max_in_flight is None else max_in_flight
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+    return _stream(algorithm_name, inputs, output, granularity, workers, max_in_flight)
+
+
+def _stream(algorithm_name: str, inputs: Iterable[Any], output: str, granularity: str,
+            workers: int, max_in_flight: int) -> Iterator[dict]:
+    """Generator behind run_batch(), so argument errors raise on the call."""
+    if workers == 0:
+        for input_data in inputs:
+            yield _run_one(algorithm_name, input_data, output, granularity)
+        return
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for input_data in inputs:
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(_run_one, algorithm_name, input_data, output, granularity))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -11,6 +11,7 @@ VERSION: 2.1 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class BinarySearchTracer(AlgorithmTracer):
@@ -25,6 +26,9 @@ class BinarySearchTracer(AlgorithmTracer):
     Prediction points ask: "Will we search left, right, or is target found?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'SEARCH_LEFT', 'SEARCH_RIGHT'})
+    DECISION_STEP_TYPES = frozenset({'SEARCH_LEFT', 'SEARCH_RIGHT', 'TARGET_FOUND', 'TARGET_NOT_FOUND'})
+
     def __init__(self):
         super().__init__()
         self.array = []
@@ -49,14 +53,7 @@ class BinarySearchTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'pointers': {
                 'left': self.left,
                 'right': self.right,
@@ -66,17 +63,15 @@ class BinarySearchTracer(AlgorithmTracer):
             'search_space_size': self.right - self.left + 1 if not self.search_complete else 0
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
-        if self.found_index is not None and index == self.found_index:
-            return 'found'
-        if self.mid is not None and index == self.mid:
-            return 'examining'
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element (later ranges win)."""
+        n = len(self.array)
         if self.search_complete:
-            return 'excluded'
-        if index < self.left or index > self.right:
-            return 'excluded'
-        return 'active_range'
+            ranges = [(0, n, 'excluded')]
+        else:
+            ranges = [(0, self.left, 'excluded'), (self.right + 1, n, 'excluded')]
+        ranges += [point(self.mid, 'examining'), point(self.found_index, 'found')]
+        return paint_states(n, 'active_range', ranges)
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -497,9 +492,10 @@ class BinarySearchTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("CALCULATE_MID"):
+            step = self.trace[i]
             # Prediction opportunity: Right after calculating mid, before decision
-            if step.type == "CALCULATE_MID" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 mid_value = step.data['mid_value']
 
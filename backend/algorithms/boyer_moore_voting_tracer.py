@@ -10,6 +10,7 @@ VERSION: 1.0 - Initial implementation with Backend Checklist v2.2 compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows
 
 
 class BoyerMooreVotingTracer(AlgorithmTracer):
@@ -24,6 +25,9 @@ class BoyerMooreVotingTracer(AlgorithmTracer):
     Prediction points ask: "Will count become 0?" or "Is this the majority element?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'PHASE_TRANSITION'})
+    DECISION_STEP_TYPES = frozenset({'CHANGE_CANDIDATE', 'UPDATE_COUNT'})
+
     def __init__(self):
         super().__init__()
         self.array = []
@@ -49,10 +53,7 @@ class BoyerMooreVotingTracer(AlgorithmTracer):
             return {}
 
         return {
-            "array": [
-                {"index": i, "value": v, "state": self._get_element_state(i)}
-                for i, v in enumerate(self.array)
-            ],
+            "array": element_rows(self.array, self._get_element_states()),
             "candidate": self.candidate,
             "count": self.count,
             "current_index": self.current_index,
@@ -60,27 +61,22 @@ class BoyerMooreVotingTracer(AlgorithmTracer):
             "verification_count": self.verification_count,
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
-        if self.current_index is not None and index == self.current_index:
-            return "examining"
-
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element."""
         if self.phase == "VERIFYING":
-            if self.current_index is not None and index < self.current_index:
-                if self.array[index] == self.candidate:
-                    return "verified"
-                else:
-                    return "rejected"
-            return "neutral"
+            matched, unmatched = "verified", "rejected"
+        else:
+            # FINDING phase
+            matched, unmatched = "supporting", "opposing"
 
-        # FINDING phase
-        if self.current_index is not None and index < self.current_index:
-            if self.array[index] == self.candidate:
-                return "supporting"
-            else:
-                return "opposing"
+        # Elements before current_index are classified against the candidate
+        processed = 0 if self.current_index is None else max(0, min(self.current_index, len(self.array)))
+        states = [matched if v == self.candidate else unmatched for v in self.array[:processed]]
+        states += ["neutral"] * (len(self.array) - processed)
 
-        return "neutral"
+        if self.current_index is not None and 0 <= self.current_index < len(self.array):
+            states[self.current_index] = "examining"
+        return states
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -600,7 +596,8 @@ class BoyerMooreVotingTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("CHECK_CANDIDATE", "PHASE_TRANSITION"):
+            step = self.trace[i]
             # Prediction 1: Before UPDATE_COUNT, predict if count will reach 0
             if step.type == "CHECK_CANDIDATE" and i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
@@ -609,7 +606,7 @@ class BoyerMooreVotingTracer(AlgorithmTracer):
                 if next_step.type in ["UPDATE_COUNT", "CHANGE_CANDIDATE"]:
                     old_count = step.data["old_count"]
                     value = step.data["value"]
-                    candidate = self.trace[i].data["visualization"]["candidate"]
+                    candidate = step.data["visualization"]["candidate"]
 
                     # Only ask if count is 1 (interesting case)
                     if old_count == 1 and candidate is not None:
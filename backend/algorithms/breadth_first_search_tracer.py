@@ -13,8 +13,9 @@ VERSION: 2.1 - Backend Checklist v2.2 Compliance
 """
 
 from typing import Any, List, Dict, Set
-from collections import deque
+from collections import Counter, deque
 from .base_tracer import AlgorithmTracer
+from .graph_compiler import compile_graph
 
 
 class BreadthFirstSearchTracer(AlgorithmTracer):
@@ -31,28 +32,34 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
     Prediction points ask: "Which neighbors will be enqueued next?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'VISIT_NODE'})
+    DECISION_STEP_TYPES = frozenset({'ENQUEUE_NEIGHBORS'})
+
     def __init__(self):
         super().__init__()
         self.nodes = []
         self.edges = []
-        self.adjacency = {}
+        self.graph = None  # CompiledGraph (undirected)
         self.start_node = None
         self.queue = deque()
+        self.queued = Counter()  # Membership index for self.queue
         self.visited = set()
         self.levels = {}
         self.traversal_order = []
         self.current_node = None
 
-    def _build_adjacency_list(self, nodes: List[str], edges: List[tuple]) -> Dict[str, List[str]]:
-        """Build adjacency list from edge list (undirected graph)."""
-        adjacency = {node: [] for node in nodes}
-        for u, v in edges:
-            adjacency[u].append(v)
-            adjacency[v].append(u)
-        # Sort neighbors for consistent ordering
-        for node in adjacency:
-            adjacency[node].sort()
-        return adjacency
+    def _enqueue(self, node: str) -> None:
+        """Append node to the queue and its membership index."""
+        self.queue.append(node)
+        self.queued[node] += 1
+
+    def _dequeue(self) -> str:
+        """Pop the front node from the queue and its membership index."""
+        node = self.queue.popleft()
+        self.queued[node] -= 1
+        if not self.queued[node]:
+            del self.queued[node]
+        return node
 
     def _get_visualization_state(self) -> dict:
         """
@@ -83,7 +90,7 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
                 state = 'visiting'
             elif node in self.visited:
                 state = 'visited'
-            elif node in self.queue:
+            elif node in self.queued:
                 state = 'enqueued'
             else:
                 state = 'unvisited'
@@ -163,8 +170,8 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
                 narrative += f"**Graph Structure (Adjacency List):**\n\n"
                 narrative += "| Node | Neighbors |\n"
                 narrative += "|------|----------|\n"
-                for node in sorted(self.adjacency.keys()):
-                    neighbors = ', '.join(self.adjacency[node]) if self.adjacency[node] else '(none)'
+                for node in sorted(self.graph.nodes):
+                    neighbors = ', '.join(self.graph.sorted_neighbors(node)) or '(none)'
                     narrative += f"| {node} | {neighbors} |\n"
                 narrative += "\n"
 
@@ -415,22 +422,15 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
         if not self.nodes:
             raise ValueError("Graph must contain at least one node")
 
-        if self.start_node not in self.nodes:
-            raise ValueError(f"Start node '{self.start_node}' not found in graph nodes")
+        # Validate edges and build sorted adjacency (shared, cached)
+        self.graph = compile_graph(self.nodes, self.edges)
 
-        # Validate edges
-        for edge in self.edges:
-            if len(edge) != 2:
-                raise ValueError(f"Each edge must be a tuple of 2 nodes, got: {edge}")
-            u, v = edge
-            if u not in self.nodes or v not in self.nodes:
-                raise ValueError(f"Edge ({u}, {v}) contains node not in graph")
-
-        # Build adjacency list
-        self.adjacency = self._build_adjacency_list(self.nodes, self.edges)
+        if self.start_node not in self.graph:
+            raise ValueError(f"Start node '{self.start_node}' not found in graph nodes")
 
         # Initialize BFS data structures
         self.queue = deque()
+        self.queued = Counter()
         self.visited = set()
         self.levels = {}
         self.traversal_order = []
@@ -473,7 +473,7 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
         )
 
         # Enqueue start node at level 0
-        self.queue.append(self.start_node)
+        self._enqueue(self.start_node)
         self.levels[self.start_node] = 0
 
         self._add_step(
@@ -489,7 +489,7 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
         # BFS main loop
         while self.queue:
             # Dequeue node from front
-            self.current_node = self.queue.popleft()
+            self.current_node = self._dequeue()
             current_level = self.levels[self.current_node]
 
             self._add_step(
@@ -518,9 +518,9 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
             )
 
             # Process neighbors
-            neighbors = self.adjacency[self.current_node]
-            already_visited = [n for n in neighbors if n in self.visited or n in self.queue]
-            to_enqueue = [n for n in neighbors if n not in self.visited and n not in self.queue]
+            neighbors = list(self.graph.sorted_neighbors(self.current_node))
+            already_visited = [n for n in neighbors if n in self.visited or n in self.queued]
+            to_enqueue = [n for n in neighbors if n not in self.visited and n not in self.queued]
 
             self._add_step(
                 "ENQUEUE_NEIGHBORS",
@@ -537,7 +537,7 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
 
             # Enqueue unvisited neighbors
             for neighbor in to_enqueue:
-                self.queue.append(neighbor)
+                self._enqueue(neighbor)
                 self.levels[neighbor] = current_level + 1
 
                 self._add_step(
@@ -581,9 +581,10 @@ class BreadthFirstSearchTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("DEQUEUE"):
+            step = self.trace[i]
             # Prediction opportunity: Right after dequeuing, before processing neighbors
-            if step.type == "DEQUEUE" and i + 2 < len(self.trace):
+            if i + 2 < len(self.trace):
                 # Look ahead to find ENQUEUE_NEIGHBORS step
                 next_step = self.trace[i + 1]  # Should be VISIT_NODE
                 neighbors_step = self.trace[i + 2]  # Should be ENQUEUE_NEIGHBORS
@@ -13,6 +13,7 @@ VERSION: 2.2 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class BubbleSortTracer(AlgorithmTracer):
@@ -28,6 +29,9 @@ class BubbleSortTracer(AlgorithmTracer):
     Prediction points ask: "Will these two elements be swapped?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'PASS_COMPLETE'})
+    DECISION_STEP_TYPES = frozenset({'SWAP', 'NO_SWAP'})
+
     def __init__(self):
         super().__init__()
         self.array = []
@@ -51,14 +55,7 @@ class BubbleSortTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'comparing_indices': self.comparing_indices,
             'sorted_boundary': self.sorted_boundary,
             'current_pass': self.current_pass,
@@ -66,19 +63,16 @@ class BubbleSortTracer(AlgorithmTracer):
             'swaps': self.total_swaps
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
-        # Sorted tail (from sorted_boundary to end)
-        if self.sorted_boundary is not None and index >= self.sorted_boundary:
-            return 'sorted'
-        
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element (later ranges win)."""
+        n = len(self.array)
         # Currently comparing
-        if self.comparing_indices is not None:
-            if index in self.comparing_indices:
-                return 'comparing'
-        
+        ranges = [point(index, 'comparing') for index in self.comparing_indices or ()]
+        # Sorted tail (from sorted_boundary to end)
+        if self.sorted_boundary is not None:
+            ranges.append((self.sorted_boundary, n, 'sorted'))
         # Default: unsorted
-        return 'unsorted'
+        return paint_states(n, 'unsorted', ranges)
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -480,9 +474,10 @@ class BubbleSortTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("COMPARE"):
+            step = self.trace[i]
             # Prediction opportunity: Right after COMPARE, before decision
-            if step.type == "COMPARE" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 
                 val_i = step.data['value_i']
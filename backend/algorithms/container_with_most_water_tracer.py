@@ -13,6 +13,7 @@ VERSION: 2.5 - Backend Checklist v2.5 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class ContainerWithMostWaterTracer(AlgorithmTracer):
@@ -28,6 +29,9 @@ class ContainerWithMostWaterTracer(AlgorithmTracer):
     Prediction points ask: "Which pointer should we move next - left or right?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'UPDATE_MAX'})
+    DECISION_STEP_TYPES = frozenset({'MOVE_LEFT', 'MOVE_RIGHT', 'UPDATE_MAX'})
+
     def __init__(self):
         super().__init__()
         self.heights = []
@@ -53,14 +57,7 @@ class ContainerWithMostWaterTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.heights)
-            ],
+            'array': element_rows(self.heights, self._get_element_states()),
             'pointers': {
                 'left': self.left,
                 'right': self.right
@@ -71,20 +68,22 @@ class ContainerWithMostWaterTracer(AlgorithmTracer):
             'container_height': min(self.heights[self.left], self.heights[self.right]) if not self.search_complete and self.left < len(self.heights) and self.right < len(self.heights) else 0
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element (later ranges win)."""
+        n = len(self.heights)
         if self.search_complete:
             # After search completes, highlight max container
+            ranges = []
             if self.max_left is not None and self.max_right is not None:
-                if index == self.max_left or index == self.max_right:
-                    return 'max_container'
-            return 'excluded'
-        
-        if index == self.left or index == self.right:
-            return 'examining'
-        if index < self.left or index > self.right:
-            return 'excluded'
-        return 'active'
+                ranges = [point(self.max_left, 'max_container'), point(self.max_right, 'max_container')]
+            return paint_states(n, 'excluded', ranges)
+
+        return paint_states(n, 'active', [
+            (0, self.left, 'excluded'),
+            (self.right + 1, n, 'excluded'),
+            point(self.left, 'examining'),
+            point(self.right, 'examining'),
+        ])
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -567,9 +566,10 @@ class ContainerWithMostWaterTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("CALCULATE_AREA"):
+            step = self.trace[i]
             # Prediction opportunity: Right after calculating area, before moving pointer
-            if step.type == "CALCULATE_AREA" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 
                 # Skip if next step is UPDATE_MAX (we want the move step)
@@ -19,6 +19,7 @@ Checklist Version: v2.4
 
 from typing import Any, Dict, List, Set
 from .base_tracer import AlgorithmTracer
+from .graph_compiler import compile_graph
 
 
 class DepthFirstSearchTracer(AlgorithmTracer):
@@ -55,17 +56,9 @@ class DepthFirstSearchTracer(AlgorithmTracer):
         if self.start_node not in self.nodes:
             raise ValueError(f"Start node '{self.start_node}' not in nodes list")
 
-        # Build adjacency list (undirected graph)
-        self.graph = {node: [] for node in self.nodes}
-        for u, v in edges:
-            if u not in self.graph or v not in self.graph:
-                raise ValueError(f"Edge ({u}, {v}) contains unknown node")
-            self.graph[u].append(v)
-            self.graph[v].append(u)  # Undirected
-
-        # Sort adjacency lists for deterministic traversal
-        for node in self.graph:
-            self.graph[node].sort()
+        # Build adjacency list (undirected graph), sorted for deterministic traversal
+        compiled = compile_graph(self.nodes, edges)
+        self.graph = {node: list(compiled.sorted_neighbors(node)) for node in compiled.nodes}
 
         # Set required metadata (v2.4 compliance)
         self.metadata = {
@@ -246,9 +239,10 @@ class DepthFirstSearchTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("EXPLORE_NODE"):
+            step = self.trace[i]
             # Prediction: Which neighbor will be visited next?
-            if step.type == "EXPLORE_NODE" and step.data.get("pushed_neighbors"):
+            if step.data.get("pushed_neighbors"):
                 pushed = step.data["pushed_neighbors"]
                 # Pushed in reverse, so last pushed is top of stack (visited next)
                 next_node = pushed[-1]
@@ -12,6 +12,7 @@ VERSION: 2.1 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .graph_compiler import compile_graph
 
 
 class DepthFirstSearchTracer(AlgorithmTracer):
@@ -27,11 +28,14 @@ class DepthFirstSearchTracer(AlgorithmTracer):
     Prediction points ask: "Will this neighbor be visited or skipped?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'VISIT_NODE'})
+    DECISION_STEP_TYPES = frozenset({'VISIT_NODE', 'SKIP_VISITED'})
+
     def __init__(self):
         super().__init__()
         self.nodes = []
         self.edges = []
-        self.adjacency = {}
+        self.graph = None  # CompiledGraph (undirected)
         self.start_node = None
         self.stack = []
         self.visited = set()
@@ -137,10 +141,10 @@ class DepthFirstSearchTracer(AlgorithmTracer):
             # Type-specific details
             if step_type == "INITIAL_STATE":
                 narrative += f"**Graph Structure (Adjacency List):**\n"
-                for node in sorted(self.adjacency.keys()):
-                    neighbors = self.adjacency[node]
+                for node in sorted(self.graph.nodes):
+                    neighbors = self.graph.sorted_neighbors(node)
                     if neighbors:
-                        narrative += f"- {node}: [{', '.join(sorted(neighbors))}]\n"
+                        narrative += f"- {node}: [{', '.join(neighbors)}]\n"
                     else:
                         narrative += f"- {node}: []\n"
                 narrative += "\n"
@@ -336,17 +340,8 @@ class DepthFirstSearchTracer(AlgorithmTracer):
         if self.start_node not in self.nodes:
             raise ValueError(f"Start node '{self.start_node}' not in graph nodes")
 
-        # Build adjacency list (undirected graph)
-        self.adjacency = {node: [] for node in self.nodes}
-        for from_node, to_node in self.edges:
-            if from_node not in self.adjacency:
-                raise ValueError(f"Edge references unknown node: {from_node}")
-            if to_node not in self.adjacency:
-                raise ValueError(f"Edge references unknown node: {to_node}")
-            
-            # Undirected: add both directions
-            self.adjacency[from_node].append(to_node)
-            self.adjacency[to_node].append(from_node)
+        # Validate edges and build undirected adjacency, neighbors pre-sorted
+        self.graph = compile_graph(self.nodes, self.edges)
 
         # Initialize traversal state
         self.stack = []
@@ -420,7 +415,7 @@ class DepthFirstSearchTracer(AlgorithmTracer):
             self.visited.add(self.current_node)
             self.traversal_order.append(self.current_node)
             
-            neighbors = sorted(self.adjacency[self.current_node])
+            neighbors = list(self.graph.sorted_neighbors(self.current_node))
             
             self._add_step(
                 "VISIT_NODE",
@@ -488,9 +483,10 @@ class DepthFirstSearchTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("VISIT_NODE"):
+            step = self.trace[i]
             # Prediction opportunity: When we encounter a neighbor, before decision
-            if step.type == "VISIT_NODE" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 node = step.data['node']
                 neighbors = step.data['neighbors']
                 
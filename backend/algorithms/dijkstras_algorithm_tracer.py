@@ -11,8 +11,11 @@ VERSION: 2.5 - Backend Checklist v2.5 Compliance
 """
 
 from typing import Any, List, Dict, Set, Tuple
+import bisect
 import heapq
 from .base_tracer import AlgorithmTracer
+from .graph_compiler import compile_graph
+from .indexed_heap import IndexedMinHeap
 
 
 class DijkstrasAlgorithmTracer(AlgorithmTracer):
@@ -29,24 +32,118 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
     Prediction points ask: "Which node will be selected next from priority queue?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'VISIT_NODE'})
+    DECISION_STEP_TYPES = frozenset({'RELAX_EDGE', 'UPDATE_DISTANCE'})
+
     def __init__(self):
         super().__init__()
         self.nodes = []
         self.edges = []
-        self.adjacency = {}  # node -> [(neighbor, weight), ...]
+        # CompiledGraph (undirected, weighted): dense node ids + CSR adjacency
+        self.graph = None
         self.start_node = None
         self.distances = {}
         self.previous = {}
         self.visited = set()
-        self.priority_queue = []
+        self.priority_queue = IndexedMinHeap(0)  # (distance, node) priorities by node id
+        self._dist = []  # Tentative distance by node id
+        self._finalized = bytearray()  # 1 once a node id is visited
         self.current_node = None
+        self._reset_views()
+
+    # Visualization state is maintained incrementally: mutations go through the
+    # helpers below, which mark the touched nodes dirty (their node view and
+    # incident edge views are rebuilt on the next snapshot) and drop the cached
+    # snapshot pieces they invalidate. Unchanged pieces are shared between steps.
+
+    def _reset_views(self) -> None:
+        """Reset incremental view state for self.nodes / self.edges."""
+        self._node_positions = {}
+        for i, node in enumerate(self.nodes):
+            self._node_positions.setdefault(node, []).append(i)
+        self._incident_edges = {node: [] for node in self._node_positions}
+        for j, (u, v, _) in enumerate(self.edges):
+            for node in {u, v}:
+                self._incident_edges.setdefault(node, []).append(j)
+        self._node_views = [None] * len(self.nodes)
+        self._edge_views = [None] * len(self.edges)
+        self._dirty_nodes = set(self._node_positions) | set(self._incident_edges)
+        self._pq_keys = []   # Sorted (distance, node) pairs mirroring the heap
+        self._pq_views = []  # Visualization dicts parallel to _pq_keys
+        self._distance_view = {}
+        self._view_cache = {}
+
+    def _set_current(self, node: str) -> None:
+        """Change the node being examined."""
+        self._dirty_nodes.update((self.current_node, node))
+        self.current_node = node
+
+    def _visit(self, node: str) -> None:
+        """Mark node as visited (finalized)."""
+        self.visited.add(node)
+        self._finalized[self.graph.node_ids[node]] = 1
+        self._dirty_nodes.add(node)
+        self._view_cache.pop('visited_set', None)
+
+    def _set_distance(self, node: str, distance, via: str = None) -> None:
+        """Record a tentative distance (and predecessor, if any) for node."""
+        self.distances[node] = distance
+        self._dist[self.graph.node_ids[node]] = distance
+        self._distance_view[node] = self._serialize_value(distance)
+        self._view_cache.pop('distance_map', None)
+        if via is not None:
+            self.previous[node] = via
+            self._view_cache.pop('previous_map', None)
+        self._dirty_nodes.add(node)
+
+    def _push(self, distance, node: str) -> None:
+        """Queue node at distance (decrease-key if already queued) and update the sorted view."""
+        node_id = self.graph.node_ids[node]
+        if node_id in self.priority_queue:
+            position = bisect.bisect_left(self._pq_keys, self.priority_queue.priority(node_id))
+            del self._pq_keys[position]
+            del self._pq_views[position]
+        self.priority_queue.push_or_decrease(node_id, (distance, node))
+        position = bisect.bisect_right(self._pq_keys, (distance, node))
+        self._pq_keys.insert(position, (distance, node))
+        self._pq_views.insert(position, {'distance': distance, 'node': node})
+        self._view_cache.pop('priority_queue', None)
+
+    def _pop(self) -> Tuple[Any, str]:
+        """Pop the minimum (distance, node) from the heap and the sorted queue view."""
+        entry, _ = self.priority_queue.pop()
+        del self._pq_keys[0]
+        del self._pq_views[0]
+        self._view_cache.pop('priority_queue', None)
+        return entry
+
+    def _node_view(self, node: str) -> dict:
+        """Build the visualization dict for one node."""
+        state = 'visited' if node in self.visited else ('examining' if node == self.current_node else 'unvisited')
+        return {
+            'id': node,
+            'state': state,
+            'distance': self.distances.get(node, float('inf')),
+            'previous': self.previous.get(node, None)
+        }
 
-    def _build_adjacency_list(self, nodes: List[str], edges: List[Tuple[str, str, int]]):
-        """Build adjacency list from edge list."""
-        self.adjacency = {node: [] for node in nodes}
-        for u, v, weight in edges:
-            self.adjacency[u].append((v, weight))
-            self.adjacency[v].append((u, weight))  # Undirected graph
+    def _edge_view(self, index: int) -> dict:
+        """Build the visualization dict for one edge."""
+        u, v, weight = self.edges[index]
+        # Edge is relaxed if it's part of the shortest path tree
+        state = 'unexplored'
+        if u in self.visited and v in self.visited:
+            # Check if this edge is in the shortest path tree
+            if self.previous.get(v) == u or self.previous.get(u) == v:
+                state = 'relaxed'
+        elif self.current_node in [u, v]:
+            state = 'examining'
+        return {
+            'from': u,
+            'to': v,
+            'weight': weight,
+            'state': state
+        }
 
     def _get_visualization_state(self) -> dict:
         """
@@ -65,48 +162,41 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
         if not self.nodes:
             return {}
 
-        # Build node visualization
-        nodes_viz = []
-        for node in self.nodes:
-            state = 'visited' if node in self.visited else ('examining' if node == self.current_node else 'unvisited')
-            nodes_viz.append({
-                'id': node,
-                'state': state,
-                'distance': self.distances.get(node, float('inf')),
-                'previous': self.previous.get(node, None)
-            })
-
-        # Build edge visualization
-        edges_viz = []
-        for u, v, weight in self.edges:
-            # Edge is relaxed if it's part of the shortest path tree
-            state = 'unexplored'
-            if u in self.visited and v in self.visited:
-                # Check if this edge is in the shortest path tree
-                if self.previous.get(v) == u or self.previous.get(u) == v:
-                    state = 'relaxed'
-                else:
-                    state = 'unexplored'
-            elif self.current_node in [u, v]:
-                state = 'examining'
-            
-            edges_viz.append({
-                'from': u,
-                'to': v,
-                'weight': weight,
-                'state': state
-            })
-
-        # Priority queue visualization (show as list of (distance, node) pairs)
-        pq_viz = [{'distance': dist, 'node': node} for dist, node in sorted(self.priority_queue)]
+        cache = self._view_cache
+        if self._dirty_nodes:
+            dirty_edges = set()
+            for node in self._dirty_nodes:
+                for i in self._node_positions.get(node, ()):
+                    self._node_views[i] = self._node_view(node)
+                dirty_edges.update(self._incident_edges.get(node, ()))
+            for j in dirty_edges:
+                self._edge_views[j] = self._edge_view(j)
+            self._dirty_nodes.clear()
+            cache.pop('nodes', None)
+            if dirty_edges:
+                cache.pop('edges', None)
+
+        if 'nodes' not in cache:
+            cache['nodes'] = list(self._node_views)
+        if 'edges' not in cache:
+            cache['edges'] = list(self._edge_views)
+        # Priority queue visualization (sorted list of (distance, node) pairs)
+        if 'priority_queue' not in cache:
+            cache['priority_queue'] = list(self._pq_views)
+        if 'distance_map' not in cache:
+            cache['distance_map'] = dict(self._distance_view)
+        if 'previous_map' not in cache:
+            cache['previous_map'] = dict(self.previous)
+        if 'visited_set' not in cache:
+            cache['visited_set'] = list(self.visited)
 
         return {
-            'nodes': nodes_viz,
-            'edges': edges_viz,
-            'priority_queue': pq_viz,
-            'distance_map': {node: self._serialize_value(dist) for node, dist in self.distances.items()},
-            'previous_map': dict(self.previous),
-            'visited_set': list(self.visited),
+            'nodes': cache['nodes'],
+            'edges': cache['edges'],
+            'priority_queue': cache['priority_queue'],
+            'distance_map': cache['distance_map'],
+            'previous_map': cache['previous_map'],
+            'visited_set': cache['visited_set'],
             'current_node': self.current_node
         }
 
@@ -150,8 +240,8 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
                 narrative += "**Purpose:** Initialize distance tracking for shortest path computation.\n\n"
                 
                 narrative += "**Graph Structure (Adjacency List):**\n"
-                for node in sorted(self.adjacency.keys()):
-                    neighbors = self.adjacency[node]
+                for node in sorted(self.graph.nodes):
+                    neighbors = self.graph.weighted_neighbors(node)
                     if neighbors:
                         neighbor_str = ", ".join([f"{n} (weight: {w})" for n, w in sorted(neighbors)])
                         narrative += f"- **{node}**: [{neighbor_str}]\n"
@@ -390,21 +480,28 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
         if self.start_node not in self.nodes:
             raise ValueError(f"Start node '{self.start_node}' not in nodes list")
 
+        # Validate edges and build dense ids + CSR adjacency (shared, cached)
+        self.graph = compile_graph(self.nodes, self.edges, weighted=True)
+
         # Validate non-negative weights
-        for u, v, weight in self.edges:
+        for u, v, weight in self.graph.edges:
             if weight < 0:
                 raise ValueError(f"Negative weight {weight} on edge ({u}, {v}). Dijkstra's algorithm requires non-negative weights.")
 
-        # Build adjacency list
-        self._build_adjacency_list(self.nodes, self.edges)
-
         # Initialize algorithm state
-        self.distances = {node: float('inf') for node in self.nodes}
-        self.distances[self.start_node] = 0
+        self.distances = {}
         self.previous = {}
         self.visited = set()
-        self.priority_queue = [(0, self.start_node)]
+        node_count = len(self.graph.nodes)
+        self.priority_queue = IndexedMinHeap(node_count)
+        self._dist = [float('inf')] * node_count
+        self._finalized = bytearray(node_count)
         self.current_node = None
+        self._reset_views()
+        for node in self.nodes:
+            self._set_distance(node, float('inf'))
+        self._set_distance(self.start_node, 0)
+        self._push(0, self.start_node)
 
         # Set metadata for frontend
         self.metadata = {
@@ -435,19 +532,16 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
         # Main algorithm loop
         while self.priority_queue:
             # Select node with minimum distance
-            current_dist, current_node = heapq.heappop(self.priority_queue)
-
-            # Skip if already visited (duplicate in queue)
-            if current_node in self.visited:
-                continue
+            # (decrease-key keeps one entry per node, so no stale entries to skip)
+            current_dist, current_node = self._pop()
 
-            self.current_node = current_node
+            self._set_current(current_node)
 
             # Mark as visited BEFORE recording step so visualization state is correct
-            self.visited.add(current_node)
+            self._visit(current_node)
 
             # Record selection
-            pq_snapshot = list(self.priority_queue)
+            pq_snapshot = [entry for entry, _ in self.priority_queue]
             self._add_step(
                 "SELECT_MIN_DIST",
                 {
@@ -458,8 +552,11 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
                 f"📍 Select node '{current_node}' with minimum distance {current_dist} from priority queue"
             )
 
-            # Get neighbors
-            neighbors = [n for n, w in self.adjacency[current_node]]
+            # Get neighbors (CSR slice of the current node)
+            graph = self.graph
+            current_id = graph.node_ids[current_node]
+            start, end = graph.offsets[current_id], graph.offsets[current_id + 1]
+            neighbors = [graph.nodes[target] for target in graph.targets[start:end]]
 
             self._add_step(
                 "VISIT_NODE",
@@ -472,9 +569,13 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
             )
 
             # Process each neighbor
-            for neighbor, edge_weight in self.adjacency[current_node]:
+            for k in range(start, end):
+                neighbor_id = graph.targets[k]
+                neighbor = graph.nodes[neighbor_id]
+                edge_weight = graph.weights[k]
+
                 # Check if neighbor already visited
-                neighbor_visited = neighbor in self.visited
+                neighbor_visited = self._finalized[neighbor_id] == 1
 
                 self._add_step(
                     "CHECK_NEIGHBOR",
@@ -492,7 +593,7 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
 
                 # Calculate new distance through current node
                 new_distance = current_dist + edge_weight
-                old_distance = self.distances[neighbor]
+                old_distance = self._dist[neighbor_id]
 
                 # Edge relaxation
                 improved = new_distance < old_distance
@@ -513,9 +614,8 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
 
                 if improved:
                     # Update distance and previous
-                    self.distances[neighbor] = new_distance
-                    self.previous[neighbor] = current_node
-                    heapq.heappush(self.priority_queue, (new_distance, neighbor))
+                    self._set_distance(neighbor, new_distance, via=current_node)
+                    self._push(new_distance, neighbor)
 
                     self._add_step(
                         "UPDATE_DISTANCE",
@@ -559,9 +659,10 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("SELECT_MIN_DIST"):
+            step = self.trace[i]
             # Prediction opportunity: Before SELECT_MIN_DIST step
-            if step.type == "SELECT_MIN_DIST" and i > 0:
+            if i > 0:
                 # Get previous step to see what nodes are available
                 prev_step = self.trace[i - 1]
                 
@@ -576,7 +677,7 @@ class DijkstrasAlgorithmTracer(AlgorithmTracer):
                 choices = []
                 seen_nodes = set()
                 
-                for dist, node in sorted(pq_before)[:3]:
+                for dist, node in heapq.nsmallest(3, pq_before):
                     if node not in seen_nodes:
                         choices.append({
                             'id': node,
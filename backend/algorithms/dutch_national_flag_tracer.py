@@ -11,6 +11,7 @@ VERSION: 2.1 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class DutchNationalFlagTracer(AlgorithmTracer):
@@ -25,6 +26,9 @@ class DutchNationalFlagTracer(AlgorithmTracer):
     Prediction points ask: "What action will we take for this value?"
     """
 
+    DECISION_STEP_TYPES = frozenset({'SWAP_LOW', 'SWAP_HIGH', 'ADVANCE_MID'})
+    COLOR_MAP = {0: 'red', 1: 'white', 2: 'blue'}
+
     def __init__(self):
         super().__init__()
         self.array = []
@@ -48,15 +52,11 @@ class DutchNationalFlagTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i),
-                    'color': self._get_color_for_value(v)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(
+                self.array,
+                self._get_element_states(),
+                color=[self.COLOR_MAP.get(v, 'gray') for v in self.array]
+            ),
             'pointers': {
                 'low': self.low,
                 'mid': self.mid,
@@ -70,23 +70,20 @@ class DutchNationalFlagTracer(AlgorithmTracer):
             }
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
-        if index == self.mid and index <= self.high:
-            return 'examining'
-        elif index < self.low:
-            return 'sorted_low'
-        elif index < self.mid:
-            return 'sorted_mid'
-        elif index > self.high:
-            return 'sorted_high'
-        else:
-            return 'unsorted'
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element (later ranges win)."""
+        ranges = [
+            (self.high + 1, len(self.array), 'sorted_high'),
+            (0, self.mid, 'sorted_mid'),
+            (0, self.low, 'sorted_low'),
+        ]
+        if self.mid <= self.high:
+            ranges.append(point(self.mid, 'examining'))
+        return paint_states(len(self.array), 'unsorted', ranges)
 
     def _get_color_for_value(self, value: int) -> str:
         """Map value to color name."""
-        color_map = {0: 'red', 1: 'white', 2: 'blue'}
-        return color_map.get(value, 'gray')
+        return self.COLOR_MAP.get(value, 'gray')
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -578,9 +575,10 @@ class DutchNationalFlagTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("CHECK_VALUE"):
+            step = self.trace[i]
             # Prediction opportunity: Right after checking value, before action
-            if step.type == "CHECK_VALUE" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 mid_value = step.data['mid_value']
 
@@ -0,0 +1,182 @@
+# backend/algorithms/graph_compiler.py
+"""
+Shared graph-input preprocessing for graph tracers.
+
+compile_graph() validates a 'nodes'/'edges' input once and returns an
+immutable CompiledGraph with dense node ids, CSR adjacency arrays and
+neighbor lists in both input order and sorted order. Compiled graphs are
+cached by input, so repeated requests for the same graph (e.g. example
+inputs) skip validation and sorting entirely.
+
+Tracer-specific checks (empty node list, start node, weight sign, size
+limits) stay in the tracers, which word those errors for their algorithm.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence, Tuple
+
+
+GRAPH_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class CompiledGraph:
+    """
+    Validated, immutable graph.
+
+    Nodes are numbered 0..V-1 in first-appearance order (duplicates in the
+    input node list are collapsed). Neighbors of node id i are
+    targets[offsets[i]:offsets[i + 1]] (weights alongside when weighted), in
+    edge input order; undirected edges appear in both endpoints' lists.
+    """
+    nodes: Tuple[str, ...]
+    node_ids: Mapping[str, int]
+    edges: Tuple[tuple, ...]
+    directed: bool
+    weighted: bool
+    offsets: Tuple[int, ...]
+    targets: Tuple[int, ...]
+    weights: Tuple[Any, ...]
+    _neighbor_names: Tuple[Tuple[str, ...], ...] = field(repr=False)
+    _sorted_neighbor_names: Tuple[Tuple[str, ...], ...] = field(repr=False)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.node_ids
+
+    def neighbors(self, node: str) -> Tuple[str, ...]:
+        """Neighbors of node in edge input order."""
+        return self._neighbor_names[self.node_ids[node]]
+
+    def sorted_neighbors(self, node: str) -> Tuple[str, ...]:
+        """Neighbors of node in sorted order (sorted once at compile time)."""
+        return self._sorted_neighbor_names[self.node_ids[node]]
+
+    def weighted_neighbors(self, node: str) -> Tuple[Tuple[str, Any], ...]:
+        """(neighbor, weight) pairs of node in edge input order."""
+        node_id = self.node_ids[node]
+        start, end = self.offsets[node_id], self.offsets[node_id + 1]
+        return tuple(
+            (self.nodes[target], weight)
+            for target, weight in zip(self.targets[start:end], self.weights[start:end])
+        )
+
+
+def _compile(nodes: Tuple[str, ...], edges: Tuple[Any, ...], directed: bool, weighted: bool) -> CompiledGraph:
+    """Validate and build a CompiledGraph (uncached)."""
+    node_ids = {}
+    for node in nodes:
+        node_ids.setdefault(node, len(node_ids))
+    unique_nodes = tuple(node_ids)
+    arity = 3 if weighted else 2
+
+    normalized = []
+    degree = [0] * len(unique_nodes)
+    for edge in edges:
+        if not isinstance(edge, (list, tuple)) or len(edge) != arity:
+            expected = '[from, to, weight]' if weighted else '[from, to]'
+            raise ValueError(f"Invalid edge format: {edge}; each edge must be {expected}")
+        u, v = edge[0], edge[1]
+        for node in (u, v):
+            if node not in node_ids:
+                raise ValueError(f"Edge references unknown node: {node} (not in graph nodes)")
+        if weighted:
+            weight = edge[2]
+            if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+                raise ValueError(f"Invalid weight {weight!r} on edge ({u}, {v}); weights must be numbers")
+        normalized.append(tuple(edge))
+        degree[node_ids[u]] += 1
+        if not directed:
+            degree[node_ids[v]] += 1
+
+    offsets = [0]
+    for count in degree:
+        offsets.append(offsets[-1] + count)
+    targets = [0] * offsets[-1]
+    weights = [None] * offsets[-1]
+
+    # Fill in edge order so each neighbor list keeps input order
+    cursor = offsets[:-1]
+    for edge in normalized:
+        u, v = node_ids[edge[0]], node_ids[edge[1]]
+        directions = ((u, v),) if directed else ((u, v), (v, u))
+        for source, target in directions:
+            targets[cursor[source]] = target
+            weights[cursor[source]] = edge[2] if weighted else None
+            cursor[source] += 1
+
+    neighbor_names = tuple(
+        tuple(unique_nodes[target] for target in targets[offsets[i]:offsets[i + 1]])
+        for i in range(len(unique_nodes))
+    )
+
+    return CompiledGraph(
+        nodes=unique_nodes,
+        node_ids=MappingProxyType(node_ids),
+        edges=tuple(normalized),
+        directed=directed,
+        weighted=weighted,
+        offsets=tuple(offsets),
+        targets=tuple(targets),
+        weights=tuple(weights) if weighted else (),
+        _neighbor_names=neighbor_names,
+        _sorted_neighbor_names=tuple(_sorted_names(names) for names in neighbor_names)
+    )
+
+
+def _sorted_names(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Sort node names; mixed-type ids fall back to (type name, str) order."""
+    try:
+        return tuple(sorted(names))
+    except TypeError:
+        return tuple(sorted(names, key=lambda name: (type(name).__name__, str(name))))
+
+
+@lru_cache(maxsize=GRAPH_CACHE_SIZE)
+def _compile_cached(nodes, edges, directed, weighted, value_types) -> CompiledGraph:
+    """
+    Cached _compile. value_types keeps equal-but-differently-typed values
+    (1, 1.0, True) from sharing an entry.
+    """
+    return _compile(nodes, edges, directed, weighted)
+
+
+def compile_graph(
+    nodes: Sequence[str],
+    edges: Sequence[Sequence[Any]],
+    directed: bool = False,
+    weighted: bool = False
+) -> CompiledGraph:
+    """
+    Validate a graph input and return its (possibly cached) CompiledGraph.
+
+    Args:
+        nodes: Node identifiers
+        edges: [from, to] pairs, or [from, to, weight] triples if weighted
+        directed: Treat edges as one-way (from -> to)
+        weighted: Edges carry a numeric weight
+
+    Returns:
+        CompiledGraph: Immutable graph; identical inputs return the same object
+
+    Raises:
+        ValueError: If an edge is malformed, references a node not in
+                    'nodes', or has a non-numeric weight
+    """
+    nodes = tuple(nodes)
+    edges = tuple(tuple(edge) if isinstance(edge, (list, tuple)) else edge for edge in edges)
+    value_types = (
+        tuple(type(node) for node in nodes),
+        tuple(tuple(map(type, edge)) if isinstance(edge, tuple) else type(edge) for edge in edges)
+    )
+    try:
+        return _compile_cached(nodes, edges, directed, weighted, value_types)
+    except TypeError:
+        # Unhashable node or weight values can't be cached; validate directly
+        return _compile(nodes, edges, directed, weighted)
+
+
+def clear_graph_cache() -> None:
+    """Drop all cached compiled graphs."""
+    _compile_cached.cache_clear()
@@ -0,0 +1,130 @@
+# backend/algorithms/indexed_heap.py
+"""
+Indexed binary min-heap with decrease-key.
+
+Items are dense integer ids in range(capacity). Each id appears at most
+once, so a priority queue over V nodes never holds more than V entries and
+never contains stale duplicates (unlike the push-and-skip heapq idiom).
+Priorities can be any mutually comparable values; tuples such as
+(distance, name) give deterministic tie-breaking.
+"""
+
+from typing import Any, Iterator, List, Tuple
+
+
+class IndexedMinHeap:
+    """
+    Binary min-heap over item ids with O(log n) push, pop and decrease_key.
+
+    The heap array stores item ids; self._priority[item] holds the priority
+    and self._position[item] the item's slot in the array (-1 when absent).
+    """
+
+    def __init__(self, capacity: int):
+        self._heap: List[int] = []
+        self._position: List[int] = [-1] * capacity
+        self._priority: List[Any] = [None] * capacity
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: int) -> bool:
+        return self._position[item] != -1
+
+    def __iter__(self) -> Iterator[Tuple[Any, int]]:
+        """Yield (priority, item) pairs in heap-array order."""
+        for item in self._heap:
+            yield self._priority[item], item
+
+    def priority(self, item: int) -> Any:
+        """Return the priority of an item in the heap."""
+        if item not in self:
+            raise KeyError(item)
+        return self._priority[item]
+
+    def push(self, item: int, priority: Any) -> None:
+        """
+        Insert an item that is not already in the heap.
+
+        Raises:
+            KeyError: If the item is already in the heap
+        """
+        if item in self:
+            raise KeyError(f"Item {item} is already in the heap")
+        self._priority[item] = priority
+        self._position[item] = len(self._heap)
+        self._heap.append(item)
+        self._sift_up(len(self._heap) - 1)
+
+    def decrease_key(self, item: int, priority: Any) -> None:
+        """
+        Lower the priority of an item already in the heap.
+
+        Raises:
+            KeyError: If the item is not in the heap
+            ValueError: If priority is greater than the current priority
+        """
+        if item not in self:
+            raise KeyError(item)
+        if self._priority[item] < priority:
+            raise ValueError(f"New priority {priority!r} is greater than current {self._priority[item]!r}")
+        self._priority[item] = priority
+        self._sift_up(self._position[item])
+
+    def push_or_decrease(self, item: int, priority: Any) -> None:
+        """Insert the item, or lower its priority if it is already queued."""
+        if item in self:
+            self.decrease_key(item, priority)
+        else:
+            self.push(item, priority)
+
+    def peek(self) -> Tuple[Any, int]:
+        """Return (priority, item) with the smallest priority without removing it."""
+        if not self._heap:
+            raise IndexError("peek from empty heap")
+        item = self._heap[0]
+        return self._priority[item], item
+
+    def pop(self) -> Tuple[Any, int]:
+        """Remove and return (priority, item) with the smallest priority."""
+        if not self._heap:
+            raise IndexError("pop from empty heap")
+        top = self._heap[0]
+        last = self._heap.pop()
+        if self._heap:
+            self._heap[0] = last
+            self._position[last] = 0
+            self._sift_down(0)
+        self._position[top] = -1
+        return self._priority[top], top
+
+    def _sift_up(self, index: int) -> None:
+        heap, priority, position = self._heap, self._priority, self._position
+        item = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not priority[item] < priority[heap[parent]]:
+                break
+            heap[index] = heap[parent]
+            position[heap[index]] = index
+            index = parent
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, index: int) -> None:
+        heap, priority, position = self._heap, self._priority, self._position
+        size = len(heap)
+        item = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and priority[heap[child + 1]] < priority[heap[child]]:
+                child += 1
+            if not priority[heap[child]] < priority[item]:
+                break
+            heap[index] = heap[child]
+            position[heap[index]] = index
+            index = child
+        heap[index] = item
+        position[item] = index
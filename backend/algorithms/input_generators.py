@@ -0,0 +1,273 @@
+# backend/algorithms/input_generators.py
+"""
+Synthetic input generators for scale and fuzz testing.
+
+Every registered algorithm has a generator that produces a valid random
+input of a requested size. Generation is seeded, so the same
+(algorithm, size, seed) triple always yields the same input. Arrays and
+intervals take O(size) time (sorted arrays are built from increments, not
+sorted); graph edge lists take O(E log E), because their edge sets are
+sorted to keep the output independent of string hashing. Benchmarks and
+property tests can request large inputs cheaply from one place.
+
+Usage:
+    from algorithms.input_generators import generate_input
+
+    input_data = generate_input('dijkstras-algorithm', size=500, seed=7)
+    tracer = registry.get('dijkstras-algorithm')()
+    tracer.execute(input_data)
+
+'size' is the length of the primary collection: array length, number of
+intervals, or number of graph nodes.
+"""
+
+import random
+from typing import Any, Callable, Dict, List
+
+
+INTERVAL_COLORS = ['blue', 'green', 'amber', 'purple', 'red', 'orange']
+
+
+# =============================================================================
+# Building Blocks
+# =============================================================================
+
+def random_array(size: int, rng: random.Random, low: int = -100, high: int = 100) -> List[int]:
+    """Return 'size' integers drawn uniformly from [low, high]."""
+    return [rng.randint(low, high) for _ in range(size)]
+
+
+def sorted_array(size: int, rng: random.Random, max_step: int = 5, start: int = 0) -> List[int]:
+    """
+    Return a non-decreasing array built from random increments.
+
+    Increments of 0 produce duplicates; see sorted_unique_array() for
+    strictly increasing output.
+    """
+    values = []
+    current = start
+    for _ in range(size):
+        current += rng.randint(0, max_step)
+        values.append(current)
+    return values
+
+
+def sorted_unique_array(size: int, rng: random.Random, max_step: int = 5, start: int = 0) -> List[int]:
+    """Return a strictly increasing array built from random increments."""
+    values = []
+    current = start
+    for _ in range(size):
+        current += rng.randint(1, max_step)
+        values.append(current)
+    return values
+
+
+def node_names(size: int) -> List[str]:
+    """Return node identifiers: letters for small graphs, N<i> otherwise."""
+    if size <= 26:
+        return [chr(ord('A') + i) for i in range(size)]
+    return [f"N{i}" for i in range(size)]
+
+
+def random_dag(size: int, rng: random.Random, extra_edges: int = None) -> Dict[str, Any]:
+    """
+    Return a random directed acyclic graph.
+
+    Nodes are shuffled into a hidden topological order and every edge points
+    forward in that order, so the graph is acyclic by construction.
+
+    Returns:
+        dict: {'nodes': [...], 'edges': [[from, to], ...]}
+    """
+    nodes = node_names(size)
+    order = nodes[:]
+    rng.shuffle(order)
+
+    if extra_edges is None:
+        extra_edges = size
+    edges = set()
+    for _ in range(extra_edges if size > 1 else 0):
+        i, j = sorted(rng.sample(range(size), 2))
+        edges.add((order[i], order[j]))
+
+    return {'nodes': nodes, 'edges': [[u, v] for u, v in sorted(edges)]}
+
+
+def random_connected_graph(
+    size: int,
+    rng: random.Random,
+    extra_edges: int = None,
+    weighted: bool = False,
+    max_weight: int = 20
+) -> Dict[str, Any]:
+    """
+    Return a random connected undirected graph.
+
+    A random spanning tree (each node links to an earlier node) guarantees
+    connectivity; 'extra_edges' random chords are added on top.
+
+    Returns:
+        dict: {'nodes': [...], 'edges': [[u, v], ...] or [[u, v, w], ...]}
+    """
+    nodes = node_names(size)
+    pairs = set()
+    for i in range(1, size):
+        pairs.add((nodes[rng.randrange(i)], nodes[i]))
+
+    if extra_edges is None:
+        extra_edges = size // 2
+    for _ in range(extra_edges if size > 1 else 0):
+        i, j = sorted(rng.sample(range(size), 2))
+        pairs.add((nodes[i], nodes[j]))
+
+    if weighted:
+        edges = [[u, v, rng.randint(1, max_weight)] for u, v in sorted(pairs)]
+    else:
+        edges = [[u, v] for u, v in sorted(pairs)]
+    return {'nodes': nodes, 'edges': edges}
+
+
+def random_interval_pairs(size: int, rng: random.Random, span: int = None, max_length: int = None) -> List[List[int]]:
+    """Return 'size' [start, end] pairs with start < end."""
+    span = span or max(size * 10, 10)
+    max_length = max_length or max(span // 5, 2)
+    pairs = []
+    for _ in range(size):
+        start = rng.randrange(span)
+        pairs.append([start, start + rng.randint(1, max_length)])
+    return pairs
+
+
+# =============================================================================
+# Per-Algorithm Generators
+# =============================================================================
+
+def _binary_search(size: int, rng: random.Random) -> dict:
+    array = sorted_unique_array(size, rng)
+    # Half of the searches hit an existing element, half miss
+    target = rng.choice(array) if rng.random() < 0.5 else array[-1] + 1
+    return {'array': array, 'target': target}
+
+
+def _two_pointer(size: int, rng: random.Random) -> dict:
+    return {'array': sorted_array(size, rng, max_step=2)}
+
+
+def _sliding_window(size: int, rng: random.Random) -> dict:
+    return {'array': random_array(size, rng, 0, 50), 'k': rng.randint(1, max(1, size // 4))}
+
+
+def _interval_coverage(size: int, rng: random.Random) -> dict:
+    return {
+        'intervals': [
+            {'id': i + 1, 'start': start, 'end': end, 'color': INTERVAL_COLORS[i % len(INTERVAL_COLORS)]}
+            for i, (start, end) in enumerate(random_interval_pairs(size, rng))
+        ]
+    }
+
+
+def _intervals(size: int, rng: random.Random) -> dict:
+    return {'intervals': random_interval_pairs(size, rng)}
+
+
+def _graph_traversal(size: int, rng: random.Random) -> dict:
+    graph = random_connected_graph(size, rng)
+    graph['start_node'] = graph['nodes'][0]
+    return graph
+
+
+def _dijkstra(size: int, rng: random.Random) -> dict:
+    graph = random_connected_graph(size, rng, weighted=True)
+    graph['start_node'] = graph['nodes'][0]
+    return graph
+
+
+def _topological_sort(size: int, rng: random.Random) -> dict:
+    return random_dag(size, rng)
+
+
+def _boyer_moore(size: int, rng: random.Random) -> dict:
+    # Plant a majority element in roughly half of the inputs
+    if rng.random() < 0.5:
+        majority = rng.randint(0, 9)
+        array = [majority] * (size // 2 + 1) + random_array(size - size // 2 - 1, rng, 0, 9)
+        rng.shuffle(array)
+        return {'array': array}
+    return {'array': random_array(size, rng, 0, 9)}
+
+
+def _unsorted_array(size: int, rng: random.Random) -> dict:
+    return {'array': random_array(size, rng)}
+
+
+def _positive_heights(size: int, rng: random.Random) -> dict:
+    return {'heights': random_array(size, rng, 1, 100)}
+
+
+def _dutch_flag(size: int, rng: random.Random) -> dict:
+    return {'array': [rng.randint(0, 2) for _ in range(size)]}
+
+
+GENERATORS: Dict[str, Callable[[int, random.Random], dict]] = {
+    'interval-coverage': _interval_coverage,
+    'binary-search': _binary_search,
+    'two-pointer': _two_pointer,
+    'sliding-window': _sliding_window,
+    'merge-sort': _unsorted_array,
+    'depth-first-search': _graph_traversal,
+    'boyer-moore-voting': _boyer_moore,
+    'breadth-first-search': _graph_traversal,
+    'bubble-sort': _unsorted_array,
+    'container-with-most-water': _positive_heights,
+    'dijkstras-algorithm': _dijkstra,
+    'dutch-national-flag': _dutch_flag,
+    'insertion-sort': _unsorted_array,
+    'kadanes-algorithm': _unsorted_array,
+    'longest-increasing-subsequence': _unsorted_array,
+    'meeting-rooms': _intervals,
+    'merge-intervals': _intervals,
+    'quick-sort': _unsorted_array,
+    'topological-sort': _topological_sort,
+}
+
+# Smallest size each algorithm accepts (sorting tracers require 2 elements)
+MIN_SIZES = {
+    'bubble-sort': 2,
+    'container-with-most-water': 2,
+    'insertion-sort': 2,
+    'quick-sort': 2,
+}
+
+
+def has_generator(algorithm_name: str) -> bool:
+    """Check whether a generator exists for the algorithm."""
+    return algorithm_name in GENERATORS
+
+
+def generate_input(algorithm_name: str, size: int, seed: int = 0) -> dict:
+    """
+    Generate a valid random input for a registered algorithm.
+
+    Args:
+        algorithm_name: Registered algorithm name (e.g., 'binary-search')
+        size: Length of the primary collection (array, intervals, nodes)
+        seed: Seed; identical arguments always produce identical inputs
+
+    Returns:
+        dict: Input suitable for tracer.execute()
+
+    Raises:
+        ValueError: If no generator exists or size is below the algorithm minimum
+    """
+    if algorithm_name not in GENERATORS:
+        raise ValueError(
+            f"No input generator for '{algorithm_name}'. "
+            f"Available: {', '.join(GENERATORS)}"
+        )
+
+    min_size = MIN_SIZES.get(algorithm_name, 1)
+    if size < min_size:
+        raise ValueError(f"Size for '{algorithm_name}' must be at least {min_size}, got {size}")
+
+    rng = random.Random(f"{algorithm_name}:{size}:{seed}")
+    return GENERATORS[algorithm_name](size, rng)
@@ -12,6 +12,7 @@ VERSION: 2.1 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class InsertionSortTracer(AlgorithmTracer):
@@ -27,6 +28,9 @@ class InsertionSortTracer(AlgorithmTracer):
     Prediction points ask: "Will the key be inserted here, or do we shift more?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'INSERT'})
+    DECISION_STEP_TYPES = frozenset({'SHIFT', 'INSERT'})
+
     def __init__(self):
         super().__init__()
         self.array = []
@@ -50,14 +54,7 @@ class InsertionSortTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'key': {
                 'index': self.current_index,
                 'value': self.key_value
@@ -66,17 +63,13 @@ class InsertionSortTracer(AlgorithmTracer):
             'compare_index': self.compare_index
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
-        if self.current_index is not None and index == self.current_index:
-            return 'examining'
-        if self.compare_index is not None and index == self.compare_index:
-            return 'comparing'
-        if index < self.sorted_boundary:
-            return 'sorted'
-        if self.current_index is not None and index < self.current_index:
-            return 'sorted'
-        return 'unsorted'
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element (later ranges win)."""
+        ranges = [(0, self.sorted_boundary, 'sorted')]
+        if self.current_index is not None:
+            ranges.append((0, self.current_index, 'sorted'))
+        ranges += [point(self.compare_index, 'comparing'), point(self.current_index, 'examining')]
+        return paint_states(len(self.array), 'unsorted', ranges)
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -513,9 +506,10 @@ class InsertionSortTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("COMPARE"):
+            step = self.trace[i]
             # Prediction opportunity: Right after comparison, before decision
-            if step.type == "COMPARE" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 key_value = step.data['key_value']
                 compare_value = step.data['compare_value']
@@ -11,11 +11,18 @@ Phase 3 Enhancement: Educational descriptions that explain strategy, not just me
 Session 18 Refactor: Backend Compliance Checklist fixes applied.
 Session 35: Added stub generate_narrative implementation.
 Session 37: Complete narrative generation implementation.
+Iterative engine: the recursive filter is simulated with an explicit call
+stack, so large inputs no longer hit the recursion limit or copy slices.
+Sweep engine: interval states live in an IntervalStateTable, and at
+'summary' granularity or in 'result_only' mode the filter runs as a single
+coverage_sweep() (see interval_sweep.py), which lifts the input cap to
+MAX_SUMMARY_INTERVALS.
 """
 
 from typing import List, Dict, Any
 from dataclasses import dataclass, asdict
 from .base_tracer import AlgorithmTracer
+from .interval_sweep import COVERED, IntervalColumns, IntervalStateTable, coverage_sweep
 
 
 @dataclass
@@ -34,7 +41,13 @@ class IntervalCoverageTracer(AlgorithmTracer):
     Philosophy: Backend does ALL computation, frontend just displays.
     Every decision, comparison, and state change is recorded.
     """
-    MAX_INTERVALS = 100
+    # Bounded by MAX_STEPS (up to 5 steps per interval), not by recursion depth
+    MAX_INTERVALS = 1000
+    # At 'summary' granularity (or in 'result_only' mode) at most two steps are recorded
+    MAX_SUMMARY_INTERVALS = 100000
+    INTERVAL_STATES = ('active', 'examining', 'covered', 'kept')
+    PHASE_STEP_TYPES = frozenset({'SORT_COMPLETE', 'DECISION_MADE'})
+    DECISION_STEP_TYPES = frozenset({'DECISION_MADE'})
 
     def __init__(self):
         super().__init__()
@@ -43,6 +56,9 @@ class IntervalCoverageTracer(AlgorithmTracer):
         self.original_intervals = []
         self.interval_states = {}
         self.current_max_end = float('-inf')
+        self.interval_table = None
+        self.interval_indices = {}
+        self.dirty_ids = set()
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -277,10 +293,11 @@ class IntervalCoverageTracer(AlgorithmTracer):
         # Parse input
         intervals_data = input_data.get('intervals', [])
 
-        if len(intervals_data) > self.MAX_INTERVALS:
+        max_intervals = self.MAX_SUMMARY_INTERVALS if self._records_end_steps_only else self.MAX_INTERVALS
+        if len(intervals_data) > max_intervals:
             raise ValueError(
                 f"Input validation failed: Too many intervals provided ({len(intervals_data)}). "
-                f"The maximum allowed is {self.MAX_INTERVALS}."
+                f"The maximum allowed is {max_intervals}."
             )
 
         # Convert to Interval objects
@@ -295,6 +312,12 @@ class IntervalCoverageTracer(AlgorithmTracer):
         ]
 
         self.original_intervals = intervals
+        # asdict() is slow; each interval's dict is built once and shared
+        # (read-only) by the table rows and the step data below
+        interval_dicts = [asdict(interval) for interval in intervals]
+        self.interval_table = IntervalStateTable(interval_dicts, self.INTERVAL_STATES, 'active')
+        for index, interval in enumerate(intervals):
+            self.interval_indices.setdefault(interval.id, []).append(index)
 
         # Initialize visual states
         for interval in intervals:
@@ -304,6 +327,7 @@ class IntervalCoverageTracer(AlgorithmTracer):
                 'is_kept': False,
                 'in_current_subset': True
             }
+        self.dirty_ids = set(self.interval_states)
 
         # Set metadata for frontend (COMPLIANCE FIX: Added display_name)
         self.metadata = {
@@ -320,7 +344,7 @@ class IntervalCoverageTracer(AlgorithmTracer):
 
         self._add_step(
             "INITIAL_STATE",
-            {"intervals": [asdict(i) for i in intervals], "count": len(intervals)},
+            {"intervals": list(interval_dicts), "count": len(intervals)},
             "Original unsorted intervals"
         )
 
@@ -330,15 +354,22 @@ class IntervalCoverageTracer(AlgorithmTracer):
             "Sorting intervals by start time (ascending) breaks ties by preferring longer intervals"
         )
 
-        sorted_intervals = sorted(intervals, key=lambda x: (x.start, -x.end))
+        starts = [i.start for i in intervals]
+        ends = [i.end for i in intervals]
+        columns = IntervalColumns(starts, ends, key=lambda i: (starts[i], -ends[i]))
+        sorted_intervals = [intervals[i] for i in columns.order]
+        sorted_dicts = [interval_dicts[i] for i in columns.order]
 
         self._add_step(
             "SORT_COMPLETE",
-            {"intervals": [asdict(i) for i in sorted_intervals]},
+            {"intervals": sorted_dicts},
             "✓ Sorted! Now we can use a greedy strategy: process intervals left-to-right, keeping only those that extend our coverage."
         )
 
-        result = self._filter_recursive(sorted_intervals, float('-inf'))
+        if self._records_end_steps_only:
+            result = self._filter_sweep(sorted_intervals, columns.ends, float('-inf'))
+        else:
+            result = self._filter_iterative(sorted_intervals, sorted_dicts, float('-inf'))
 
         # Mark kept intervals
         for interval in result:
@@ -387,37 +418,37 @@ class IntervalCoverageTracer(AlgorithmTracer):
         }
         """
         predictions = []
-        for i, step in enumerate(self.trace):
-            if step.type == "EXAMINING_INTERVAL":
-                # Look ahead to find the decision
-                if i + 1 < len(self.trace):
-                    decision_step = self.trace[i + 1]
-                    if decision_step.type == "DECISION_MADE":
-                        interval_data = step.data.get('interval', {})
-                        decision = decision_step.data.get('decision')
-                        start = interval_data.get('start')
-                        end = interval_data.get('end')
-
-                        predictions.append({
-                            'step_index': i,
-                            'question': f"Will interval ({start}, {end}) be kept or covered?",
-                            'choices': [
-                                {
-                                    'id': 'keep',
-                                    'label': 'Keep this interval'
-                                },
-                                {
-                                    'id': 'covered',
-                                    'label': 'Covered by previous'
-                                }
-                            ],
-                            'hint': f"Compare interval.end ({end}) with max_end",
-                            'correct_answer': decision,
-                            'explanation': (
-                                f"Interval ({start}, {end}) was {decision}." if decision == 'keep'
-                                else f"Interval ({start}, {end}) is covered by a previous interval."
-                            )
-                        })
+        for i in self.step_indices("EXAMINING_INTERVAL"):
+            step = self.trace[i]
+            # Look ahead to find the decision
+            if i + 1 < len(self.trace):
+                decision_step = self.trace[i + 1]
+                if decision_step.type == "DECISION_MADE":
+                    interval_data = step.data.get('interval', {})
+                    decision = decision_step.data.get('decision')
+                    start = interval_data.get('start')
+                    end = interval_data.get('end')
+
+                    predictions.append({
+                        'step_index': i,
+                        'question': f"Will interval ({start}, {end}) be kept or covered?",
+                        'choices': [
+                            {
+                                'id': 'keep',
+                                'label': 'Keep this interval'
+                            },
+                            {
+                                'id': 'covered',
+                                'label': 'Covered by previous'
+                            }
+                        ],
+                        'hint': f"Compare interval.end ({end}) with max_end",
+                        'correct_answer': decision,
+                        'explanation': (
+                            f"Interval ({start}, {end}) was {decision}." if decision == 'keep'
+                            else f"Interval ({start}, {end}) is covered by a previous interval."
+                        )
+                    })
         return predictions
 
     def _get_interval_state_string(self, interval_id: int) -> str:
@@ -449,14 +480,17 @@ class IntervalCoverageTracer(AlgorithmTracer):
         Get all original intervals with their current visual state.
 
         COMPLIANCE FIX: Returns 'state' (string) instead of 'visual_state' (dict).
+
+        Only intervals whose visual state changed since the previous step
+        (tracked in dirty_ids) get a new dict; the rest are shared with
+        earlier steps, which never modify them.
         """
-        return [
-            {
-                **asdict(interval),
-                'state': self._get_interval_state_string(interval.id)  # ✅ FIXED: state string
-            }
-            for interval in self.original_intervals
-        ]
+        for interval_id in self.dirty_ids:
+            state = self._get_interval_state_string(interval_id)  # ✅ FIXED: state string
+            for index in self.interval_indices.get(interval_id, ()):
+                self.interval_table.set(index, state)
+        self.dirty_ids.clear()
+        return self.interval_table.views()
 
     def _get_call_stack_state(self):
         """
@@ -465,21 +499,31 @@ class IntervalCoverageTracer(AlgorithmTracer):
         COMPLIANCE FIXES:
         - Renamed 'call_id' to 'id'
         - Added 'is_active' boolean field
+
+        A frame's dict is cached until _update_call() changes the frame, so
+        frames below the top of the stack are shared between steps.
         """
-        return [
-            {
-                'id': call['id'],  # ✅ FIXED: Renamed from 'call_id'
-                'is_active': call['status'] == 'examining',  # ✅ FIXED: Added required field
-                'depth': call['depth'],
-                'current_interval': asdict(call['current']) if call.get('current') else None,
-                'max_end': self._serialize_value(call['max_end']),
-                'remaining_count': len(call['remaining']),
-                'status': call['status'],
-                'decision': call.get('decision'),
-                'return_value': [asdict(i) for i in call.get('return_value', [])]
-            }
-            for call in self.call_stack
-        ]
+        frames = []
+        for call in self.call_stack:
+            if call['view'] is None:
+                call['view'] = {
+                    'id': call['id'],  # ✅ FIXED: Renamed from 'call_id'
+                    'is_active': call['status'] == 'examining',  # ✅ FIXED: Added required field
+                    'depth': call['depth'],
+                    'current_interval': asdict(call['current']) if call.get('current') else None,
+                    'max_end': self._serialize_value(call['max_end']),
+                    'remaining_count': call['remaining_count'],
+                    'status': call['status'],
+                    'decision': call.get('decision'),
+                    'return_value': [asdict(i) for i in call.get('return_value', [])]
+                }
+            frames.append(call['view'])
+        return frames
+
+    def _update_call(self, call_info: dict, **changes):
+        """Update a simulated call frame and invalidate its cached view."""
+        call_info.update(changes)
+        call_info['view'] = None
 
     def _reset_all_visual_states(self):
         """
@@ -491,10 +535,12 @@ class IntervalCoverageTracer(AlgorithmTracer):
         BUG FIX (Session 23): Previously reset ALL states including is_covered,
         causing covered intervals to flash gray then revert to original color.
         """
-        for interval_id in self.interval_states:
+        for interval_id, state in self.interval_states.items():
             # Only reset transient states
-            self.interval_states[interval_id]['is_examining'] = False
-            self.interval_states[interval_id]['in_current_subset'] = True
+            if state['is_examining'] or not state['in_current_subset']:
+                state['is_examining'] = False
+                state['in_current_subset'] = True
+                self.dirty_ids.add(interval_id)
             # Keep is_covered and is_kept intact - they represent final decisions
 
 
@@ -508,149 +554,198 @@ class IntervalCoverageTracer(AlgorithmTracer):
                 'in_current_subset': True
             }
         self.interval_states[interval_id].update(kwargs)
+        self.dirty_ids.add(interval_id)
 
-    def _filter_recursive(self, intervals: List[Interval], max_end: float) -> List[Interval]:
+    def _filter_sweep(self, intervals: List[Interval], ends, max_end: float) -> List[Interval]:
         """
-        Recursive filtering with complete trace generation.
+        Summary-granularity equivalent of _filter_iterative().
+
+        None of the filter's steps can be recorded at 'summary' granularity
+        (ALGORITHM_COMPLETE always follows), so decisions come from one
+        coverage_sweep() and the skipped steps are only counted.
+
+        Args:
+            intervals: Sorted intervals
+            ends: End of each sorted interval
+            max_end: Coverage reached before the first interval
+        """
+        decisions, self.current_max_end = coverage_sweep(ends, max_end)
+        kept = []
+        for current, decision in zip(intervals, decisions):
+            if decision == COVERED:
+                self._set_visual_state(current.id, is_covered=True)
+            else:
+                kept.append(current)
+
+        # One call per interval plus the base case
+        self.next_call_id += len(intervals) + 1
+        self._skip_steps({
+            'CALL_START': len(intervals),
+            'EXAMINING_INTERVAL': len(intervals),
+            'DECISION_MADE': len(intervals),
+            'MAX_END_UPDATE': len(kept),
+            'BASE_CASE': 1,
+            'CALL_RETURN': len(intervals)
+        })
+        return kept
+
+    def _filter_iterative(self, intervals: List[Interval], interval_dicts: List[dict],
+                          max_end: float) -> List[Interval]:
+        """
+        Filtering with complete trace generation, without recursion.
+
+        Simulates the recursive formulation (one call per interval, base case
+        once the list is exhausted, returns while unwinding) with an explicit
+        call stack, producing the same steps in the same order. Each frame
+        refers to its subproblem by start index into 'intervals' rather than
+        a copied slice.
+
+        Args:
+            intervals: Sorted intervals
+            interval_dicts: asdict() views of 'intervals', in the same order
+            max_end: Coverage reached before the first interval
 
         Note: No longer manually enriches data in _add_step() calls because
         _get_visualization_state() handles it automatically.
         """
-        self.current_max_end = max_end
-        if not intervals:
+        kept = []
+
+        # Descend: everything a call does before recursing on the rest
+        for index, current in enumerate(intervals):
+            self.current_max_end = max_end
             call_id = self.next_call_id
             self.next_call_id += 1
+            depth = len(self.call_stack)
+            remaining_count = len(intervals) - index - 1
+
+            call_info = {
+                'id': call_id,
+                'depth': depth,
+                'current': current,
+                'remaining_count': remaining_count,
+                'kept_before': len(kept),
+                'max_end': max_end,
+                'status': 'examining',
+                'decision': None,
+                'return_value': [],
+                'view': None
+            }
+            self.call_stack.append(call_info)
+
+            self._reset_all_visual_states()
+            self._set_visual_state(current.id, is_examining=True, in_current_subset=True)
 
             self._add_step(
-                "BASE_CASE",
+                "CALL_START",
                 {
                     "call_id": call_id,
+                    "depth": depth,
+                    "examining": asdict(current),
                     "max_end": self._serialize_value(max_end),
-                    "description": "No intervals remaining - return empty list"
+                    "remaining_count": remaining_count,
+                    "intervals": interval_dicts[index:]
                 },
-                "Base case: no more intervals to process, return empty result"
+                f"New recursive call (depth {depth}): examining interval ({current.start}, {current.end}) with {remaining_count} remaining"
             )
-            return []
-
-        call_id = self.next_call_id
-        self.next_call_id += 1
-        depth = len(self.call_stack)
-
-        current = intervals[0]
-        remaining = intervals[1:]
-
-        call_info = {
-            'id': call_id,
-            'depth': depth,
-            'current': current,
-            'remaining': remaining,
-            'max_end': max_end,
-            'status': 'examining',
-            'decision': None,
-            'return_value': []
-        }
-        self.call_stack.append(call_info)
-
-        self._reset_all_visual_states()
-        self._set_visual_state(current.id, is_examining=True, in_current_subset=True)
-
-        for interval in remaining:
-            self._set_visual_state(interval.id, in_current_subset=True)
 
-        self._add_step(
-            "CALL_START",
-            {
-                "call_id": call_id,
-                "depth": depth,
-                "examining": asdict(current),
-                "max_end": self._serialize_value(max_end),
-                "remaining_count": len(remaining),
-                "intervals": [asdict(i) for i in intervals]
-            },
-            f"New recursive call (depth {depth}): examining interval ({current.start}, {current.end}) with {len(remaining)} remaining"
-        )
+            max_end_display = f"{max_end}" if max_end != float('-inf') else "-∞ (no coverage yet)"
+            self._add_step(
+                "EXAMINING_INTERVAL",
+                {
+                    "call_id": call_id,
+                    "interval": asdict(current),
+                    "max_end": self._serialize_value(max_end),
+                    "comparison": f"{current.end} vs {max_end if max_end != float('-inf') else 'None'}"
+                },
+                f"Does interval ({current.start}, {current.end}) extend beyond max_end={max_end_display}? If yes, we KEEP it; if no, it's COVERED."
+            )
 
-        max_end_display = f"{max_end}" if max_end != float('-inf') else "-∞ (no coverage yet)"
-        self._add_step(
-            "EXAMINING_INTERVAL",
-            {
-                "call_id": call_id,
-                "interval": asdict(current),
-                "max_end": self._serialize_value(max_end),
-                "comparison": f"{current.end} vs {max_end if max_end != float('-inf') else 'None'}"
-            },
-            f"Does interval ({current.start}, {current.end}) extend beyond max_end={max_end_display}? If yes, we KEEP it; if no, it's COVERED."
-        )
+            is_covered = current.end <= max_end
+            decision = "covered" if is_covered else "keep"
 
-        is_covered = current.end <= max_end
-        decision = "covered" if is_covered else "keep"
+            self._update_call(call_info, status='decided', decision=decision)
 
-        call_info['status'] = 'decided'
-        call_info['decision'] = decision
+            if is_covered:
+                self._set_visual_state(current.id, is_covered=True, is_examining=False)
+            else:
+                self._set_visual_state(current.id, is_examining=False)
 
-        if is_covered:
-            self._set_visual_state(current.id, is_covered=True, is_examining=False)
-        else:
-            self._set_visual_state(current.id, is_examining=False)
+            # PHASE 3: Enhanced decision explanation
+            if is_covered:
+                explanation = (
+                    f"❌ COVERED: end={current.end} ≤ max_end={max_end if max_end != float('-inf') else '-∞'} "
+                    f"— an earlier interval already covers this range, so we can skip it safely."
+                )
+            else:
+                explanation = (
+                    f"✅ KEEP: end={current.end} > max_end={max_end if max_end != float('-inf') else '-∞'} "
+                    f"— this interval extends our coverage, so we must keep it."
+                )
 
-        # PHASE 3: Enhanced decision explanation
-        if is_covered:
-            explanation = (
-                f"❌ COVERED: end={current.end} ≤ max_end={max_end if max_end != float('-inf') else '-∞'} "
-                f"— an earlier interval already covers this range, so we can skip it safely."
-            )
-        else:
-            explanation = (
-                f"✅ KEEP: end={current.end} > max_end={max_end if max_end != float('-inf') else '-∞'} "
-                f"— this interval extends our coverage, so we must keep it."
+            self._add_step(
+                "DECISION_MADE",
+                {
+                    "call_id": call_id,
+                    "interval": asdict(current),
+                    "decision": decision,
+                    "reason": f"end={current.end} {'<=' if is_covered else '>'} max_end={max_end if max_end != float('-inf') else 'None'}",
+                    "will_keep": not is_covered
+                },
+                explanation
             )
 
+            if not is_covered:
+                new_max_end = max(max_end, current.end)
+                old_display = f"{max_end}" if max_end != float('-inf') else "-∞"
+
+                self._add_step(
+                    "MAX_END_UPDATE",
+                    {
+                        "call_id": call_id,
+                        "interval": asdict(current),
+                        "old_max_end": self._serialize_value(max_end),
+                        "new_max_end": new_max_end
+                    },
+                    f"Coverage extended: max_end updated from {old_display} → {new_max_end} (now we can skip intervals ending ≤ {new_max_end})"
+                )
+
+                kept.append(current)
+                max_end = new_max_end
+
+        # Base case: no intervals left
+        self.current_max_end = max_end
+        call_id = self.next_call_id
+        self.next_call_id += 1
+
         self._add_step(
-            "DECISION_MADE",
+            "BASE_CASE",
             {
                 "call_id": call_id,
-                "interval": asdict(current),
-                "decision": decision,
-                "reason": f"end={current.end} {'<=' if is_covered else '>'} max_end={max_end if max_end != float('-inf') else 'None'}",
-                "will_keep": not is_covered
+                "max_end": self._serialize_value(max_end),
+                "description": "No intervals remaining - return empty list"
             },
-            explanation
+            "Base case: no more intervals to process, return empty result"
         )
 
-        if not is_covered:
-            new_max_end = max(max_end, current.end)
-            old_display = f"{max_end}" if max_end != float('-inf') else "-∞"
+        # Unwind: each call returns the intervals it kept plus everything
+        # kept by the calls above it, i.e. a suffix of 'kept'
+        while self.call_stack:
+            call_info = self.call_stack[-1]
+            result = kept[call_info['kept_before']:]
+
+            self._update_call(call_info, status='returning', return_value=result)
 
             self._add_step(
-                "MAX_END_UPDATE",
+                "CALL_RETURN",
                 {
-                    "call_id": call_id,
-                    "interval": asdict(current),
-                    "old_max_end": self._serialize_value(max_end),
-                    "new_max_end": new_max_end
+                    "call_id": call_info['id'],
+                    "depth": call_info['depth'],
+                    "return_value": [asdict(i) for i in result],
+                    "kept_count": len(result)
                 },
-                f"Coverage extended: max_end updated from {old_display} → {new_max_end} (now we can skip intervals ending ≤ {new_max_end})"
+                f"↩️ Returning from call #{call_info['id']}: kept {len(result)} interval(s) from this branch"
             )
 
-            self.current_max_end = new_max_end
-            rest = self._filter_recursive(remaining, new_max_end)
-            result = [current] + rest
-        else:
-            result = self._filter_recursive(remaining, max_end)
-
-        call_info['status'] = 'returning'
-        call_info['return_value'] = result
-
-        self._add_step(
-            "CALL_RETURN",
-            {
-                "call_id": call_id,
-                "depth": depth,
-                "return_value": [asdict(i) for i in result],
-                "kept_count": len(result)
-            },
-            f"↩️ Returning from call #{call_id}: kept {len(result)} interval(s) from this branch"
-        )
+            self.call_stack.pop()
 
-        self.call_stack.pop()
-        return result
\ No newline at end of file
+        return kept
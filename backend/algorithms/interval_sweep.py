@@ -0,0 +1,232 @@
+# backend/algorithms/interval_sweep.py
+"""
+Shared sweep-line engine for the interval tracers.
+
+Merge Intervals, Meeting Rooms II and Interval Coverage all sort their
+intervals once and scan them left to right. This module holds the parts
+they share:
+
+- IntervalColumns: the sort order plus start/end columns in sorted order,
+  stored as array('q') when every endpoint is a plain int.
+- merge_sweep() / coverage_sweep() / room_sweep(): one-pass classification
+  of sorted intervals. At 'summary' granularity the tracers record only the
+  first and last steps, so they fast-forward through these instead of
+  building data for every skipped step.
+- IntervalStateTable: per-interval state codes in a bytearray. Row views
+  are rebuilt only for intervals whose state changed and are shared
+  between steps, so a step costs one list copy instead of a dict per
+  interval.
+
+The engine is pure Python (no NumPy dependency); the sweeps are single
+passes over compact columns with no per-interval allocation beyond their
+outputs.
+"""
+
+import heapq
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Classification codes returned by the sweeps
+NEW = 0       # merge_sweep: starts a new merged interval
+MERGED = 1    # merge_sweep: merged into the previous one
+KEEP = 0      # coverage_sweep: extends coverage
+COVERED = 1   # coverage_sweep: covered by an earlier interval
+
+
+def _column(values: Sequence[Any]) -> Sequence[Any]:
+    """Store plain ints compactly; anything else (floats, bools) as a list."""
+    if all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            pass
+    return list(values)
+
+
+class IntervalColumns:
+    """
+    Intervals sorted once, as parallel start/end columns.
+
+    Sorting is stable, so equal keys keep their input order, as with
+    sorted() in the tracers.
+
+    Attributes:
+        order: Input index of the interval at each sorted position
+        starts: Start of the interval at each sorted position
+        ends: End of the interval at each sorted position
+    """
+
+    def __init__(self, starts: Sequence[Any], ends: Sequence[Any],
+                 key: Optional[Callable[[int], Any]] = None):
+        """
+        Args:
+            starts: Start per input interval
+            ends: End per input interval
+            key: Sort key on input index (default: start)
+        """
+        self.order = sorted(range(len(starts)), key=key or starts.__getitem__)
+        self.starts = _column([starts[i] for i in self.order])
+        self.ends = _column([ends[i] for i in self.order])
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+def merge_sweep(starts: Sequence[Any], ends: Sequence[Any],
+                stop: Optional[int] = None) -> Tuple[List[list], bytearray]:
+    """
+    Merge overlapping sorted intervals.
+
+    Args:
+        starts, ends: Columns sorted by start
+        stop: Number of leading intervals to process (default: all)
+
+    Returns:
+        tuple: (merged [start, end] lists, NEW/MERGED code per interval)
+    """
+    stop = len(starts) if stop is None else stop
+    classes = bytearray(stop)
+    if not stop:
+        return [], classes
+
+    merged = [[starts[0], ends[0]]]
+    last = merged[0]
+    for i in range(1, stop):
+        if starts[i] <= last[1]:
+            last[1] = max(last[1], ends[i])
+            classes[i] = MERGED
+        else:
+            last = [starts[i], ends[i]]
+            merged.append(last)
+    return merged, classes
+
+
+def coverage_sweep(ends: Sequence[Any], max_end: Any = float('-inf')) -> Tuple[bytearray, Any]:
+    """
+    Classify intervals sorted by (start asc, end desc) as kept or covered.
+
+    An interval is covered when its end does not pass the coverage reached
+    by the intervals before it.
+
+    Returns:
+        tuple: (KEEP/COVERED code per interval, final max_end)
+    """
+    classes = bytearray(len(ends))
+    for i, end in enumerate(ends):
+        if end <= max_end:
+            classes[i] = COVERED
+        else:
+            max_end = end
+    return classes, max_end
+
+
+def room_sweep(starts: Sequence[Any], ends: Sequence[Any], heap: Optional[list] = None,
+               rooms_used: int = 0, log: Optional[list] = None) -> Tuple[List[int], list, int]:
+    """
+    Assign rooms to meetings sorted by start, reusing the room that frees first.
+
+    Args:
+        starts, ends: Columns sorted by start
+        heap: Heap of (end, room) tuples to continue from (modified in place)
+        rooms_used: Rooms allocated so far
+        log: If given, receives ['pop' | 'push', end, room] per heap operation
+
+    Returns:
+        tuple: (room per meeting, heap, rooms_used)
+    """
+    heap = [] if heap is None else heap
+    rooms = [0] * len(starts)
+    for i, start in enumerate(starts):
+        end = ends[i]
+        if heap and start >= heap[0][0]:
+            freed_end, room = heap[0]
+            heapq.heapreplace(heap, (end, room))
+            if log is not None:
+                log.append(['pop', freed_end, room])
+        else:
+            rooms_used += 1
+            room = rooms_used
+            heapq.heappush(heap, (end, room))
+        if log is not None:
+            log.append(['push', end, room])
+        rooms[i] = room
+    return rooms, heap, rooms_used
+
+
+class IntervalStateTable:
+    """
+    Per-interval states as bytearray codes, with cached row views.
+
+    Each row view is {**row, 'state': name, **extra_columns}. Views are
+    rebuilt only after set() changes the interval, and views() returns a
+    list snapshot shared until the next change. take_changes() lists the
+    views changed since it was last called, for delta payloads.
+    """
+
+    def __init__(self, rows: Sequence[dict], names: Sequence[str], initial: str, **defaults: Any):
+        """
+        Args:
+            rows: Static columns per interval (keys before 'state')
+            names: Every state name the table can hold (at most 256)
+            initial: Starting state of every interval
+            **defaults: Extra columns after 'state', with their initial values
+        """
+        self.rows = rows
+        self.names = tuple(names)
+        self.codes = {name: code for code, name in enumerate(self.names)}
+        self.states = bytearray([self.codes[initial]]) * len(rows)
+        self.defaults = defaults
+        self.extras: Dict[int, dict] = {}
+        self._views: List[Optional[dict]] = [None] * len(rows)
+        self._dirty = set(range(len(rows)))
+        self._snapshot: Optional[list] = None
+        self._changed: Dict[int, None] = {}
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def state(self, position: int) -> str:
+        return self.names[self.states[position]]
+
+    def set(self, position: int, state: str, **extra: Any):
+        """Set an interval's state and extra columns; no-op if unchanged."""
+        code = self.codes[state]
+        current_extra = self.extras.get(position, self.defaults)
+        new_extra = {**current_extra, **extra} if extra else current_extra
+        if self.states[position] == code and new_extra == current_extra:
+            return
+        self.states[position] = code
+        if new_extra is not current_extra:
+            self.extras[position] = new_extra
+        self._dirty.add(position)
+        self._snapshot = None
+        self._changed[position] = None
+
+    def _build_view(self, position: int) -> dict:
+        return {
+            **self.rows[position],
+            'state': self.names[self.states[position]],
+            **self.extras.get(position, self.defaults)
+        }
+
+    def _view(self, position: int) -> dict:
+        if position in self._dirty:
+            self._views[position] = self._build_view(position)
+            self._dirty.discard(position)
+        return self._views[position]
+
+    def views(self) -> list:
+        """Current row views (a shared snapshot; callers must not modify it)."""
+        if self._snapshot is None:
+            for position in self._dirty:
+                self._views[position] = self._build_view(position)
+            self._dirty.clear()
+            self._snapshot = list(self._views)
+        return self._snapshot
+
+    def take_changes(self) -> list:
+        """Views of intervals changed since the last call, in first-change order."""
+        changes = [self._view(position) for position in self._changed]
+        self._changed = {}
+        return changes
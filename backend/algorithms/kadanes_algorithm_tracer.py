@@ -12,6 +12,7 @@ VERSION: 2.1 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class KadanesAlgorithmTracer(AlgorithmTracer):
@@ -27,6 +28,9 @@ class KadanesAlgorithmTracer(AlgorithmTracer):
     Prediction points ask: "Will we add this element to current sum or reset?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'UPDATE_MAX'})
+    DECISION_STEP_TYPES = frozenset({'UPDATE_MAX'})
+
     def __init__(self):
         super().__init__()
         self.array = []
@@ -52,14 +56,7 @@ class KadanesAlgorithmTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'current_sum': self.current_sum,
             'max_sum': self.max_sum if self.max_sum != float('-inf') else None,
             'current_subarray': {
@@ -72,15 +69,13 @@ class KadanesAlgorithmTracer(AlgorithmTracer):
             }
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
-        if index == self.current_index:
-            return 'examining'
-        if self.max_start <= index <= self.max_end:
-            return 'in_max_subarray'
-        if self.current_start <= index <= self.current_end and index < self.current_index:
-            return 'in_current_subarray'
-        return 'excluded'
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element (later ranges win)."""
+        return paint_states(len(self.array), 'excluded', [
+            (self.current_start, min(self.current_end + 1, self.current_index), 'in_current_subarray'),
+            (self.max_start, self.max_end + 1, 'in_max_subarray'),
+            point(self.current_index, 'examining'),
+        ])
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -489,9 +484,10 @@ class KadanesAlgorithmTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("ITERATE"):
+            step = self.trace[i]
             # Prediction opportunity: At ITERATE steps (except first initialization)
-            if step.type == "ITERATE" and step.data.get('decision') != 'initialize':
+            if step.data.get('decision') != 'initialize':
                 index = step.data['index']
                 value = step.data['value']
                 old_current = step.data['old_current_sum']
@@ -8,13 +8,151 @@ to maintain an array of "tails" where tails[i] represents the smallest ending
 value of all increasing subsequences of length i+1.
 
 VERSION: 2.0 - Backend Checklist v2.2 Compliance
+
+With input 'state_updates': 'delta', steps carry no tails copies: after the
+first step, each step's visualization lists the [position, old_value,
+new_value] tail updates since the previous recorded step, EXTEND_TAIL and
+REPLACE_TAIL record the element's parent (the input index it extends), and
+the result includes the reconstructed subsequence. tails_at_step() and
+expand_state_deltas() rebuild tails and full snapshots on demand.
 """
 
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Optional
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 import bisect
 
 
+def _render_state(array: list, tails: list, current_index: Optional[int], current_num: Any,
+                  search: Optional[dict], replacement_index: Optional[int]) -> dict:
+    """
+    Build the full visualization state.
+
+    Array elements are 'processed' before the current index, 'examining' at
+    it and 'pending' after (all 'pending' before the first element). Tails
+    are 'examining' at the binary search mid, 'replacing' at the
+    replacement index, 'active' otherwise.
+    """
+    if current_index is None:
+        states = ['pending'] * len(array)
+    else:
+        states = paint_states(len(array), 'pending', [
+            (0, current_index, 'processed'),
+            point(current_index, 'examining'),
+        ])
+
+    mid = search['mid'] if search is not None else None
+    tail_states = paint_states(len(tails), 'active', [
+        point(replacement_index, 'replacing'),
+        point(mid, 'examining'),
+    ])
+
+    viz_state = {
+        'array': element_rows(array, states),
+        'tails': element_rows(tails, tail_states),
+        'current_element': {
+            'index': current_index,
+            'value': current_num
+        } if current_index is not None else None,
+        'tails_length': len(tails)
+    }
+    if search is not None:
+        viz_state['binary_search'] = search
+    return viz_state
+
+
+def _apply_tail_updates(tails: list, updates: list):
+    """Apply [position, old_value, new_value] updates (position == len(tails) appends)."""
+    for position, _, new_value in updates:
+        if position == len(tails):
+            tails.append(new_value)
+        else:
+            tails[position] = new_value
+
+
+def tails_at_step(trace_result: dict, step_index: int) -> list:
+    """
+    Rebuild the tails array as of one step of an LIS trace.
+
+    Full traces read it from the step's visualization; 'delta' traces replay
+    the tail updates of every step up to step_index.
+
+    Args:
+        trace_result: Result of LongestIncreasingSubsequenceTracer.execute()
+        step_index: Index into trace['steps']
+
+    Returns:
+        list: Tail values at that step
+    """
+    steps = trace_result['trace']['steps']
+    viz = steps[step_index]['data']['visualization']
+    if 'tails' in viz:
+        return [tail['value'] for tail in viz['tails']]
+
+    tails = [tail['value'] for tail in steps[0]['data']['visualization']['tails']]
+    for step in steps[1:step_index + 1]:
+        _apply_tail_updates(tails, step['data']['visualization']['tail_updates'])
+    return tails
+
+
+def expand_state_deltas(trace_result: dict) -> dict:
+    """
+    Rebuild full visualization snapshots from a 'delta' LIS trace.
+
+    Restores each step's 'array'/'tails' visualization and the
+    'tails_before' (CHECK_ELEMENT) and 'tails_after' (EXTEND_TAIL,
+    REPLACE_TAIL) step data. Traces in 'full' mode are returned unchanged.
+    Steps must not have been sampled or filtered: the first step holds the
+    input array and each later step builds on the previous one.
+
+    Args:
+        trace_result: Result of LongestIncreasingSubsequenceTracer.execute()
+
+    Returns:
+        dict: Trace result with 'full' mode visualization in every step
+    """
+    if trace_result['metadata'].get('state_updates') != 'delta':
+        return trace_result
+
+    first, *rest = trace_result['trace']['steps']
+    first_viz = first['data']['visualization']
+    array = [element['value'] for element in first_viz['array']]
+    tails = [tail['value'] for tail in first_viz['tails']]
+
+    steps = [first]
+    for step in rest:
+        viz = step['data']['visualization']
+        _apply_tail_updates(tails, viz['tail_updates'])
+        current = viz['current_element']
+
+        # Restore tails copies where full mode has them ('parent' takes the
+        # place of 'tails_after' in delta mode)
+        data = {}
+        for key, value in step['data'].items():
+            if key == 'visualization':
+                continue
+            if key == 'parent':
+                data['tails_after'] = list(tails)
+            data[key] = value
+            if key == 'current_num' and step['type'] == 'CHECK_ELEMENT':
+                data['tails_before'] = list(tails)
+        data['visualization'] = _render_state(
+            array,
+            list(tails),
+            current['index'] if current else None,
+            current['value'] if current else None,
+            viz.get('binary_search'),
+            viz.get('replacing')
+        )
+        steps.append({**step, 'data': data})
+
+    return {
+        **trace_result,
+        'trace': {**trace_result['trace'], 'steps': steps},
+        'metadata': {k: v for k, v in trace_result['metadata'].items() if k != 'state_updates'}
+    }
+
+
 class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
     """
     Tracer for Longest Increasing Subsequence using Patience Sorting.
@@ -31,10 +169,18 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
     - Otherwise: binary search to find replacement position
     """
 
+    PHASE_STEP_TYPES = frozenset({'EXTEND_TAIL'})
+    DECISION_STEP_TYPES = frozenset({'EXTEND_TAIL', 'REPLACE_TAIL'})
+    STATE_UPDATES = ('full', 'delta')
+
     def __init__(self):
         super().__init__()
         self.array = []
         self.tails = []
+        self.tail_indices = []  # Input index of each tail value
+        self.parents = []  # Input index each element extends, or None
+        self.tail_updates = []  # [position, old, new] since the last recorded step
+        self.state_updates = 'full'
         self.current_index = None
         self.current_num = None
         self.search_left = None
@@ -54,57 +200,59 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
         if not self.array:
             return {}
 
-        viz_state = {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
-            'tails': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_tail_state(i)
-                }
-                for i, v in enumerate(self.tails)
-            ],
-            'current_element': {
-                'index': self.current_index,
-                'value': self.current_num
-            } if self.current_index is not None else None,
-            'tails_length': len(self.tails)
-        }
-
         # Add binary search pointers if active
+        search = None
         if self.search_left is not None:
-            viz_state['binary_search'] = {
+            search = {
                 'left': self.search_left,
                 'right': self.search_right,
                 'mid': self.search_mid
             }
 
-        return viz_state
-
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element."""
-        if self.current_index is None:
-            return 'pending'
-        if index == self.current_index:
-            return 'examining'
-        if index < self.current_index:
-            return 'processed'
-        return 'pending'
-
-    def _get_tail_state(self, index: int) -> str:
-        """Determine visual state of tail element."""
-        if self.search_mid is not None and index == self.search_mid:
-            return 'examining'
-        if self.replacement_index is not None and index == self.replacement_index:
-            return 'replacing'
-        return 'active'
+        if self.state_updates == 'delta' and self.step_count > 0:
+            viz_state = {
+                'current_element': {
+                    'index': self.current_index,
+                    'value': self.current_num
+                } if self.current_index is not None else None,
+                'tails_length': len(self.tails),
+                'tail_updates': self.tail_updates
+            }
+            self.tail_updates = []
+            if search is not None:
+                viz_state['binary_search'] = search
+            if self.replacement_index is not None:
+                viz_state['replacing'] = self.replacement_index
+            return viz_state
+
+        self.tail_updates = []
+        return _render_state(
+            self.array, self.tails, self.current_index, self.current_num, search, self.replacement_index
+        )
+
+    def _set_tail(self, position: int, index: int):
+        """Place array[index] at tails[position] (appending at the end) and record its parent."""
+        num = self.array[index]
+        if position == len(self.tails):
+            old_value = None
+            self.tails.append(num)
+            self.tail_indices.append(index)
+        else:
+            old_value = self.tails[position]
+            self.tails[position] = num
+            self.tail_indices[position] = index
+        self.parents[index] = self.tail_indices[position - 1] if position > 0 else None
+        if self.state_updates == 'delta':
+            self.tail_updates.append([position, old_value, num])
+
+    def _reconstruct_subsequence(self) -> List[int]:
+        """Follow parent pointers back from the last tail; returns input indices."""
+        indices = []
+        index = self.tail_indices[-1] if self.tail_indices else None
+        while index is not None:
+            indices.append(index)
+            index = self.parents[index]
+        return indices[::-1]
 
     def generate_narrative(self, trace_result: dict) -> str:
         """
@@ -119,6 +267,7 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
         Returns:
             Markdown-formatted narrative showing step-by-step execution
         """
+        trace_result = expand_state_deltas(trace_result)
         metadata = trace_result['metadata']
         steps = trace_result['trace']['steps']
         result = trace_result['result']
@@ -359,8 +508,19 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
         if not self.array:
             raise ValueError("Array cannot be empty")
 
+        self.state_updates = input_data.get('state_updates', 'full')
+        if self.state_updates not in self.STATE_UPDATES:
+            raise ValueError(
+                f"Invalid state_updates '{self.state_updates}'. "
+                f"Expected one of: {', '.join(self.STATE_UPDATES)}"
+            )
+        delta = self.state_updates == 'delta'
+
         # Initialize
         self.tails = []
+        self.tail_indices = []
+        self.parents = [None] * len(self.array)
+        self.tail_updates = []
         self.current_index = None
         self.current_num = None
         self.search_left = None
@@ -379,6 +539,8 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
             },
             'input_size': len(self.array)
         }
+        if delta:
+            self.metadata['state_updates'] = self.state_updates
 
         # Initial state
         self._add_step(
@@ -401,28 +563,28 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
 
             # Record checking this element
             last_tail = self.tails[-1] if self.tails else None
+            check_data = {'current_index': i, 'current_num': num}
+            if not delta:
+                check_data['tails_before'] = self.tails.copy()
+            check_data['last_tail'] = last_tail
             self._add_step(
                 "CHECK_ELEMENT",
-                {
-                    'current_index': i,
-                    'current_num': num,
-                    'tails_before': self.tails.copy(),
-                    'last_tail': last_tail
-                },
+                check_data,
                 f"📍 Examine array[{i}] = {num}"
             )
 
             # Decision: extend or replace?
             if not self.tails or num > self.tails[-1]:
                 # Extend: append to tails
-                self.tails.append(num)
+                self._set_tail(len(self.tails), i)
+                extend_data = {'current_num': num, 'new_length': len(self.tails)}
+                if delta:
+                    extend_data['parent'] = self.parents[i]
+                else:
+                    extend_data['tails_after'] = self.tails.copy()
                 self._add_step(
                     "EXTEND_TAIL",
-                    {
-                        'current_num': num,
-                        'new_length': len(self.tails),
-                        'tails_after': self.tails.copy()
-                    },
+                    extend_data,
                     f"➕ Extend: {num} > last tail, append to tails (new length: {len(self.tails)})"
                 )
             else:
@@ -468,25 +630,34 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
                 pos = left
                 self.replacement_index = pos
                 old_value = self.tails[pos]
-                self.tails[pos] = num
+                self._set_tail(pos, i)
 
+                replace_data = {
+                    'current_num': num,
+                    'replace_index': pos,
+                    'old_value': old_value,
+                    'new_value': num
+                }
+                if delta:
+                    replace_data['parent'] = self.parents[i]
+                else:
+                    replace_data['tails_after'] = self.tails.copy()
                 self._add_step(
                     "REPLACE_TAIL",
-                    {
-                        'current_num': num,
-                        'replace_index': pos,
-                        'old_value': old_value,
-                        'new_value': num,
-                        'tails_after': self.tails.copy()
-                    },
+                    replace_data,
                     f"🔄 Replace: tails[{pos}] = {num} (was {old_value})"
                 )
 
         # Build result
-        return self._build_trace_result({
+        result = {
             'lis_length': len(self.tails),
             'final_tails': self.tails.copy()
-        })
+        }
+        if delta:
+            indices = self._reconstruct_subsequence()
+            result['subsequence'] = [self.array[index] for index in indices]
+            result['subsequence_indices'] = indices
+        return self._build_trace_result(result)
 
     def get_prediction_points(self) -> List[Dict[str, Any]]:
         """
@@ -500,12 +671,12 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("CHECK_ELEMENT"):
+            step = self.trace[i]
             # Prediction opportunity: Right after CHECK_ELEMENT, before decision
-            if step.type == "CHECK_ELEMENT" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 current_num = step.data['current_num']
-                tails_before = step.data['tails_before']
                 last_tail = step.data.get('last_tail')
 
                 # Determine correct answer from next step type
@@ -517,7 +688,7 @@ class LongestIncreasingSubsequenceTracer(AlgorithmTracer):
                     continue  # Skip if unexpected
 
                 # Build question
-                if not tails_before:
+                if last_tail is None:
                     question = f"Tails array is empty. What happens with {current_num}?"
                 else:
                     question = f"Current number: {current_num}, Last tail: {last_tail}. What's next?"
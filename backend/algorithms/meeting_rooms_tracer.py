@@ -14,11 +14,78 @@ VERSION: 2.2 - FAA COMPLIANCE FIX + INPUT VALIDATION
 - Room assignments now traceable and temporally exclusive
 - Fixes FAA audit failures: room assignment contradictions eliminated
 - Added comprehensive input validation (fail loudly on invalid input)
+
+Visualization state is maintained incrementally: heap end times live in a
+sorted list updated on each push/pop, interval views are rebuilt only for
+meetings whose state changes (IntervalStateTable, see interval_sweep.py),
+and unchanged snapshots are shared between steps. With input
+'state_updates': 'delta', steps after the first carry only heap operations
+and interval changes; expand_state_deltas() restores full snapshots.
+At 'summary' granularity or in 'result_only' mode all but the last
+meeting are scheduled with room_sweep() instead of emitting skipped steps.
 """
 
+from bisect import insort
 from typing import Any, List, Dict
 import heapq
 from .base_tracer import AlgorithmTracer
+from .interval_sweep import IntervalColumns, IntervalStateTable, room_sweep
+
+
+def expand_state_deltas(trace_result: dict) -> dict:
+    """
+    Rebuild full visualization snapshots from a 'delta' Meeting Rooms trace.
+
+    The first step holds the full state; each later step's 'heap_delta'
+    ([['push' | 'pop', end, room], ...] in order) and 'interval_updates'
+    (changed all_intervals entries) are applied to the previous state.
+    Traces in 'full' mode are returned unchanged. Steps must not have been
+    sampled or filtered, since each one builds on the previous step.
+
+    Room assignment keys are interval ids (ints), also for traces parsed
+    from JSON, where they arrive as strings.
+
+    Args:
+        trace_result: Result of MeetingRoomsTracer.execute(), possibly parsed from JSON
+
+    Returns:
+        dict: Trace result with 'full' mode visualization in every step
+    """
+    if trace_result['metadata'].get('state_updates') != 'delta':
+        return trace_result
+
+    steps = []
+    intervals, heap, assignments = [], [], {}
+    for step in trace_result['trace']['steps']:
+        viz = step['data']['visualization']
+        if 'all_intervals' in viz:
+            intervals = list(viz['all_intervals'])
+            heap = list(viz['heap_state'])
+            assignments = {int(key): room for key, room in viz['room_assignments'].items()}
+        else:
+            for operation, end_time, _ in viz['heap_delta']:
+                if operation == 'push':
+                    insort(heap, end_time)
+                else:
+                    heap.remove(end_time)
+            for update in viz['interval_updates']:
+                intervals[update['id']] = update
+                if update['room'] is not None:
+                    assignments[update['id']] = update['room']
+
+        full_viz = {
+            'all_intervals': list(intervals),
+            'heap_state': list(heap),
+            'room_assignments': dict(assignments),
+            'rooms_used': viz['rooms_used']
+        }
+        steps.append({**step, 'data': {**step['data'], 'visualization': full_viz}})
+
+    return {
+        **trace_result,
+        'trace': {**trace_result['trace'], 'steps': steps},
+        'metadata': {k: v for k, v in trace_result['metadata'].items() if k != 'state_updates'}
+    }
 
 
 class MeetingRoomsTracer(AlgorithmTracer):
@@ -34,6 +101,11 @@ class MeetingRoomsTracer(AlgorithmTracer):
     Prediction points ask: "Will we reuse a room or allocate a new one?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'NEW_ROOM'})
+    DECISION_STEP_TYPES = frozenset({'ALLOCATE_ROOM', 'NEW_ROOM'})
+    STATE_UPDATES = ('full', 'delta')
+    INTERVAL_STATES = ('pending', 'examining', 'scheduled')
+
     def __init__(self):
         super().__init__()
         self.intervals = []
@@ -42,6 +114,56 @@ class MeetingRoomsTracer(AlgorithmTracer):
         self.room_assignments = {}  # interval_id -> room_number
         self.current_interval_id = None
         self.rooms_used = 0
+        self.state_updates = 'full'
+        self._reset_views()
+
+    def _reset_views(self):
+        """Reset incremental visualization state."""
+        self._heap_end_times = []  # Sorted mirror of heap end times
+        self._heap_snapshot = None  # Shared snapshots; None = rebuild
+        self._assignments_snapshot = None
+        self._heap_delta = []  # Heap operations since the last recorded step
+        self.interval_table = None  # all_intervals entry per meeting
+
+    def _refresh_interval(self, interval_id: int):
+        """Update one meeting's all_intervals entry from its state and room."""
+        if interval_id is None:
+            return
+        state = 'pending'
+        if interval_id in self.room_assignments:
+            state = 'scheduled'
+        elif self.current_interval_id == interval_id:
+            state = 'examining'
+        self.interval_table.set(interval_id, state, room=self.room_assignments.get(interval_id, None))
+
+    def _set_current(self, interval_id):
+        """Mark a meeting as the one being examined."""
+        previous = self.current_interval_id
+        self.current_interval_id = interval_id
+        self._refresh_interval(previous)
+        self._refresh_interval(interval_id)
+
+    def _assign_room(self, interval_id: int, room_number: int):
+        """Record a meeting's room."""
+        self.room_assignments[interval_id] = room_number
+        self._assignments_snapshot = None
+        self._refresh_interval(interval_id)
+
+    def _heap_push(self, end_time: int, room_number: int):
+        """Push (end_time, room) onto the heap and its sorted mirror."""
+        heapq.heappush(self.heap, (end_time, room_number))
+        insort(self._heap_end_times, end_time)
+        self._heap_snapshot = None
+        self._heap_delta.append(['push', end_time, room_number])
+
+    def _heap_pop(self) -> tuple:
+        """Pop the earliest-ending (end_time, room) from the heap."""
+        end_time, room_number = heapq.heappop(self.heap)
+        # The heap minimum is the first entry of the sorted mirror
+        self._heap_end_times.pop(0)
+        self._heap_snapshot = None
+        self._heap_delta.append(['pop', end_time, room_number])
+        return end_time, room_number
 
     def _get_visualization_state(self) -> dict:
         """
@@ -56,31 +178,28 @@ class MeetingRoomsTracer(AlgorithmTracer):
         if not self.intervals:
             return {}
 
-        # Build interval visualization
-        all_intervals = []
-        for i, interval in enumerate(self.intervals):
-            state = 'pending'
-            if i in self.room_assignments:
-                state = 'scheduled'
-            elif self.current_interval_id == i:
-                state = 'examining'
-            
-            all_intervals.append({
-                'id': i,
-                'start': interval[0],
-                'end': interval[1],
-                'state': state,
-                'room': self.room_assignments.get(i, None)
-            })
-
-        # Extract end times from heap for visualization
-        # Heap contains (end_time, room_id) tuples, but frontend expects just end times
-        heap_end_times = sorted([end_time for end_time, _ in self.heap]) if self.heap else []
+        if self.state_updates == 'delta' and self.step_count > 0:
+            viz = {
+                'heap_delta': self._heap_delta,
+                'interval_updates': self.interval_table.take_changes(),
+                'rooms_used': self.rooms_used
+            }
+            self._heap_delta = []
+            return viz
+
+        # Snapshots are rebuilt only after a change and shared until the next
+        if self._heap_snapshot is None:
+            # Heap contains (end_time, room_id) tuples, but frontend expects just end times
+            self._heap_snapshot = list(self._heap_end_times)
+        if self._assignments_snapshot is None:
+            self._assignments_snapshot = dict(self.room_assignments)
+        self._heap_delta = []
+        self.interval_table.take_changes()
 
         return {
-            'all_intervals': all_intervals,
-            'heap_state': heap_end_times,
-            'room_assignments': dict(self.room_assignments),
+            'all_intervals': self.interval_table.views(),
+            'heap_state': self._heap_snapshot,
+            'room_assignments': self._assignments_snapshot,
             'rooms_used': self.rooms_used
         }
 
@@ -101,6 +220,7 @@ class MeetingRoomsTracer(AlgorithmTracer):
         Raises:
             KeyError: If required visualization data is missing
         """
+        trace_result = expand_state_deltas(trace_result)
         metadata = trace_result['metadata']
         steps = trace_result['trace']['steps']
         result = trace_result['result']
@@ -319,7 +439,8 @@ class MeetingRoomsTracer(AlgorithmTracer):
         Execute Meeting Rooms II algorithm with complete trace generation.
 
         Args:
-            input_data: Dictionary with 'intervals' key containing list of [start, end] pairs
+            input_data: Dictionary with 'intervals' key containing list of [start, end] pairs,
+                        and optional 'state_updates': 'full' (default) or 'delta'
 
         Returns:
             Complete trace result with steps, metadata, and final result
@@ -357,6 +478,21 @@ class MeetingRoomsTracer(AlgorithmTracer):
             if start >= end:
                 raise ValueError(f"invalid interval at index {i}: start ({start}) must be less than end ({end})")
 
+        self.state_updates = input_data.get('state_updates', 'full')
+        if self.state_updates not in self.STATE_UPDATES:
+            raise ValueError(
+                f"Invalid state_updates '{self.state_updates}'. "
+                f"Expected one of: {', '.join(self.STATE_UPDATES)}"
+            )
+
+        self._reset_views()
+        self.interval_table = IntervalStateTable(
+            [{'id': i, 'start': start, 'end': end} for i, (start, end) in enumerate(self.intervals)],
+            self.INTERVAL_STATES,
+            'pending',
+            room=None
+        )
+
         self.metadata = {
             'algorithm': 'meeting-rooms',
             'display_name': 'Meeting Rooms II',
@@ -369,9 +505,12 @@ class MeetingRoomsTracer(AlgorithmTracer):
             },
             'input_size': len(self.intervals)
         }
+        if self.state_updates != 'full':
+            self.metadata['state_updates'] = self.state_updates
 
         # Step 0: Sort by start time
-        self.sorted_intervals = sorted(enumerate(self.intervals), key=lambda x: x[1][0])
+        columns = IntervalColumns([x[0] for x in self.intervals], [x[1] for x in self.intervals])
+        self.sorted_intervals = [(i, self.intervals[i]) for i in columns.order]
         
         self._add_step(
             "SORT_START",
@@ -382,10 +521,18 @@ class MeetingRoomsTracer(AlgorithmTracer):
             f"📋 Sort {len(self.intervals)} meetings by start time"
         )
 
+        # At summary granularity (or in result_only mode) only the last
+        # meeting's steps can be recorded: schedule the rest without
+        # building step data
+        first = 0
+        if self._records_end_steps_only and len(self.sorted_intervals) > 1:
+            first = len(self.sorted_intervals) - 1
+            self._fast_forward(columns, first)
+
         # Process each meeting in sorted order
-        for interval_id, interval in self.sorted_intervals:
+        for interval_id, interval in self.sorted_intervals[first:]:
             start, end = interval
-            self.current_interval_id = interval_id
+            self._set_current(interval_id)
 
             # Check if we can reuse a room
             if self.heap:
@@ -405,13 +552,13 @@ class MeetingRoomsTracer(AlgorithmTracer):
 
                 if start >= earliest_end:
                     # Reuse room - pop the earliest ending meeting
-                    old_end, freed_room = heapq.heappop(self.heap)
+                    old_end, freed_room = self._heap_pop()
                     
                     # CRITICAL FIX: Assign to the SPECIFIC room that was freed
                     room_number = freed_room
                     
-                    self.room_assignments[interval_id] = room_number
-                    heapq.heappush(self.heap, (end, room_number))
+                    self._assign_room(interval_id, room_number)
+                    self._heap_push(end, room_number)
                     
                     self._add_step(
                         "ALLOCATE_ROOM",
@@ -430,8 +577,8 @@ class MeetingRoomsTracer(AlgorithmTracer):
                     # Need new room
                     self.rooms_used += 1
                     room_number = self.rooms_used
-                    self.room_assignments[interval_id] = room_number
-                    heapq.heappush(self.heap, (end, room_number))
+                    self._assign_room(interval_id, room_number)
+                    self._heap_push(end, room_number)
                     
                     self._add_step(
                         "NEW_ROOM",
@@ -459,8 +606,8 @@ class MeetingRoomsTracer(AlgorithmTracer):
                 # First meeting - allocate first room
                 self.rooms_used += 1
                 room_number = self.rooms_used
-                self.room_assignments[interval_id] = room_number
-                heapq.heappush(self.heap, (end, room_number))
+                self._assign_room(interval_id, room_number)
+                self._heap_push(end, room_number)
                 
                 self._add_step(
                     "NEW_ROOM",
@@ -484,13 +631,40 @@ class MeetingRoomsTracer(AlgorithmTracer):
                     f"📊 Initialize heap with end time {end}"
                 )
 
-        self.current_interval_id = None
+        self._set_current(None)
 
         return self._build_trace_result({
             'min_rooms': self.rooms_used,
             'room_assignments': dict(self.room_assignments)
         })
 
+    def _fast_forward(self, columns: IntervalColumns, count: int):
+        """
+        Schedule the first count sorted meetings with room_sweep().
+
+        Leaves the heap, room assignments and interval states as the step
+        loop would, and counts the steps it would have emitted.
+        """
+        log = [] if self.state_updates == 'delta' else None
+        rooms, self.heap, self.rooms_used = room_sweep(
+            columns.starts[:count], columns.ends[:count], self.heap, self.rooms_used, log
+        )
+        for (interval_id, _), room_number in zip(self.sorted_intervals, rooms):
+            self._assign_room(interval_id, room_number)
+        self._heap_end_times = sorted(end_time for end_time, _ in self.heap)
+        self._heap_snapshot = None
+        if log:
+            self._heap_delta.extend(log)
+
+        # First meeting: NEW_ROOM + UPDATE_HEAP; later ones check the heap
+        # first, then reuse a room or open one (NEW_ROOM + UPDATE_HEAP)
+        self._skip_steps({
+            'NEW_ROOM': self.rooms_used,
+            'UPDATE_HEAP': self.rooms_used,
+            'CHECK_EARLIEST_END': count - 1,
+            'ALLOCATE_ROOM': count - self.rooms_used
+        })
+
     def get_prediction_points(self) -> List[Dict[str, Any]]:
         """
         Identify prediction opportunities for active learning.
@@ -502,9 +676,10 @@ class MeetingRoomsTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("CHECK_EARLIEST_END"):
+            step = self.trace[i]
             # Prediction opportunity: Right after checking earliest end, before decision
-            if step.type == "CHECK_EARLIEST_END" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 interval_start = step.data['interval_start']
                 heap_top = step.data['heap_top']
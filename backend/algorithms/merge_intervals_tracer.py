@@ -9,15 +9,23 @@ VERSION: 2.2 - Bug Fix: Mutable Reference in Trace Data
 - FIXED: Line 395 - Create copy of last_merged to prevent retroactive mutation
 - Previous bug: Trace recorded reference to list that was later mutated
 - Impact: Step 1 showed post-merge state ([1,6]) instead of pre-merge state ([1,3])
+
+Large inputs: interval states live in an IntervalStateTable (see
+interval_sweep.py) and only intervals near the moving boundaries are
+re-examined per step. At 'summary' granularity or in 'result_only' mode
+all but the last interval are merged with merge_sweep() instead of
+emitting skipped steps.
 """
 
 from typing import Any, List, Dict
 
 try:
     from .base_tracer import AlgorithmTracer
+    from .interval_sweep import IntervalColumns, IntervalStateTable, MERGED, merge_sweep
 except ImportError:
     # For standalone testing
     from algorithms.base_tracer import AlgorithmTracer
+    from algorithms.interval_sweep import IntervalColumns, IntervalStateTable, MERGED, merge_sweep
 
 
 class MergeIntervalsTracer(AlgorithmTracer):
@@ -32,6 +40,10 @@ class MergeIntervalsTracer(AlgorithmTracer):
     Prediction points ask: "Will this interval merge with the last one or start new?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'ADD_NEW'})
+    DECISION_STEP_TYPES = frozenset({'MERGE', 'ADD_NEW'})
+    INTERVAL_STATES = ('pending', 'examining', 'merged', 'new_interval')
+
     def __init__(self):
         super().__init__()
         self.intervals = []
@@ -39,6 +51,8 @@ class MergeIntervalsTracer(AlgorithmTracer):
         self.merged = []
         self.current_interval = None
         self.current_index = None
+        self.interval_table = None
+        self.state_bounds = (0, 0, 0)
 
     def _get_visualization_state(self) -> dict:
         """
@@ -53,27 +67,16 @@ class MergeIntervalsTracer(AlgorithmTracer):
         if not self.sorted_intervals:
             return {}
 
-        # Build all_intervals with current states
-        all_intervals = []
-        for i, interval in enumerate(self.sorted_intervals):
-            interval_id = i + 1
-            start, end = interval
-
-            # Determine state
-            if self.current_index is not None and i == self.current_index:
-                state = 'examining'
-            elif i < (self.current_index if self.current_index is not None else 0):
-                # Already processed
-                state = 'merged' if self._was_merged(i) else 'new_interval'
-            else:
-                state = 'pending'
-
-            all_intervals.append({
-                'id': interval_id,
-                'start': start,
-                'end': end,
-                'state': state
-            })
+        # States are constant between the merged-count and current-index
+        # boundaries, so only positions a boundary moved across can change
+        processed = self.current_index if self.current_index is not None else 0
+        bounds = (len(self.merged), processed, processed + (self.current_index is not None))
+        size = len(self.sorted_intervals)
+        for old, new in zip(self.state_bounds, bounds):
+            for i in range(min(old, new), min(max(old, new) + 1, size)):
+                self.interval_table.set(i, self._interval_state(i))
+        self.state_bounds = bounds
+        all_intervals = self.interval_table.views()
 
         # Build call stack state
         call_stack_state = []
@@ -91,6 +94,15 @@ class MergeIntervalsTracer(AlgorithmTracer):
             'pending_count': len(self.sorted_intervals) - (self.current_index + 1 if self.current_index is not None else 0)
         }
 
+    def _interval_state(self, i: int) -> str:
+        """Determine the visualization state of the interval at sorted index i."""
+        if self.current_index is not None and i == self.current_index:
+            return 'examining'
+        if i < (self.current_index if self.current_index is not None else 0):
+            # Already processed
+            return 'merged' if self._was_merged(i) else 'new_interval'
+        return 'pending'
+
     def _was_merged(self, index: int) -> bool:
         """Check if interval at index was merged (not added as new)."""
         # This is a helper for visualization state determination
@@ -352,7 +364,14 @@ class MergeIntervalsTracer(AlgorithmTracer):
         }
 
         # Step 1: Sort intervals by start time
-        self.sorted_intervals = sorted(self.intervals, key=lambda x: x[0])
+        columns = IntervalColumns([x[0] for x in self.intervals], [x[1] for x in self.intervals])
+        self.sorted_intervals = [self.intervals[i] for i in columns.order]
+        self.interval_table = IntervalStateTable(
+            [{'id': i + 1, 'start': start, 'end': end} for i, (start, end) in enumerate(self.sorted_intervals)],
+            self.INTERVAL_STATES,
+            'pending'
+        )
+        self.state_bounds = (0, 0, 0)
 
         self._add_step(
             "SORT_INTERVALS",
@@ -365,9 +384,25 @@ class MergeIntervalsTracer(AlgorithmTracer):
 
         # Initialize merged list with first interval
         self.merged = [list(self.sorted_intervals[0])]
+        first = 1
+
+        # At summary granularity (or in result_only mode) only the last
+        # interval's steps can be recorded: sweep through the rest without
+        # building step data
+        if self._records_end_steps_only and len(self.sorted_intervals) > 2:
+            first = len(self.sorted_intervals) - 1
+            self.merged, classes = merge_sweep(columns.starts, columns.ends, first)
+            merge_count = classes.count(MERGED)
+            decisions = {'MERGE': merge_count, 'ADD_NEW': first - 1 - merge_count}
+            first_decision = 'MERGE' if classes[1] == MERGED else 'ADD_NEW'
+            self._skip_steps({
+                'COMPARE_OVERLAP': first - 1,
+                first_decision: decisions.pop(first_decision),
+                **decisions
+            })
 
         # Step 2: Process each interval
-        for i in range(1, len(self.sorted_intervals)):
+        for i in range(first, len(self.sorted_intervals)):
             self.current_index = i
             self.current_interval = self.sorted_intervals[i]
             current_start, current_end = self.current_interval
@@ -439,9 +474,10 @@ class MergeIntervalsTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("COMPARE_OVERLAP"):
+            step = self.trace[i]
             # Prediction opportunity: Right after COMPARE_OVERLAP, before decision
-            if step.type == "COMPARE_OVERLAP" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 current = step.data['current_interval']
                 last_merged = step.data['last_merged']
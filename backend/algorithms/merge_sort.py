@@ -9,6 +9,15 @@ VERSION: 1.0 - Backend Checklist v2.2 Compliance
 - Complete narrative generation with arithmetic verification
 - Frontend visualization hints included
 - Algorithm info file integration
+
+Optional input 'representation': 'ranges' sorts one working buffer in place
+with a single auxiliary merge buffer. Step data then holds inclusive
+[start, end] index ranges ('<field>_range') instead of copied lists, and
+call_stack_state entries omit 'array'.
+
+Optional input 'strategy': 'bottom-up' replaces the recursion with
+iterative passes that merge adjacent runs of doubling width, emitting the
+same MERGE_* steps (there are no SPLIT_ARRAY or BASE_CASE steps).
 """
 
 from typing import Any, List, Dict
@@ -28,9 +37,18 @@ class MergeSortTracer(AlgorithmTracer):
     Prediction points ask: "Which element will be selected first in this merge?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'MERGE_COMPLETE'})
+    DECISION_STEP_TYPES = frozenset({'MERGE_TAKE_LEFT', 'MERGE_TAKE_RIGHT'})
+    REPRESENTATIONS = ('lists', 'ranges')
+    STRATEGIES = ('top-down', 'bottom-up')
+
     def __init__(self):
         super().__init__()
         self.original_array = []
+        self.representation = 'lists'
+        self.strategy = 'top-down'
+        self.buffer = []
+        self.aux = []
         self.call_stack = []
         self.next_call_id = 0
         self.comparison_count = 0
@@ -47,7 +65,7 @@ class MergeSortTracer(AlgorithmTracer):
         # Build intervals representing array segments at each recursion level
         intervals = []
         for call in self.call_stack:
-            if call['array']:
+            if call.get('array', True):
                 intervals.append({
                     'id': f"call_{call['id']}",
                     'start': call['start_index'],
@@ -58,16 +76,18 @@ class MergeSortTracer(AlgorithmTracer):
                 })
 
         # Build call stack state
-        call_stack_state = [
-            {
+        call_stack_state = []
+        for call in self.call_stack:
+            call_state = {
                 'id': f"call_{call['id']}",
                 'is_active': call['status'] in ['splitting', 'merging'],
                 'depth': call['depth'],
-                'operation': call['operation'],
-                'array': call['array']
+                'operation': call['operation']
             }
-            for call in self.call_stack
-        ]
+            # Range calls carry no copy of their segment
+            if 'array' in call:
+                call_state['array'] = call['array']
+            call_stack_state.append(call_state)
 
         return {
             'all_intervals': intervals,
@@ -81,6 +101,22 @@ class MergeSortTracer(AlgorithmTracer):
         colors = ['blue', 'green', 'amber', 'purple', 'red', 'orange', 'pink', 'cyan']
         return colors[depth % len(colors)]
 
+    @staticmethod
+    def _segment(data: dict, key: str) -> Any:
+        """Step field as a list, or as 'arr[start..end]' for range steps."""
+        if key in data:
+            return data[key]
+        start, end = data[f'{key}_range']
+        return f"arr[{start}..{end}]" if start <= end else []
+
+    @staticmethod
+    def _segment_size(data: dict, key: str) -> int:
+        """Length of a list step field or of its range counterpart."""
+        if key in data:
+            return len(data[key])
+        start, end = data[f'{key}_range']
+        return end - start + 1
+
     def generate_narrative(self, trace_result: dict) -> str:
         """
         Generate human-readable narrative from Merge Sort trace.
@@ -134,36 +170,40 @@ class MergeSortTracer(AlgorithmTracer):
                 narrative += f"**Configuration:**\n"
                 narrative += f"- Input: {data['array']}\n"
                 narrative += f"- Size: {data['size']} elements\n"
-                narrative += f"- Strategy: Recursive divide-and-conquer\n"
+                if metadata.get('strategy') == 'bottom-up':
+                    narrative += f"- Strategy: Iterative bottom-up merging (run width doubles each pass)\n"
+                else:
+                    narrative += f"- Strategy: Recursive divide-and-conquer\n"
                 narrative += f"- Time Complexity: O(n log n)\n\n"
 
             elif step_type == "SPLIT_ARRAY":
-                array = data['array']
-                left = data['left_half']
-                right = data['right_half']
+                array = self._segment(data, 'array')
+                size = self._segment_size(data, 'array')
+                left = self._segment(data, 'left_half')
+                right = self._segment(data, 'right_half')
                 mid = data['mid_index']
 
                 narrative += f"{indent}**Split Decision:**\n"
                 narrative += f"{indent}- Array: {array}\n"
-                narrative += f"{indent}- Mid-point calculation: `mid = {len(array)} // 2 = {mid}`\n"
+                narrative += f"{indent}- Mid-point calculation: `mid = {size} // 2 = {mid}`\n"
                 narrative += f"{indent}- Left half: {left} (indices [0:{mid}])\n"
-                narrative += f"{indent}- Right half: {right} (indices [{mid}:{len(array)}])\n\n"
+                narrative += f"{indent}- Right half: {right} (indices [{mid}:{size}])\n\n"
 
                 narrative += f"{indent}**Why split here?** Divide-and-conquer strategy: "
                 narrative += f"split roughly in half until we reach single elements (base case).\n\n"
 
             elif step_type == "BASE_CASE":
-                array = data['array']
+                array = self._segment(data, 'array')
                 depth = data['depth']
 
                 narrative += f"{indent}**Base Case Reached** (Depth {depth})\n\n"
                 narrative += f"{indent}- Array: {array}\n"
-                narrative += f"{indent}- Size: {len(array)} element(s)\n"
+                narrative += f"{indent}- Size: {self._segment_size(data, 'array')} element(s)\n"
                 narrative += f"{indent}- Decision: Single element is already sorted, return as-is\n\n"
 
             elif step_type == "MERGE_START":
-                left = data['left']
-                right = data['right']
+                left = self._segment(data, 'left')
+                right = self._segment(data, 'right')
                 depth = data['depth']
 
                 narrative += f"{indent}**Merge Operation Begins** (Depth {depth})\n\n"
@@ -187,8 +227,8 @@ class MergeSortTracer(AlgorithmTracer):
 
             elif step_type == "MERGE_TAKE_LEFT":
                 value = data['value']
-                remaining_left = data['remaining_left']
-                remaining_right = data['remaining_right']
+                remaining_left = self._segment(data, 'remaining_left')
+                remaining_right = self._segment(data, 'remaining_right')
 
                 narrative += f"{indent}**Take from Left:**\n"
                 narrative += f"{indent}- Value taken: {value}\n"
@@ -197,8 +237,8 @@ class MergeSortTracer(AlgorithmTracer):
 
             elif step_type == "MERGE_TAKE_RIGHT":
                 value = data['value']
-                remaining_left = data['remaining_left']
-                remaining_right = data['remaining_right']
+                remaining_left = self._segment(data, 'remaining_left')
+                remaining_right = self._segment(data, 'remaining_right')
 
                 narrative += f"{indent}**Take from Right:**\n"
                 narrative += f"{indent}- Value taken: {value}\n"
@@ -207,7 +247,7 @@ class MergeSortTracer(AlgorithmTracer):
 
             elif step_type == "MERGE_REMAINDER":
                 source = data['source']
-                values = data['values']
+                values = self._segment(data, 'values')
 
                 narrative += f"{indent}**Append Remainder:**\n"
                 narrative += f"{indent}- Source: {source} array\n"
@@ -215,12 +255,12 @@ class MergeSortTracer(AlgorithmTracer):
                 narrative += f"{indent}- Reason: Other array exhausted, copy rest directly\n\n"
 
             elif step_type == "MERGE_COMPLETE":
-                merged = data['merged_array']
+                merged = self._segment(data, 'merged_array')
                 depth = data['depth']
 
                 narrative += f"{indent}**Merge Complete** (Depth {depth})\n\n"
                 narrative += f"{indent}- Result: {merged}\n"
-                narrative += f"{indent}- Size: {len(merged)} elements\n"
+                narrative += f"{indent}- Size: {self._segment_size(data, 'merged_array')} elements\n"
                 narrative += f"{indent}- Status: Sorted subarray ready for parent merge\n\n"
 
             elif step_type == "ALGORITHM_COMPLETE":
@@ -304,8 +344,10 @@ class MergeSortTracer(AlgorithmTracer):
         Execute merge sort algorithm with complete trace generation.
 
         Args:
-            input_data: dict with key:
+            input_data: dict with keys:
                 - 'array': List of integers to sort
+                - 'representation': Optional, 'lists' (default) or 'ranges'
+                - 'strategy': Optional, 'top-down' (default) or 'bottom-up'
 
         Returns:
             Standardized trace result with:
@@ -336,6 +378,20 @@ class MergeSortTracer(AlgorithmTracer):
         except:
             raise ValueError("Array elements must be numbers")
 
+        self.representation = input_data.get('representation', 'lists')
+        if self.representation not in self.REPRESENTATIONS:
+            raise ValueError(
+                f"Invalid representation '{self.representation}'. "
+                f"Expected one of: {', '.join(self.REPRESENTATIONS)}"
+            )
+
+        self.strategy = input_data.get('strategy', 'top-down')
+        if self.strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy '{self.strategy}'. "
+                f"Expected one of: {', '.join(self.STRATEGIES)}"
+            )
+
         # Initialize state
         self.call_stack = []
         self.next_call_id = 0
@@ -354,6 +410,10 @@ class MergeSortTracer(AlgorithmTracer):
             },
             'input_size': len(self.original_array)
         }
+        if self.representation != 'lists':
+            self.metadata['representation'] = self.representation
+        if self.strategy != 'top-down':
+            self.metadata['strategy'] = self.strategy
 
         # Initial state
         self._add_step(
@@ -365,8 +425,17 @@ class MergeSortTracer(AlgorithmTracer):
             f"🔄 Starting Merge Sort on array of {len(self.original_array)} elements"
         )
 
-        # Execute merge sort recursively
-        sorted_array = self._merge_sort_recursive(self.original_array, 0, 0)
+        # Execute merge sort
+        if self.strategy == 'bottom-up' or self.representation == 'ranges':
+            self.buffer = self.original_array.copy()
+            self.aux = [None] * len(self.buffer)
+            if self.strategy == 'bottom-up':
+                self._merge_sort_bottom_up()
+            else:
+                self._merge_sort_ranges(0, len(self.buffer) - 1, 0)
+            sorted_array = self.buffer
+        else:
+            sorted_array = self._merge_sort_recursive(self.original_array, 0, 0)
 
         # Final step
         self._add_step(
@@ -607,6 +676,240 @@ class MergeSortTracer(AlgorithmTracer):
 
         return result
 
+    def _segment_field(self, key: str, start: int, end: int, source: List[Any]) -> dict:
+        """
+        Step field for source[start..end]: a list copy under 'key', or an
+        inclusive [start, end] range under '<key>_range' in range mode.
+        """
+        if self.representation == 'ranges':
+            return {f'{key}_range': [start, end]}
+        return {key: source[start:end + 1]}
+
+    def _segment_text(self, start: int, end: int, source: List[Any]) -> str:
+        """Description text for source[start..end] (values, or the range)."""
+        if self.representation == 'ranges':
+            return f"arr[{start}..{end}]" if start <= end else "[]"
+        return str(source[start:end + 1])
+
+    def _merge_sort_ranges(self, start: int, end: int, depth: int) -> None:
+        """
+        Sort self.buffer[start..end] (inclusive) in place with trace generation.
+
+        Mirrors _merge_sort_recursive step for step, but step data and call
+        stack entries reference index ranges instead of list copies.
+
+        Args:
+            start: First index of the segment
+            end: Last index of the segment
+            depth: Current recursion depth
+        """
+        call_id = self.next_call_id
+        self.next_call_id += 1
+
+        call_info = {
+            'id': call_id,
+            'depth': depth,
+            'start_index': start,
+            'end_index': end,
+            'status': 'complete',
+            'operation': 'base_case'
+        }
+
+        # Base case: single element
+        if start == end:
+            self.call_stack.append(call_info)
+            self._add_step(
+                "BASE_CASE",
+                {
+                    'array_range': [start, end],
+                    'depth': depth,
+                    'call_id': call_id
+                },
+                f"Base case: arr[{start}] = {self.buffer[start]} has 1 element(s), already sorted"
+            )
+            self.call_stack.pop()
+            return
+
+        mid = (end - start + 1) // 2
+        split = start + mid
+
+        call_info['status'] = 'splitting'
+        call_info['operation'] = 'split'
+        self.call_stack.append(call_info)
+
+        self._add_step(
+            "SPLIT_ARRAY",
+            {
+                'array_range': [start, end],
+                'left_half_range': [start, split - 1],
+                'right_half_range': [split, end],
+                'mid_index': mid,
+                'depth': depth,
+                'call_id': call_id
+            },
+            f"Split arr[{start}..{end}] into arr[{start}..{split - 1}] and arr[{split}..{end}]"
+        )
+
+        self._merge_sort_ranges(start, split - 1, depth + 1)
+        self._merge_sort_ranges(split, end, depth + 1)
+
+        call_info['status'] = 'merging'
+        call_info['operation'] = 'merge'
+        self._merge_call(call_id, start, split, end, depth)
+
+        call_info['status'] = 'complete'
+        self.call_stack.pop()
+
+    def _merge_sort_bottom_up(self) -> None:
+        """
+        Iterative bottom-up merge sort of self.buffer with trace generation.
+
+        Pass p merges adjacent sorted runs of width 2**p, left to right; a
+        trailing run without a partner waits for the next pass. There are no
+        splits or base cases, only the merge steps. Each merge reports the
+        depth its top-down counterpart would have (the final merge is depth
+        0). Uses no recursion, so input size is bounded only by MAX_STEPS.
+        """
+        size = len(self.buffer)
+        passes = (size - 1).bit_length()
+        width = 1
+
+        for level in range(passes):
+            depth = passes - 1 - level
+            for start in range(0, size - width, 2 * width):
+                split = start + width
+                end = min(start + 2 * width, size) - 1
+
+                call_id = self.next_call_id
+                self.next_call_id += 1
+                call_info = {
+                    'id': call_id,
+                    'depth': depth,
+                    'start_index': start,
+                    'end_index': end,
+                    'status': 'merging',
+                    'operation': 'merge'
+                }
+                if self.representation == 'lists':
+                    call_info['array'] = self.buffer[start:end + 1]
+                self.call_stack.append(call_info)
+
+                self._merge_call(call_id, start, split, end, depth)
+
+                call_info['status'] = 'complete'
+                self.call_stack.pop()
+            width *= 2
+
+    def _merge_call(self, call_id: int, start: int, split: int, end: int, depth: int) -> None:
+        """Record MERGE_START, merge buffer[start..end] in place, record MERGE_COMPLETE."""
+        buffer = self.buffer
+        self._add_step(
+            "MERGE_START",
+            {
+                **self._segment_field('left', start, split - 1, buffer),
+                **self._segment_field('right', split, end, buffer),
+                'depth': depth,
+                'call_id': call_id
+            },
+            f"Merge sorted arrays {self._segment_text(start, split - 1, buffer)} "
+            f"and {self._segment_text(split, end, buffer)}"
+        )
+
+        self._merge_ranges(start, split, end, depth)
+        self.merge_count += 1
+
+        self._add_step(
+            "MERGE_COMPLETE",
+            {
+                **self._segment_field('merged_array', start, end, buffer),
+                'depth': depth,
+                'call_id': call_id
+            },
+            f"Merged result: {self._segment_text(start, end, buffer)}"
+        )
+
+    def _merge_ranges(self, start: int, split: int, end: int, depth: int) -> None:
+        """
+        Merge sorted runs buffer[start..split-1] and buffer[split..end] in place.
+
+        The segment is copied into the same positions of self.aux and merged
+        back into self.buffer. 'remaining_*' and 'values' ranges index the
+        pre-merge positions (held in self.aux).
+
+        Args:
+            start: First index of the left run
+            split: First index of the right run
+            end: Last index of the right run
+            depth: Current recursion depth
+        """
+        buffer, aux = self.buffer, self.aux
+        aux[start:end + 1] = buffer[start:end + 1]
+        i, j, k = start, split, start
+
+        while i < split and j <= end:
+            self.comparison_count += 1
+
+            left_val = aux[i]
+            right_val = aux[j]
+            chose = 'left' if left_val <= right_val else 'right'
+
+            self._add_step(
+                "MERGE_COMPARE",
+                {
+                    'left_value': left_val,
+                    'right_value': right_val,
+                    'chose': chose,
+                    'left_index': i - start,
+                    'right_index': j - split,
+                    'depth': depth
+                },
+                f"Compare {left_val} ≤ {right_val}: take {left_val} from left" if chose == 'left'
+                else f"Compare {left_val} > {right_val}: take {right_val} from right"
+            )
+
+            if chose == 'left':
+                buffer[k] = left_val
+                i += 1
+            else:
+                buffer[k] = right_val
+                j += 1
+            k += 1
+
+            self._add_step(
+                "MERGE_TAKE_LEFT" if chose == 'left' else "MERGE_TAKE_RIGHT",
+                {
+                    'value': buffer[k - 1],
+                    **self._segment_field('remaining_left', i, split - 1, aux),
+                    **self._segment_field('remaining_right', j, end, aux),
+                    'depth': depth
+                },
+                f"Added {buffer[k - 1]} to result from {chose} array"
+            )
+
+        if i < split:
+            self._add_step(
+                "MERGE_REMAINDER",
+                {
+                    'source': 'left',
+                    **self._segment_field('values', i, split - 1, aux),
+                    'depth': depth
+                },
+                f"Right exhausted: append remaining left elements {self._segment_text(i, split - 1, aux)}"
+            )
+            buffer[k:end + 1] = aux[i:split]
+
+        if j <= end:
+            # The right remainder is already in its final positions (k == j)
+            self._add_step(
+                "MERGE_REMAINDER",
+                {
+                    'source': 'right',
+                    **self._segment_field('values', j, end, aux),
+                    'depth': depth
+                },
+                f"Left exhausted: append remaining right elements {self._segment_text(j, end, aux)}"
+            )
+
     def get_prediction_points(self) -> List[Dict[str, Any]]:
         """
         Identify prediction opportunities for active learning.
@@ -618,11 +921,12 @@ class MergeSortTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("MERGE_START"):
+            step = self.trace[i]
             # Prediction opportunity: Right before merge comparison
-            if step.type == "MERGE_START" and i + 1 < len(self.trace):
-                left = step.data['left']
-                right = step.data['right']
+            if i + 1 < len(self.trace):
+                left = self._segment(step.data, 'left')
+                right = self._segment(step.data, 'right')
 
                 if not left or not right:
                     continue  # Skip if either array is empty
@@ -632,8 +936,9 @@ class MergeSortTracer(AlgorithmTracer):
                     next_step = self.trace[i + 1]
                     correct_answer = next_step.data['chose']
 
-                    left_val = left[0]
-                    right_val = right[0]
+                    # Front elements (the first comparison's operands)
+                    left_val = next_step.data['left_value']
+                    right_val = next_step.data['right_value']
 
                     predictions.append({
                         'step_index': i,
@@ -8,10 +8,18 @@ VERSION: 2.5 - Backend Checklist v2.2 Compliance
 - Added Frontend Visualization Hints section to narrative
 - Follows Universal Pedagogical Principles
 - Shows explicit arithmetic and comparisons
+
+Partitions are processed from an explicit stack rather than by recursion,
+so large (or already sorted) inputs cannot hit Python's recursion limit.
+Optional input 'pivot_strategy' picks the pivot ('last' by default,
+'median-of-three', or 'random' with an optional integer 'seed'); the
+chosen pivot is swapped to the end so partitioning stays Lomuto.
 """
 
+import random
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states
 
 
 class QuickSortTracer(AlgorithmTracer):
@@ -27,10 +35,16 @@ class QuickSortTracer(AlgorithmTracer):
     Prediction points ask: "Will this element be swapped with the pivot region?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'PARTITION_DONE'})
+    DECISION_STEP_TYPES = frozenset({'SWAP'})
+    PIVOT_STRATEGIES = ('last', 'median-of-three', 'random')
+
     def __init__(self):
         super().__init__()
         self.array = []
         self.original_array = []
+        self.pivot_strategy = 'last'
+        self.rng = random.Random(0)
         self.recursion_depth = 0
         self.max_depth = 0
         self.swap_count = 0
@@ -52,34 +66,30 @@ class QuickSortTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'recursion_depth': self.recursion_depth,
             'swap_count': self.swap_count,
             'comparison_count': self.comparison_count
         }
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine visual state of array element at given index."""
+    def _get_element_states(self) -> List[str]:
+        """Determine visual state of every array element."""
         # Default state tracking - will be overridden by step-specific data
-        return 'unsorted'
+        return paint_states(len(self.array), 'unsorted', ())
 
-    def _quick_sort_recursive(self, low: int, high: int):
+    def _quick_sort_iterative(self):
         """
-        Recursive Quick Sort implementation with trace generation.
+        Quick Sort over an explicit stack of (low, high, depth) subarrays.
 
-        Args:
-            low: Starting index of subarray
-            high: Ending index of subarray
+        The left partition is popped before the right one, so steps come in
+        the same order (and with the same depths) as the recursive
+        formulation. Subarrays of size < 2 are never pushed.
         """
-        if low < high:
-            self.recursion_depth += 1
+        stack = [(0, len(self.array) - 1, 1)]
+
+        while stack:
+            low, high, depth = stack.pop()
+            self.recursion_depth = depth
             self.max_depth = max(self.max_depth, self.recursion_depth)
 
             # Record recursive call
@@ -98,13 +108,22 @@ class QuickSortTracer(AlgorithmTracer):
             # Partition the array
             pivot_index = self._partition(low, high)
 
-            # Recursively sort left partition
-            self._quick_sort_recursive(low, pivot_index - 1)
+            # Push right partition first so the left one is sorted first
+            if pivot_index + 1 < high:
+                stack.append((pivot_index + 1, high, depth + 1))
+            if low < pivot_index - 1:
+                stack.append((low, pivot_index - 1, depth + 1))
 
-            # Recursively sort right partition
-            self._quick_sort_recursive(pivot_index + 1, high)
+        self.recursion_depth = 0
 
-            self.recursion_depth -= 1
+    def _choose_pivot(self, low: int, high: int) -> int:
+        """Return the index of the pivot for subarray[low..high]."""
+        if self.pivot_strategy == 'median-of-three':
+            mid = (low + high) // 2
+            return sorted((self.array[i], i) for i in (low, mid, high))[1][1]
+        if self.pivot_strategy == 'random':
+            return self.rng.randint(low, high)
+        return high
 
     def _partition(self, low: int, high: int) -> int:
         """
@@ -125,6 +144,31 @@ class QuickSortTracer(AlgorithmTracer):
             Final pivot index after partitioning
         """
         self.partition_count += 1
+
+        chosen_index = self._choose_pivot(low, high)
+        if chosen_index != high:
+            value_at_chosen = self.array[chosen_index]
+            value_at_high = self.array[high]
+
+            # Move the chosen pivot to the end for Lomuto partitioning
+            self.array[chosen_index], self.array[high] = self.array[high], self.array[chosen_index]
+            self.swap_count += 1
+
+            self._add_step(
+                "SWAP",
+                {
+                    'index1': chosen_index,
+                    'value1': value_at_chosen,  # Value BEFORE swap (pivot)
+                    'index2': high,
+                    'value2': value_at_high,  # Value BEFORE swap
+                    'reason': 'move_pivot_to_end',
+                    'pivot_strategy': self.pivot_strategy,
+                    'low': low,
+                    'high': high
+                },
+                f"🔄 {self.pivot_strategy} pivot arr[{chosen_index}] = {value_at_chosen}: swap arr[{chosen_index}] ↔ arr[{high}] to move it to the end"
+            )
+
         pivot_value = self.array[high]
         pivot_index = high
 
@@ -297,7 +341,11 @@ class QuickSortTracer(AlgorithmTracer):
         narrative += f"**Algorithm:** {metadata['display_name']}\n"
         narrative += f"**Input Array:** {self.original_array}\n"
         narrative += f"**Array Size:** {metadata['input_size']} elements\n"
-        narrative += f"**Partition Scheme:** Lomuto (pivot = last element)\n\n"
+        pivot_strategy = metadata.get('pivot_strategy', 'last')
+        if pivot_strategy == 'last':
+            narrative += f"**Partition Scheme:** Lomuto (pivot = last element)\n\n"
+        else:
+            narrative += f"**Partition Scheme:** Lomuto ({pivot_strategy} pivot, moved to the last position)\n\n"
 
         narrative += f"**Final Result:** {result['sorted_array']}\n"
         narrative += f"**Performance Metrics:**\n"
@@ -410,6 +458,10 @@ class QuickSortTracer(AlgorithmTracer):
                 elif reason == 'pivot_already_in_position':
                     narrative += f"- **Action:** No swap needed\n"
                     narrative += f"- **Reason:** Pivot {val1} already in final position\n\n"
+                elif reason == 'move_pivot_to_end':
+                    narrative += f"- **Action:** Swap arr[{idx1}] ↔ arr[{idx2}]\n"
+                    narrative += f"- **Reason:** {data['pivot_strategy']} strategy chose {val1} as pivot; Lomuto partitioning expects the pivot last\n"
+                    narrative += f"- **Result:** Pivot {val1} now at index {idx2}\n\n"
 
             elif step_type == "PARTITION_DONE":
                 pivot_idx = data['pivot_index']
@@ -535,8 +587,10 @@ class QuickSortTracer(AlgorithmTracer):
         Execute Quick Sort algorithm with trace generation.
 
         Args:
-            input_data: dict with key:
+            input_data: dict with keys:
                 - 'array': List of integers to sort
+                - 'pivot_strategy': Optional, one of PIVOT_STRATEGIES (default 'last')
+                - 'seed': Optional integer seed for the 'random' strategy (default 0)
 
         Returns:
             Standardized trace result with:
@@ -562,6 +616,17 @@ class QuickSortTracer(AlgorithmTracer):
         if len(self.array) < 2:
             raise ValueError("Array must have at least 2 elements")
 
+        self.pivot_strategy = input_data.get('pivot_strategy', 'last')
+        if self.pivot_strategy not in self.PIVOT_STRATEGIES:
+            raise ValueError(
+                f"Invalid pivot_strategy '{self.pivot_strategy}'. "
+                f"Expected one of: {', '.join(self.PIVOT_STRATEGIES)}"
+            )
+        seed = input_data.get('seed', 0)
+        if isinstance(seed, bool) or not isinstance(seed, int):
+            raise ValueError(f"seed must be an integer, got {seed!r}")
+        self.rng = random.Random(seed)
+
         # Initialize counters
         self.recursion_depth = 0
         self.max_depth = 0
@@ -589,6 +654,10 @@ class QuickSortTracer(AlgorithmTracer):
             },
             'input_size': len(self.array)
         }
+        if self.pivot_strategy != 'last':
+            self.metadata['pivot_strategy'] = self.pivot_strategy
+        if self.pivot_strategy == 'random':
+            self.metadata['seed'] = seed
 
         # Initial state
         self._add_step(
@@ -603,7 +672,7 @@ class QuickSortTracer(AlgorithmTracer):
         )
 
         # Execute Quick Sort
-        self._quick_sort_recursive(0, len(self.array) - 1)
+        self._quick_sort_iterative()
 
         # Build result
         return self._build_trace_result({
@@ -626,9 +695,10 @@ class QuickSortTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("COMPARE"):
+            step = self.trace[i]
             # Prediction opportunity: Right after comparison, before swap decision
-            if step.type == "COMPARE" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
 
                 if next_step.type == "SWAP":
@@ -503,7 +503,19 @@ def register_algorithms():
                         "minItems": 1,
                         "maxItems": 12,
                         "description": "Array of numbers to sort (8-12 elements recommended)",
-                    }
+                    },
+                    "representation": {
+                        "type": "string",
+                        "enum": ["lists", "ranges"],
+                        "default": "lists",
+                        "description": "Step data as list copies, or as index ranges over one working buffer",
+                    },
+                    "strategy": {
+                        "type": "string",
+                        "enum": ["top-down", "bottom-up"],
+                        "default": "top-down",
+                        "description": "Recursive splitting, or iterative merging of runs of doubling width",
+                    },
                 },
             },
         )
@@ -551,7 +563,7 @@ def register_algorithms():
                         "type": "array",
                         "items": {"type": "string"},
                         "minItems": 1,
-                        "maxItems": 20,
+                        "maxItems": 100,
                         "description": "List of node identifiers",
                     },
                     "edges": {
@@ -651,7 +663,7 @@ def register_algorithms():
                         "type": "array",
                         "items": {"type": "string"},
                         "minItems": 1,
-                        "maxItems": 20,
+                        "maxItems": 100,
                         "description": "List of node identifiers",
                     },
                     "edges": {
@@ -960,6 +972,12 @@ def register_algorithms():
                         "minItems": 1,
                         "maxItems": 20,
                         "description": "List of integers",
+                    },
+                    "state_updates": {
+                        "type": "string",
+                        "enum": ["full", "delta"],
+                        "default": "full",
+                        "description": "Per-step state; delta records tail updates and parent pointers instead of tails copies",
                     }
                 },
             },
@@ -1009,6 +1027,12 @@ def register_algorithms():
                         "minItems": 1,
                         "maxItems": 20,
                         "description": "List of [start, end] time intervals",
+                    },
+                    "state_updates": {
+                        "type": "string",
+                        "enum": ["full", "delta"],
+                        "default": "full",
+                        "description": "Per-step visualization; delta sends heap operations and changed intervals after the first step",
                     }
                 },
             },
@@ -1096,7 +1120,18 @@ def register_algorithms():
                         "minItems": 1,
                         "maxItems": 20,
                         "description": "List of integers to sort",
-                    }
+                    },
+                    "pivot_strategy": {
+                        "type": "string",
+                        "enum": ["last", "median-of-three", "random"],
+                        "default": "last",
+                        "description": "Pivot choice; median-of-three and random avoid quadratic traces on sorted input",
+                    },
+                    "seed": {
+                        "type": "integer",
+                        "default": 0,
+                        "description": "Random seed for the 'random' pivot strategy",
+                    },
                 },
             },
         )
@@ -1141,7 +1176,7 @@ def register_algorithms():
                         "type": "array",
                         "items": {"type": "string"},
                         "minItems": 1,
-                        "maxItems": 10,
+                        "maxItems": 100,
                         "description": "List of node identifiers",
                     },
                     "edges": {
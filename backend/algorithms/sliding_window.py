@@ -8,6 +8,7 @@ an efficient technique for processing contiguous blocks of data.
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 class SlidingWindowTracer(AlgorithmTracer):
     """
@@ -32,14 +33,12 @@ class SlidingWindowTracer(AlgorithmTracer):
         self.max_sum_start_index: int = 0
         self.is_complete: bool = False
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine the visual state of an array element."""
+    def _get_element_states(self) -> List[str]:
+        """Determine the visual state of every array element (later ranges win)."""
         window_end = self.window_start + self.k - 1
-        if self.window_start <= index <= window_end:
-            return 'in_window'
-        if index == window_end + 1 and not self.is_complete:
-            return 'next'
-        return 'unprocessed'
+        ranges = [] if self.is_complete else [point(window_end + 1, 'next')]
+        ranges.append((self.window_start, window_end + 1, 'in_window'))
+        return paint_states(len(self.array), 'unprocessed', ranges)
 
     def _get_visualization_state(self) -> dict:
         """Return current array state with element states, pointers, and metrics."""
@@ -47,14 +46,7 @@ class SlidingWindowTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'pointers': {
                 'window_start': self.window_start,
                 'window_end': self.window_start + self.k - 1,
@@ -154,32 +146,32 @@ class SlidingWindowTracer(AlgorithmTracer):
         """Identify prediction opportunities for each window slide."""
         predictions = []
         # REFACTOR: Trigger on the new 'SLIDE_WINDOW' step type
-        for i, step in enumerate(self.trace):
-            if step.type == "SLIDE_WINDOW":
-                data = step.data
-                outgoing = data['outgoing_element']['value']
-                incoming = data['incoming_element']['value']
-
-                correct_answer = ""
-                if incoming > outgoing:
-                    correct_answer = "increase"
-                elif incoming < outgoing:
-                    correct_answer = "decrease"
-                else:
-                    correct_answer = "stay_same"
-
-                predictions.append({
-                    'step_index': i,
-                    'question': f"The window will slide. The outgoing element is {outgoing} and the incoming is {incoming}. How will the sum change?",
-                    'choices': [
-                        {'id': 'increase', 'label': 'Increase'},
-                        {'id': 'decrease', 'label': 'Decrease'},
-                        {'id': 'stay_same', 'label': 'Stay the Same'}
-                    ],
-                    'hint': "Compare the value of the element entering the window with the one leaving.",
-                    'correct_answer': correct_answer,
-                    'explanation': f"Correct. Since the incoming element ({incoming}) is {'greater than' if correct_answer == 'increase' else 'less than' if correct_answer == 'decrease' else 'equal to'} the outgoing element ({outgoing}), the sum will {correct_answer.replace('_', ' ')}."
-                })
+        for i in self.step_indices("SLIDE_WINDOW"):
+            step = self.trace[i]
+            data = step.data
+            outgoing = data['outgoing_element']['value']
+            incoming = data['incoming_element']['value']
+
+            correct_answer = ""
+            if incoming > outgoing:
+                correct_answer = "increase"
+            elif incoming < outgoing:
+                correct_answer = "decrease"
+            else:
+                correct_answer = "stay_same"
+
+            predictions.append({
+                'step_index': i,
+                'question': f"The window will slide. The outgoing element is {outgoing} and the incoming is {incoming}. How will the sum change?",
+                'choices': [
+                    {'id': 'increase', 'label': 'Increase'},
+                    {'id': 'decrease', 'label': 'Decrease'},
+                    {'id': 'stay_same', 'label': 'Stay the Same'}
+                ],
+                'hint': "Compare the value of the element entering the window with the one leaving.",
+                'correct_answer': correct_answer,
+                'explanation': f"Correct. Since the incoming element ({incoming}) is {'greater than' if correct_answer == 'increase' else 'less than' if correct_answer == 'decrease' else 'equal to'} the outgoing element ({outgoing}), the sum will {correct_answer.replace('_', ' ')}."
+            })
         return predictions
 
     def _render_array_state_narrative(self, viz_data: dict) -> str:
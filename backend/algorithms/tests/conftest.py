@@ -263,6 +263,56 @@ class MaxStepsTracer(AlgorithmTracer):
         return narrative
 
 
+class PassTracer(AlgorithmTracer):
+    """
+    Tracer with pass structure for testing granularity.
+
+    Emits START, then per pass COMPARE x3 + PASS_COMPLETE, then a trailing
+    CHECK step (not a phase type). Counts visualization state requests.
+    """
+
+    PHASE_STEP_TYPES = frozenset({'PASS_COMPLETE'})
+
+    def __init__(self):
+        super().__init__()
+        self.comparisons = 0
+        self.viz_calls = 0
+
+    def execute(self, input_data: Any) -> dict:
+        """Execute the configured number of passes."""
+        self.metadata = {
+            "algorithm": "pass-test",
+            "visualization_type": "test"
+        }
+
+        passes = input_data.get("passes", 3)
+        self._add_step("START", {"passes": passes}, "Start")
+        for p in range(passes):
+            for _ in range(3):
+                self.comparisons += 1
+                self._add_step("COMPARE", {"pass": p}, f"Compare in pass {p}")
+            self._add_step("PASS_COMPLETE", {"pass": p}, f"Pass {p} complete")
+        self._add_step("CHECK", {"comparisons": self.comparisons}, "Final check")
+
+        return self._build_trace_result({"passes": passes})
+
+    def get_prediction_points(self) -> List[Dict[str, Any]]:
+        """Predict at every recorded pass completion."""
+        return [
+            {"step_index": i, "question": "Done?", "choices": ["yes"], "correct_answer": "yes"}
+            for i in self.step_indices("PASS_COMPLETE")
+        ]
+
+    def generate_narrative(self, trace_result: dict) -> str:
+        """Generate minimal narrative."""
+        return "\n".join(step['description'] for step in trace_result['trace']['steps'])
+
+    def _get_visualization_state(self) -> dict:
+        """Report comparisons so far."""
+        self.viz_calls += 1
+        return {"comparisons": self.comparisons}
+
+
 # =============================================================================
 # Pytest Fixtures
 # =============================================================================
@@ -291,6 +341,12 @@ def max_steps_tracer():
     return MaxStepsTracer()
 
 
+@pytest.fixture
+def pass_tracer():
+    """Provide a tracer with pass structure for granularity tests."""
+    return PassTracer()
+
+
 @pytest.fixture
 def sample_trace_step():
     """Provide a sample TraceStep for testing."""
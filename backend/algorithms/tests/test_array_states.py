@@ -0,0 +1,116 @@
+# backend/algorithms/tests/test_array_states.py
+"""
+Tests for bulk array-state encoding.
+
+Test Categories:
+1. paint_states range priority and clamping
+2. element_rows payload shape
+3. Run-length state encoding
+4. Array tracers emit painted states
+"""
+
+import pytest
+
+from algorithms.array_states import (
+    element_rows,
+    expand_state_runs,
+    paint_states,
+    point,
+    state_runs,
+)
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+
+
+@pytest.mark.unit
+class TestPaintStates:
+    """Ranges overwrite the default in order."""
+
+    def test_default_only(self):
+        """No ranges leaves every element at the default."""
+        assert paint_states(3, 'idle', []) == ['idle', 'idle', 'idle']
+
+    def test_later_ranges_win(self):
+        """Overlapping ranges resolve to the last one applied."""
+        states = paint_states(5, 'a', [(0, 4, 'b'), (2, 5, 'c'), point(0, 'd')])
+
+        assert states == ['d', 'b', 'c', 'c', 'c']
+
+    def test_out_of_bounds_ranges_are_clamped(self):
+        """Pointers at -1 or size do not paint anything or raise."""
+        states = paint_states(3, 'a', [point(-1, 'x'), point(3, 'y'), (-5, 1, 'z'), (2, 10, 'w')])
+
+        assert states == ['z', 'a', 'w']
+
+    def test_point_none_is_empty(self):
+        """An unset pointer produces an empty range."""
+        assert paint_states(2, 'a', [point(None, 'x')]) == ['a', 'a']
+
+
+@pytest.mark.unit
+class TestElementRows:
+    """element_rows builds the row-oriented array payload."""
+
+    def test_rows(self):
+        """Rows carry index, value and state in that key order."""
+        rows = element_rows([7, 8], ['x', 'y'])
+
+        assert rows == [
+            {'index': 0, 'value': 7, 'state': 'x'},
+            {'index': 1, 'value': 8, 'state': 'y'},
+        ]
+        assert list(rows[0]) == ['index', 'value', 'state']
+
+    def test_extra_columns(self):
+        """Extra columns follow 'state' in keyword order."""
+        rows = element_rows([0, 2], ['a', 'b'], color=['red', 'blue'], label=['p', 'q'])
+
+        assert rows[1] == {'index': 1, 'value': 2, 'state': 'b', 'color': 'blue', 'label': 'q'}
+        assert list(rows[1]) == ['index', 'value', 'state', 'color', 'label']
+
+    def test_empty(self):
+        """Empty arrays give no rows."""
+        assert element_rows([], []) == []
+
+
+@pytest.mark.unit
+class TestStateRuns:
+    """state_runs and expand_state_runs round-trip."""
+
+    def test_runs_are_maximal(self):
+        """Adjacent equal states merge into one half-open run."""
+        assert state_runs(['a', 'a', 'b', 'a']) == [[0, 2, 'a'], [2, 3, 'b'], [3, 4, 'a']]
+
+    @pytest.mark.parametrize('states', [[], ['a'], ['a', 'b', 'b', 'c', 'c', 'c', 'a']])
+    def test_round_trip(self, states):
+        """Expanding the runs restores the original list."""
+        assert expand_state_runs(state_runs(states)) == states
+
+
+@pytest.mark.integration
+class TestArrayTracersUsePaintedStates:
+    """Array tracers produce one row per element with consistent indices."""
+
+    @pytest.mark.parametrize('algorithm_name', [
+        'binary-search',
+        'sliding-window',
+        'two-pointer',
+        'kadanes-algorithm',
+        'dutch-national-flag',
+        'bubble-sort',
+        'insertion-sort',
+        'quick-sort',
+        'boyer-moore-voting',
+        'container-with-most-water',
+    ])
+    def test_rows_cover_array(self, algorithm_name):
+        """Every step's array rows are indexed 0..n-1 and carry a state."""
+        tracer = registry.get(algorithm_name)()
+        result = tracer.execute(generate_input(algorithm_name, 12, seed=7))
+
+        for step in result['trace']['steps']:
+            rows = step['data']['visualization'].get('array')
+            if not rows:
+                continue
+            assert [row['index'] for row in rows] == list(range(len(rows)))
+            assert all(isinstance(row['state'], str) for row in rows)
@@ -11,6 +11,9 @@ Test Categories:
 4. _serialize_value() (infinity handling)
 5. _build_trace_result() structure
 6. Trace timing and metadata
+7. Trace granularity (fine / phase / summary)
+8. Result-only mode
+9. Step-type index
 """
 
 import pytest
@@ -498,8 +501,212 @@ class TestTraceStepDataclass:
         assert step_dict["data"] == {"test": "data"}
         assert step_dict["description"] == "Test step description"
     
+    def test_trace_step_to_dict_is_shallow(self, sample_trace_step):
+        """to_dict() matches asdict() but shares the data dict instead of copying it."""
+        step_dict = sample_trace_step.to_dict()
+
+        assert step_dict == asdict(sample_trace_step)
+        assert list(step_dict) == ["step", "type", "timestamp", "data", "description"]
+        assert step_dict["data"] is sample_trace_step.data
+
+    def test_trace_step_has_no_instance_dict(self, sample_trace_step):
+        """TraceStep is slotted (no per-instance __dict__)."""
+        assert not hasattr(sample_trace_step, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_trace_step.extra = 1
+
     def test_trace_step_immutable_after_creation(self, sample_trace_step):
         """TraceStep fields can be modified (dataclass is mutable by default)."""
         # Note: dataclass is mutable unless frozen=True
         sample_trace_step.step = 99
-        assert sample_trace_step.step == 99
\ No newline at end of file
+        assert sample_trace_step.step == 99
+
+
+# =============================================================================
+# Test Group 10: Trace Granularity
+# =============================================================================
+
+@pytest.mark.unit
+class TestTraceGranularity:
+    """Test coarse-grained tracing via set_granularity()."""
+
+    def test_default_is_fine_and_unchanged(self, pass_tracer):
+        """Fine granularity records every step and adds no extra fields."""
+        result = pass_tracer.execute({"passes": 2})
+
+        assert result["trace"]["total_steps"] == 1 + 2 * 4 + 1
+        assert "granularity" not in result["metadata"]
+        assert "fine_steps" not in result["metadata"]
+        assert all("aggregated" not in step["data"] for step in result["trace"]["steps"])
+
+    def test_invalid_granularity_raises(self, pass_tracer):
+        """Unknown granularity values raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid granularity"):
+            pass_tracer.set_granularity("coarse")
+
+    def test_phase_keeps_first_phase_and_last_steps(self, pass_tracer):
+        """Phase granularity keeps the first step, each PASS_COMPLETE and the last step."""
+        pass_tracer.set_granularity("phase")
+        result = pass_tracer.execute({"passes": 3})
+        steps = result["trace"]["steps"]
+
+        assert [s["type"] for s in steps] == ["START"] + ["PASS_COMPLETE"] * 3 + ["CHECK"]
+        assert [s["step"] for s in steps] == list(range(5))
+        assert result["trace"]["total_steps"] == 5
+
+    def test_phase_steps_aggregate_skipped_steps(self, pass_tracer):
+        """Each recorded step counts itself and the steps folded into it."""
+        pass_tracer.set_granularity("phase")
+        result = pass_tracer.execute({"passes": 2})
+        steps = result["trace"]["steps"]
+
+        assert steps[0]["data"]["aggregated"] == {"fine_steps": 1, "step_types": {"START": 1}}
+        assert steps[1]["data"]["aggregated"] == {
+            "fine_steps": 4, "step_types": {"COMPARE": 3, "PASS_COMPLETE": 1}
+        }
+        assert steps[-1]["data"]["aggregated"] == {"fine_steps": 1, "step_types": {"CHECK": 1}}
+
+        total = sum(s["data"]["aggregated"]["fine_steps"] for s in steps)
+        assert total == result["metadata"]["fine_steps"] == 1 + 2 * 4 + 1
+        assert result["metadata"]["granularity"] == "phase"
+
+    def test_summary_keeps_first_and_last_steps(self, pass_tracer):
+        """Summary granularity records only the first and last steps."""
+        pass_tracer.set_granularity("summary")
+        result = pass_tracer.execute({"passes": 4})
+        steps = result["trace"]["steps"]
+
+        assert [s["type"] for s in steps] == ["START", "CHECK"]
+        assert steps[-1]["data"]["comparisons"] == 12
+        assert steps[-1]["data"]["aggregated"]["fine_steps"] == 4 * 4 + 1
+        assert steps[-1]["data"]["visualization"] == {"comparisons": 12}
+
+    def test_skipped_steps_skip_visualization(self, pass_tracer):
+        """Visualization state is only computed for recorded steps."""
+        pass_tracer.set_granularity("summary")
+        pass_tracer.execute({"passes": 50})
+
+        assert pass_tracer.viz_calls == 2
+
+    @pytest.mark.parametrize("granularity", ["phase", "summary"])
+    def test_coarse_traces_have_no_prediction_points(self, pass_tracer, granularity):
+        """Answers are read from the next fine step, so coarse traces skip predictions."""
+        pass_tracer.set_granularity(granularity)
+        result = pass_tracer.execute({"passes": 3})
+
+        assert result["metadata"]["prediction_points"] == []
+
+    def test_skipped_steps_do_not_count_towards_max_steps(self, pass_tracer):
+        """Coarse traces can cover more fine steps than MAX_STEPS."""
+        pass_tracer.MAX_STEPS = 10
+        pass_tracer.set_granularity("phase")
+        result = pass_tracer.execute({"passes": 5})
+
+        assert result["metadata"]["fine_steps"] > pass_tracer.MAX_STEPS
+        assert result["trace"]["total_steps"] == 7
+
+    def test_max_steps_applies_to_recorded_steps(self, pass_tracer):
+        """Recorded steps are still bounded by MAX_STEPS."""
+        pass_tracer.MAX_STEPS = 5
+        pass_tracer.set_granularity("phase")
+
+        with pytest.raises(RuntimeError, match="Exceeded maximum"):
+            pass_tracer.execute({"passes": 10})
+
+    def test_skip_steps_folds_into_next_recorded_step(self, pass_tracer):
+        """_skip_steps() counts steps as if they had been skipped by _add_step()."""
+        pass_tracer.set_granularity("summary")
+        pass_tracer._add_step("START", {}, "Start")
+        pass_tracer._skip_steps({"COMPARE": 3, "PASS_COMPLETE": 0, "SWAP": 2})
+        pass_tracer._add_step("CHECK", {}, "Check")
+        result = pass_tracer._build_trace_result(None)
+
+        assert result["trace"]["steps"][-1]["data"]["aggregated"] == {
+            "fine_steps": 6,
+            "step_types": {"COMPARE": 3, "SWAP": 2, "CHECK": 1}
+        }
+        assert result["metadata"]["fine_steps"] == 7
+
+    def test_no_phase_types_behaves_like_summary(self, minimal_tracer):
+        """Tracers without PHASE_STEP_TYPES keep only the first and last step at 'phase'."""
+        minimal_tracer.set_granularity("phase")
+        result = minimal_tracer.execute({"count": 6})
+
+        assert [s["data"]["value"] for s in result["trace"]["steps"]] == [0, 5]
+
+
+# =============================================================================
+# Test Group 11: Result-Only Mode
+# =============================================================================
+
+@pytest.mark.unit
+class TestResultOnlyMode:
+    """Test untraced execution via set_mode('result_only')."""
+
+    def test_default_mode_is_trace(self, pass_tracer):
+        """Without set_mode() steps are recorded and metadata has no 'mode'."""
+        result = pass_tracer.execute({"passes": 2})
+
+        assert pass_tracer.mode == "trace"
+        assert "mode" not in result["metadata"]
+
+    def test_invalid_mode_raises(self, pass_tracer):
+        """Unknown modes raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid mode 'fast'"):
+            pass_tracer.set_mode("fast")
+
+    def test_records_no_steps(self, pass_tracer):
+        """Steps are only counted: no TraceStep, no visualization state."""
+        pass_tracer.set_mode("result_only")
+        result = pass_tracer.execute({"passes": 3})
+
+        assert result["trace"]["steps"] == []
+        assert result["trace"]["total_steps"] == 0
+        assert pass_tracer.viz_calls == 0
+        assert result["metadata"]["mode"] == "result_only"
+        assert result["metadata"]["fine_steps"] == 1 + 3 * 4 + 1
+        assert result["metadata"]["prediction_points"] == []
+
+    def test_ignores_granularity_and_max_steps(self, pass_tracer):
+        """Granularity has no effect and uncounted steps are not limited."""
+        pass_tracer.MAX_STEPS = 5
+        pass_tracer.set_granularity("phase")
+        pass_tracer.set_mode("result_only")
+        result = pass_tracer.execute({"passes": 10})
+
+        assert result["trace"]["steps"] == []
+        assert "granularity" not in result["metadata"]
+        assert result["metadata"]["fine_steps"] == 1 + 10 * 4 + 1
+
+
+# =============================================================================
+# Test Group 12: Step-Type Index
+# =============================================================================
+
+@pytest.mark.unit
+class TestStepTypeIndex:
+    """Test step_indices(), kept as steps are recorded."""
+
+    def test_indices_of_one_type(self, pass_tracer):
+        """Each type maps to its recorded step indices, in order."""
+        result = pass_tracer.execute({"passes": 2})
+        steps = result["trace"]["steps"]
+
+        assert pass_tracer.step_indices("PASS_COMPLETE") == [4, 8]
+        assert [steps[i]["type"] for i in pass_tracer.step_indices("COMPARE")] == ["COMPARE"] * 6
+        assert pass_tracer.step_indices("SWAP") == []
+
+    def test_indices_of_several_types_are_merged(self, pass_tracer):
+        """Several types give one ascending list."""
+        pass_tracer.execute({"passes": 2})
+
+        assert pass_tracer.step_indices("CHECK", "START", "PASS_COMPLETE") == [0, 4, 8, 9]
+        assert pass_tracer.step_indices("PASS_COMPLETE", "START", "PASS_COMPLETE") == [0, 4, 8]
+
+    def test_only_recorded_steps_are_indexed(self, pass_tracer):
+        """At coarse granularity indices refer to the recorded trace."""
+        pass_tracer.set_granularity("phase")
+        pass_tracer.execute({"passes": 3})
+
+        assert pass_tracer.step_indices("PASS_COMPLETE") == [1, 2, 3]
+        assert pass_tracer.step_indices("COMPARE") == []
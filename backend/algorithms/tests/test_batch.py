@@ -0,0 +1,152 @@
+# backend/algorithms/tests/test_batch.py
+"""
+Tests for batch execution over many inputs.
+
+Test Categories:
+1. Output modes and per-input errors (in process)
+2. Argument validation
+3. Process pool: ordering and bounded in-flight inputs
+"""
+
+import json
+
+import pytest
+
+from algorithms.batch import run_batch
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+
+
+def without_timing(trace_result):
+    """Trace result as JSON, with wall-clock fields removed."""
+    trace = dict(trace_result['trace'], duration=None)
+    trace['steps'] = [dict(step, timestamp=None) for step in trace['steps']]
+    return json.dumps(dict(trace_result, trace=trace))
+
+
+@pytest.mark.unit
+class TestBatchOutputs:
+    """Records match direct execution, projected by output mode."""
+
+    def setup_method(self):
+        self.inputs = [generate_input('bubble-sort', size, seed=size) for size in (3, 8, 12)]
+        self.direct = [registry.get('bubble-sort')().execute(input_data) for input_data in self.inputs]
+
+    def test_trace(self):
+        """'trace' yields execute()'s result for each input, in order."""
+        records = list(run_batch('bubble-sort', self.inputs, workers=0))
+
+        assert [without_timing(r) for r in records] == [without_timing(r) for r in self.direct]
+
+    def test_result(self):
+        """'result' keeps only result and metadata, computed without a trace."""
+        records = list(run_batch('bubble-sort', self.inputs, output='result', workers=0))
+
+        assert [set(r) for r in records] == [{'result', 'metadata'}] * len(self.inputs)
+        assert [r['result'] for r in records] == [r['result'] for r in self.direct]
+        for record, direct in zip(records, self.direct):
+            assert record['metadata']['mode'] == 'result_only'
+            assert record['metadata']['fine_steps'] == direct['trace']['total_steps']
+
+    def test_step_counts(self):
+        """'step_counts' counts recorded steps and step types."""
+        record = next(run_batch('bubble-sort', self.inputs[1:], output='step_counts', workers=0))
+        steps = self.direct[1]['trace']['steps']
+
+        assert record['total_steps'] == record['fine_steps'] == len(steps)
+        assert sum(record['step_types'].values()) == len(steps)
+
+    def test_step_counts_include_skipped_steps(self):
+        """At coarse granularity the counts still cover every fine step."""
+        fine, summary = (
+            next(run_batch('bubble-sort', self.inputs[2:], output='step_counts',
+                           granularity=granularity, workers=0))
+            for granularity in ('fine', 'summary')
+        )
+
+        assert summary['total_steps'] < fine['total_steps']
+        assert summary['fine_steps'] == fine['fine_steps']
+        assert summary['step_types'] == fine['step_types']
+
+    @pytest.mark.parametrize('granularity', ['fine', 'phase'])
+    def test_step_counts_match_the_requested_trace(self, granularity):
+        """total_steps is the recorded step count of a trace at that granularity."""
+        tracer = registry.get('merge-intervals')()
+        tracer.set_granularity(granularity)
+        input_data = generate_input('merge-intervals', 40, seed=3)
+        direct = tracer.execute(input_data)
+
+        record = next(run_batch('merge-intervals', [input_data], output='step_counts',
+                                granularity=granularity, workers=0))
+
+        assert record['total_steps'] == direct['trace']['total_steps']
+
+    def test_step_counts_beyond_max_steps(self):
+        """Counting doesn't build the fine trace, so MAX_STEPS doesn't apply."""
+        input_data = generate_input('bubble-sort', 300, seed=1)
+
+        trace, counts = (next(run_batch('bubble-sort', [input_data], output=output, workers=0))
+                         for output in ('trace', 'step_counts'))
+
+        assert set(trace) == {'error'}
+        assert counts['total_steps'] == counts['fine_steps'] > registry.get('bubble-sort').MAX_STEPS
+
+    def test_errors_do_not_stop_the_batch(self):
+        """Rejected inputs yield an error record in their place."""
+        records = list(run_batch('binary-search', [{'array': [], 'target': 1}, {'array': [1, 2], 'target': 2}],
+                                 output='result', workers=0))
+
+        assert set(records[0]) == {'error'}
+        assert records[1]['result']['found'] is True
+
+
+@pytest.mark.edge_case
+class TestBatchValidation:
+    """Invalid arguments raise on the call, before any input is read."""
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(KeyError):
+            run_batch('unknown', [])
+
+    @pytest.mark.parametrize('kwargs, message', [
+        ({'output': 'steps'}, "Invalid output 'steps'"),
+        ({'granularity': 'coarse'}, "Invalid granularity 'coarse'"),
+        ({'workers': -1}, 'workers must be at least 0'),
+        ({'max_in_flight': 0}, 'max_in_flight must be at least 1'),
+    ])
+    def test_invalid_arguments(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            run_batch('bubble-sort', [], **kwargs)
+
+    def test_empty_inputs(self):
+        """No inputs, no records."""
+        assert list(run_batch('bubble-sort', [], workers=1)) == []
+
+
+@pytest.mark.integration
+class TestBatchProcessPool:
+    """Inputs run in worker processes, streamed in input order."""
+
+    def test_matches_in_process(self):
+        """Pool results equal in-process results, in input order."""
+        inputs = [generate_input('merge-intervals', size, seed=size) for size in range(1, 9)]
+
+        pooled = list(run_batch('merge-intervals', inputs, output='result', workers=2))
+
+        assert pooled == list(run_batch('merge-intervals', inputs, output='result', workers=0))
+
+    def test_inputs_are_consumed_lazily(self):
+        """At most max_in_flight inputs are read ahead of the consumer."""
+        consumed = []
+
+        def inputs():
+            for size in range(2, 12):
+                consumed.append(size)
+                yield generate_input('bubble-sort', size, seed=size)
+
+        batch = run_batch('bubble-sort', inputs(), output='step_counts', workers=2, max_in_flight=3)
+        next(batch)
+        assert len(consumed) == 4
+        next(batch)
+        assert len(consumed) == 5
+        batch.close()
@@ -695,6 +695,22 @@ class TestBFSEdgeCases:
         assert len(result['result']['traversal_order']) == 10
         assert result['result']['visited_count'] == 10
 
+    def test_large_graph_enqueued_states_match_queue(self):
+        """On a 100-node graph, 'enqueued' nodes are exactly the queued, unvisited ones."""
+        nodes = [f'N{i}' for i in range(100)]
+        edges = [(f'N{i}', f'N{(i * 7 + 3) % 100}') for i in range(100)]
+        edges += [(f'N{i}', f'N{i + 1}') for i in range(99)]
+
+        tracer = BreadthFirstSearchTracer()
+        result = tracer.execute({'nodes': nodes, 'edges': edges, 'start_node': 'N0'})
+
+        assert result['result']['visited_count'] == 100
+        for step in result['trace']['steps']:
+            state = step['data']['visualization']
+            enqueued = {n['id'] for n in state['nodes'] if n['state'] == 'enqueued'}
+            current = {n['id'] for n in state['nodes'] if n['state'] == 'visiting'}
+            assert enqueued == set(state['queue']) - set(state['visited']) - current
+
 
 # =============================================================================
 # Test Class 6: Metadata Compliance
@@ -8,8 +8,11 @@ visualization state, prediction points, edge cases, and metadata compliance.
 Target Coverage: ≥90%
 """
 
+import heapq
+
 import pytest
 from algorithms.dijkstras_algorithm_tracer import DijkstrasAlgorithmTracer
+from algorithms.input_generators import generate_input
 
 
 # =============================================================================
@@ -453,6 +456,59 @@ class TestDijkstrasAlgorithmVisualizationState:
         
         assert 'current_node' in viz
 
+    def test_incremental_state_matches_full_recompute(self):
+        """Node/edge states in every step agree with that step's maps and sets."""
+        input_data = generate_input('dijkstras-algorithm', 30, seed=2)
+        result = DijkstrasAlgorithmTracer().execute(input_data)
+
+        for step in result['trace']['steps']:
+            viz = step['data']['visualization']
+            visited = set(viz['visited_set'])
+            previous = viz['previous_map']
+
+            for node in viz['nodes']:
+                expected = 'visited' if node['id'] in visited else (
+                    'examining' if node['id'] == viz['current_node'] else 'unvisited')
+                assert node['state'] == expected
+                assert node['previous'] == previous.get(node['id'])
+                assert viz['distance_map'][node['id']] == (
+                    None if node['distance'] == float('inf') else node['distance'])
+
+            for edge in viz['edges']:
+                u, v = edge['from'], edge['to']
+                if u in visited and v in visited:
+                    expected = 'relaxed' if previous.get(v) == u or previous.get(u) == v else 'unexplored'
+                elif viz['current_node'] in (u, v):
+                    expected = 'examining'
+                else:
+                    expected = 'unexplored'
+                assert edge['state'] == expected
+
+            queue = [(entry['distance'], entry['node']) for entry in viz['priority_queue']]
+            assert queue == sorted(queue)
+
+    def test_unchanged_state_is_shared_between_steps(self):
+        """Steps with no state change in between reuse the same snapshot objects."""
+        tracer = DijkstrasAlgorithmTracer()
+        result = tracer.execute({
+            'nodes': ['A', 'B', 'C'],
+            'edges': [('A', 'B', 1), ('B', 'C', 2)],
+            'start_node': 'A'
+        })
+
+        steps = result['trace']['steps']
+        select = steps[1]['data']['visualization']
+        visit = steps[2]['data']['visualization']
+        assert steps[1]['type'] == 'SELECT_MIN_DIST' and steps[2]['type'] == 'VISIT_NODE'
+        for key in ('nodes', 'edges', 'priority_queue', 'distance_map', 'previous_map', 'visited_set'):
+            assert visit[key] is select[key]
+
+        # INIT -> SELECT pops the queue and visits A, so those pieces are new
+        init = steps[0]['data']['visualization']
+        assert init['priority_queue'] == [{'distance': 0, 'node': 'A'}]
+        assert select['priority_queue'] == []
+        assert init['nodes'] is not select['nodes']
+
 
 # =============================================================================
 # Test Class 4: Prediction Points
@@ -651,6 +707,60 @@ class TestDijkstrasAlgorithmEdgeCases:
         assert result['result']['distances']['A'] == 0
         assert result['result']['distances']['B'] == 3
 
+    def test_unknown_edge_node_raises_error(self):
+        """Edge referencing a node outside the node list should raise ValueError."""
+        tracer = DijkstrasAlgorithmTracer()
+
+        with pytest.raises(ValueError, match="unknown node: Z"):
+            tracer.execute({
+                'nodes': ['A', 'B'],
+                'edges': [('A', 'Z', 1)],
+                'start_node': 'A'
+            })
+
+    def test_priority_queue_has_no_stale_entries(self):
+        """Decrease-key keeps at most one queue entry per unvisited node."""
+        input_data = generate_input('dijkstras-algorithm', 30, seed=3)
+        result = DijkstrasAlgorithmTracer().execute(input_data)
+
+        for step in result['trace']['steps']:
+            viz = step['data']['visualization']
+            queued = [entry['node'] for entry in viz['priority_queue']]
+            assert len(queued) == len(set(queued))
+            assert not set(queued) & set(viz['visited_set'])
+            for entry in viz['priority_queue']:
+                assert entry['distance'] == viz['distance_map'][entry['node']]
+
+    def test_large_graph_matches_reference_distances(self):
+        """A 500-node, 1000-edge graph traces and matches a plain heapq Dijkstra."""
+        size = 500
+        nodes = [f'N{i}' for i in range(size)]
+        edges = [(nodes[i], nodes[i + 1], (i * 7) % 13 + 1) for i in range(size - 1)]
+        edges += [(nodes[i], nodes[(i * 37 + 11) % size], (i * 5) % 17) for i in range(size)]
+
+        result = DijkstrasAlgorithmTracer().execute({
+            'nodes': nodes,
+            'edges': edges,
+            'start_node': 'N0'
+        })
+
+        adjacency = {node: [] for node in nodes}
+        for u, v, weight in edges:
+            adjacency[u].append((v, weight))
+            adjacency[v].append((u, weight))
+        expected = {'N0': 0}
+        heap = [(0, 'N0')]
+        while heap:
+            dist, node = heapq.heappop(heap)
+            if dist > expected[node]:
+                continue
+            for neighbor, weight in adjacency[node]:
+                if dist + weight < expected.get(neighbor, float('inf')):
+                    expected[neighbor] = dist + weight
+                    heapq.heappush(heap, (dist + weight, neighbor))
+
+        assert result['result']['distances'] == expected
+
 
 # =============================================================================
 # Test Class 6: Metadata Compliance
@@ -0,0 +1,147 @@
+# backend/algorithms/tests/test_graph_compiler.py
+"""
+Tests for shared graph-input compilation.
+
+Test Categories:
+1. Structure (dense ids, CSR arrays, neighbor order, directed/weighted)
+2. Validation errors
+3. Immutability and caching
+4. Graph tracers consume compiled graphs
+"""
+
+import dataclasses
+
+import pytest
+
+from algorithms.graph_compiler import clear_graph_cache, compile_graph
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+
+
+@pytest.mark.unit
+class TestCompiledGraphStructure:
+    """Compiled graphs expose ids, CSR arrays and neighbor lists."""
+
+    def test_dense_ids_in_first_appearance_order(self):
+        """Duplicate nodes collapse; ids follow first appearance."""
+        graph = compile_graph(['B', 'A', 'B', 'C'], [])
+
+        assert graph.nodes == ('B', 'A', 'C')
+        assert dict(graph.node_ids) == {'B': 0, 'A': 1, 'C': 2}
+        assert 'A' in graph and 'Z' not in graph
+
+    def test_undirected_neighbors_keep_input_order(self):
+        """Both endpoints list each undirected edge, in edge order."""
+        graph = compile_graph(['A', 'B', 'C'], [['A', 'C'], ['A', 'B'], ['B', 'C']])
+
+        assert graph.neighbors('A') == ('C', 'B')
+        assert graph.neighbors('C') == ('A', 'B')
+        assert graph.sorted_neighbors('A') == ('B', 'C')
+        assert graph.offsets == (0, 2, 4, 6)
+        assert [graph.nodes[t] for t in graph.targets[0:2]] == ['C', 'B']
+
+    def test_directed_neighbors_are_outgoing_only(self):
+        """Directed edges appear only in the source's list."""
+        graph = compile_graph(['A', 'B'], [['A', 'B']], directed=True)
+
+        assert graph.neighbors('A') == ('B',)
+        assert graph.neighbors('B') == ()
+
+    def test_weighted_neighbors(self):
+        """Weights travel with their CSR targets."""
+        graph = compile_graph(['A', 'B', 'C'], [['A', 'B', 4], ['C', 'A', 1]], weighted=True)
+
+        assert graph.weighted_neighbors('A') == (('B', 4), ('C', 1))
+        assert graph.edges == (('A', 'B', 4), ('C', 'A', 1))
+
+    def test_self_loops_and_parallel_edges_are_kept(self):
+        """Multigraph features are preserved, as the tracers expect."""
+        graph = compile_graph(['A', 'B'], [['A', 'A'], ['A', 'B'], ['A', 'B']])
+
+        assert graph.neighbors('A') == ('A', 'A', 'B', 'B')
+        assert graph.neighbors('B') == ('A', 'A')
+
+
+@pytest.mark.edge_case
+class TestCompileGraphValidation:
+    """Invalid graph inputs raise ValueError."""
+
+    def test_unknown_node(self):
+        """Edges must reference listed nodes."""
+        with pytest.raises(ValueError, match="unknown node: Z"):
+            compile_graph(['A'], [['A', 'Z']])
+
+    @pytest.mark.parametrize('edge', [['A'], ['A', 'B', 'C'], 'AB', None])
+    def test_invalid_edge_format(self, edge):
+        """Unweighted edges must be two-item lists or tuples."""
+        with pytest.raises(ValueError, match="Invalid edge format"):
+            compile_graph(['A', 'B', 'C'], [edge])
+
+    def test_weighted_edges_need_numeric_weights(self):
+        """Weights must be numbers (not bools or strings)."""
+        with pytest.raises(ValueError, match="Invalid edge format"):
+            compile_graph(['A', 'B'], [['A', 'B']], weighted=True)
+        for weight in ('5', True, None):
+            with pytest.raises(ValueError, match="weights must be numbers"):
+                compile_graph(['A', 'B'], [['A', 'B', weight]], weighted=True)
+
+
+@pytest.mark.unit
+class TestCompiledGraphCaching:
+    """Compiled graphs are immutable and cached by input."""
+
+    def test_frozen(self):
+        """Attributes and node_ids cannot be modified."""
+        graph = compile_graph(['A', 'B'], [['A', 'B']])
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            graph.nodes = ('X',)
+        with pytest.raises(TypeError):
+            graph.node_ids['X'] = 5
+
+    def test_equal_inputs_share_compiled_graph(self):
+        """Lists and tuples with the same content hit the same cache entry."""
+        clear_graph_cache()
+        first = compile_graph(['A', 'B'], [['A', 'B']])
+
+        assert compile_graph(('A', 'B'), [('A', 'B')]) is first
+        assert compile_graph(['A', 'B'], [['A', 'B']], directed=True) is not first
+
+    def test_equal_but_differently_typed_weights_do_not_share(self):
+        """1 and 1.0 compare equal but must not be served from one entry."""
+        as_int = compile_graph(['A', 'B'], [['A', 'B', 1]], weighted=True)
+        as_float = compile_graph(['A', 'B'], [['A', 'B', 1.0]], weighted=True)
+
+        assert type(as_int.weights[0]) is int
+        assert type(as_float.weights[0]) is float
+
+    def test_unhashable_input_is_compiled_uncached(self):
+        """Unhashable weights skip the cache but are still validated."""
+        with pytest.raises(ValueError, match="weights must be numbers"):
+            compile_graph(['A', 'B'], [['A', 'B', [1]]], weighted=True)
+
+
+@pytest.mark.integration
+class TestGraphTracersUseCompiledGraph:
+    """Every registered graph tracer compiles its input once."""
+
+    @pytest.mark.parametrize('algorithm_name', [
+        'breadth-first-search',
+        'depth-first-search',
+        'topological-sort',
+        'dijkstras-algorithm',
+    ])
+    def test_tracer_graph_matches_input(self, algorithm_name):
+        """After execute(), tracer.graph is the cached compiled input."""
+        input_data = generate_input(algorithm_name, 8, seed=4)
+        tracer = registry.get(algorithm_name)()
+        tracer.execute(input_data)
+
+        assert tracer.graph.nodes == tuple(input_data['nodes'])
+        assert tracer.graph.edges == tuple(tuple(edge) for edge in input_data['edges'])
+        assert tracer.graph is compile_graph(
+            input_data['nodes'],
+            input_data['edges'],
+            directed=algorithm_name == 'topological-sort',
+            weighted=algorithm_name == 'dijkstras-algorithm'
+        )
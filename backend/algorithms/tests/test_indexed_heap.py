@@ -0,0 +1,131 @@
+# backend/algorithms/tests/test_indexed_heap.py
+"""
+Tests for the indexed binary min-heap.
+
+Test Categories:
+1. Ordering (pop order, ties, random operations against heapq)
+2. Decrease-key and membership
+3. Error handling
+"""
+
+import heapq
+import random
+
+import pytest
+
+from algorithms.indexed_heap import IndexedMinHeap
+
+
+@pytest.mark.unit
+class TestIndexedHeapOrdering:
+    """Items come out in priority order."""
+
+    def test_pops_in_priority_order(self):
+        """Pushed items pop smallest first."""
+        heap = IndexedMinHeap(5)
+        for item, priority in enumerate([5, 1, 4, 2, 3]):
+            heap.push(item, priority)
+
+        assert [heap.pop() for _ in range(5)] == [(1, 1), (2, 3), (3, 4), (4, 2), (5, 0)]
+        assert len(heap) == 0
+
+    def test_tuple_priorities_break_ties(self):
+        """(distance, name) priorities break distance ties by name."""
+        heap = IndexedMinHeap(3)
+        heap.push(0, (2, 'C'))
+        heap.push(1, (2, 'A'))
+        heap.push(2, (1, 'B'))
+
+        assert [heap.pop()[0] for _ in range(3)] == [(1, 'B'), (2, 'A'), (2, 'C')]
+
+    def test_random_operations_match_reference(self):
+        """Random push/decrease/pop sequences agree with a lazy heapq reference."""
+        rng = random.Random(7)
+        size = 200
+        heap = IndexedMinHeap(size)
+        best = {}
+        reference = []
+
+        for _ in range(2000):
+            if reference and rng.random() < 0.3:
+                while reference[0][1] not in best or best[reference[0][1]] != reference[0][0]:
+                    heapq.heappop(reference)
+                priority, item = heapq.heappop(reference)
+                del best[item]
+                assert heap.pop() == (priority, item)
+            else:
+                item = rng.randrange(size)
+                priority = (rng.randint(0, 1000), item)
+                if item in best and best[item] <= priority:
+                    continue
+                heap.push_or_decrease(item, priority)
+                best[item] = priority
+                heapq.heappush(reference, (priority, item))
+
+            assert len(heap) == len(best)
+            assert sorted(heap) == sorted((p, i) for i, p in best.items())
+
+
+@pytest.mark.unit
+class TestIndexedHeapDecreaseKey:
+    """Decrease-key updates an entry in place."""
+
+    def test_decrease_key_moves_item_to_front(self):
+        """Lowering a priority reorders without adding an entry."""
+        heap = IndexedMinHeap(3)
+        heap.push(0, 10)
+        heap.push(1, 20)
+        heap.push(2, 30)
+
+        heap.decrease_key(2, 5)
+
+        assert len(heap) == 3
+        assert heap.peek() == (5, 2)
+        assert heap.priority(2) == 5
+
+    def test_membership_tracks_push_and_pop(self):
+        """'in' reflects whether an item is queued."""
+        heap = IndexedMinHeap(2)
+        heap.push(1, 3)
+
+        assert 1 in heap
+        assert 0 not in heap
+        heap.pop()
+        assert 1 not in heap
+
+    def test_push_or_decrease(self):
+        """push_or_decrease inserts new items and lowers queued ones."""
+        heap = IndexedMinHeap(2)
+        heap.push_or_decrease(0, 9)
+        heap.push_or_decrease(0, 4)
+
+        assert list(heap) == [(4, 0)]
+
+
+@pytest.mark.edge_case
+class TestIndexedHeapErrors:
+    """Invalid operations raise."""
+
+    def test_pop_empty_raises(self):
+        """Popping or peeking an empty heap raises IndexError."""
+        heap = IndexedMinHeap(1)
+        with pytest.raises(IndexError):
+            heap.pop()
+        with pytest.raises(IndexError):
+            heap.peek()
+
+    def test_push_duplicate_raises(self):
+        """An item can only be pushed once."""
+        heap = IndexedMinHeap(1)
+        heap.push(0, 1)
+        with pytest.raises(KeyError):
+            heap.push(0, 2)
+
+    def test_decrease_key_errors(self):
+        """decrease_key requires a queued item and a lower priority."""
+        heap = IndexedMinHeap(2)
+        heap.push(0, 5)
+        with pytest.raises(KeyError):
+            heap.decrease_key(1, 1)
+        with pytest.raises(ValueError, match="greater than current"):
+            heap.decrease_key(0, 6)
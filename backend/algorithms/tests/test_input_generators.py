@@ -0,0 +1,186 @@
+# backend/algorithms/tests/test_input_generators.py
+"""
+Tests for the synthetic input generators.
+
+Test Categories:
+1. Coverage: every registered algorithm has a generator
+2. Validity: generated inputs are accepted by the tracers
+3. Determinism: same (algorithm, size, seed) -> same input
+4. Structural properties (sorted arrays, DAGs, connected graphs, intervals)
+"""
+
+import random
+from collections import deque
+
+import pytest
+
+from algorithms.registry import registry
+from algorithms.input_generators import (
+    GENERATORS,
+    MIN_SIZES,
+    generate_input,
+    has_generator,
+    random_connected_graph,
+    random_dag,
+    sorted_array,
+    sorted_unique_array,
+)
+
+
+ALGORITHM_NAMES = [alg['name'] for alg in registry.list_algorithms()]
+
+
+@pytest.mark.unit
+class TestGeneratorCoverage:
+    """Every registered algorithm can be driven from the generator module."""
+
+    def test_every_registered_algorithm_has_generator(self):
+        """No registered algorithm is missing a generator."""
+        missing = [name for name in ALGORITHM_NAMES if not has_generator(name)]
+        assert missing == []
+
+    def test_generators_only_for_registered_algorithms(self):
+        """Generator names match registry names (no typos)."""
+        assert set(GENERATORS) <= set(ALGORITHM_NAMES)
+
+    def test_unknown_algorithm_raises(self):
+        """Unknown algorithms raise ValueError."""
+        with pytest.raises(ValueError, match="No input generator"):
+            generate_input('nonexistent', 10)
+
+    def test_size_below_minimum_raises(self):
+        """Sizes below the algorithm minimum raise ValueError."""
+        with pytest.raises(ValueError, match="at least 2"):
+            generate_input('bubble-sort', 1)
+
+
+@pytest.mark.integration
+class TestGeneratedInputsAreValid:
+    """Generated inputs execute successfully on the real tracers."""
+
+    @pytest.mark.parametrize('algorithm_name', ALGORITHM_NAMES)
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_tracer_accepts_generated_input(self, algorithm_name, seed):
+        """Tracer runs to completion on a small generated input."""
+        size = max(MIN_SIZES.get(algorithm_name, 1), 7)
+        input_data = generate_input(algorithm_name, size, seed)
+
+        tracer = registry.get(algorithm_name)()
+        result = tracer.execute(input_data)
+
+        assert result['trace']['total_steps'] > 0
+
+    @pytest.mark.parametrize('algorithm_name', ALGORITHM_NAMES)
+    def test_minimum_size_is_accepted(self, algorithm_name):
+        """The smallest allowed size is still a valid input."""
+        input_data = generate_input(algorithm_name, MIN_SIZES.get(algorithm_name, 1))
+        tracer = registry.get(algorithm_name)()
+        tracer.execute(input_data)
+
+
+@pytest.mark.unit
+class TestDeterminism:
+    """Generation is reproducible."""
+
+    @pytest.mark.parametrize('algorithm_name', ALGORITHM_NAMES)
+    def test_same_seed_same_input(self, algorithm_name):
+        """Identical arguments produce identical inputs."""
+        assert generate_input(algorithm_name, 30, seed=5) == generate_input(algorithm_name, 30, seed=5)
+
+    def test_different_seeds_differ(self):
+        """Different seeds produce different inputs."""
+        assert generate_input('quick-sort', 50, seed=1) != generate_input('quick-sort', 50, seed=2)
+
+    def test_requested_size_is_respected(self):
+        """Primary collections have exactly the requested length."""
+        assert len(generate_input('merge-sort', 123)['array']) == 123
+        assert len(generate_input('meeting-rooms', 77)['intervals']) == 77
+        assert len(generate_input('dijkstras-algorithm', 64)['nodes']) == 64
+        assert len(generate_input('container-with-most-water', 40)['heights']) == 40
+
+
+@pytest.mark.unit
+class TestStructuralProperties:
+    """Generated structures satisfy the algorithm preconditions."""
+
+    def test_sorted_arrays(self):
+        """Sorted generators are non-decreasing / strictly increasing."""
+        rng = random.Random(0)
+        values = sorted_array(500, rng)
+        assert values == sorted(values)
+
+        unique = sorted_unique_array(500, rng)
+        assert all(a < b for a, b in zip(unique, unique[1:]))
+
+    def test_binary_search_array_sorted(self):
+        """Binary search input is sorted."""
+        array = generate_input('binary-search', 1000)['array']
+        assert array == sorted(array)
+
+    def test_dag_is_acyclic(self):
+        """Kahn's algorithm consumes every node of a generated DAG."""
+        graph = random_dag(300, random.Random(3))
+        in_degree = {node: 0 for node in graph['nodes']}
+        adjacency = {node: [] for node in graph['nodes']}
+        for u, v in graph['edges']:
+            adjacency[u].append(v)
+            in_degree[v] += 1
+
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        visited = 0
+        while queue:
+            node = queue.popleft()
+            visited += 1
+            for neighbor in adjacency[node]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        assert visited == len(graph['nodes'])
+
+    def test_connected_weighted_graph(self):
+        """Every node is reachable from the first and weights are positive."""
+        graph = random_connected_graph(400, random.Random(4), weighted=True)
+        adjacency = {node: [] for node in graph['nodes']}
+        for u, v, weight in graph['edges']:
+            assert weight > 0
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+
+        seen = {graph['nodes'][0]}
+        stack = [graph['nodes'][0]]
+        while stack:
+            for neighbor in adjacency[stack.pop()]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+
+        assert seen == set(graph['nodes'])
+
+    def test_intervals_well_formed(self):
+        """Intervals always have start < end."""
+        for start, end in generate_input('merge-intervals', 500)['intervals']:
+            assert start < end
+
+        coverage = generate_input('interval-coverage', 50)['intervals']
+        assert [i['id'] for i in coverage] == list(range(1, 51))
+        assert all(i['start'] < i['end'] for i in coverage)
+
+    def test_dutch_flag_values(self):
+        """Dutch flag arrays only contain 0, 1 and 2."""
+        assert set(generate_input('dutch-national-flag', 300)['array']) <= {0, 1, 2}
+
+    def test_sliding_window_k_in_range(self):
+        """Window size is between 1 and the array length."""
+        for seed in range(20):
+            data = generate_input('sliding-window', 12, seed)
+            assert 1 <= data['k'] <= len(data['array'])
+
+    def test_large_generation_is_fast(self):
+        """Generating 10^5-element inputs stays well under a second."""
+        import time
+        started = time.perf_counter()
+        generate_input('merge-sort', 100_000)
+        generate_input('dijkstras-algorithm', 20_000)
+        generate_input('meeting-rooms', 100_000)
+        assert time.perf_counter() - started < 5.0
@@ -784,17 +784,17 @@ class TestIntervalCoverageEdgeCases:
         """Exceeding MAX_INTERVALS should raise ValueError."""
         tracer = IntervalCoverageTracer()
         
-        # Create 101 intervals (MAX_INTERVALS = 100)
+        # One more than MAX_INTERVALS
         intervals = [
             {"id": i, "start": i * 10, "end": i * 10 + 5, "color": "blue"}
-            for i in range(101)
+            for i in range(IntervalCoverageTracer.MAX_INTERVALS + 1)
         ]
 
         with pytest.raises(ValueError) as exc_info:
             tracer.execute({'intervals': intervals})
         
         assert "Too many intervals" in str(exc_info.value)
-        assert "maximum allowed is 100" in str(exc_info.value)
+        assert f"maximum allowed is {IntervalCoverageTracer.MAX_INTERVALS}" in str(exc_info.value)
 
     def test_missing_intervals_key(self):
         """Missing 'intervals' key should be handled."""
@@ -842,6 +842,71 @@ class TestIntervalCoverageEdgeCases:
 
         assert len(result['result']) == 1
 
+    def test_duplicate_ids_keep_their_own_coordinates(self):
+        """Intervals sharing an id are still shown with their own coordinates."""
+        tracer = IntervalCoverageTracer()
+        result = tracer.execute({
+            'intervals': [
+                {"id": 1, "start": 0, "end": 50, "color": "blue"},
+                {"id": 1, "start": 10, "end": 20, "color": "green"}
+            ]
+        })
+
+        for step in result['trace']['steps']:
+            all_intervals = step['data']['visualization']['all_intervals']
+            assert [(i['start'], i['end']) for i in all_intervals] == [(0, 50), (10, 20)]
+
+
+@pytest.mark.slow
+class TestIntervalCoverageLargeInputs:
+    """Iterative engine handles inputs far beyond the recursion limit."""
+
+    @staticmethod
+    def _chain(count):
+        """Overlapping chain where every interval extends coverage."""
+        return [
+            {"id": i, "start": i * 10, "end": i * 10 + 15, "color": "blue"}
+            for i in range(count)
+        ]
+
+    def test_max_intervals_within_step_limit(self):
+        """MAX_INTERVALS intervals that are all kept stay under MAX_STEPS."""
+        count = IntervalCoverageTracer.MAX_INTERVALS
+        tracer = IntervalCoverageTracer()
+        result = tracer.execute({'intervals': self._chain(count)})
+
+        assert len(result['result']) == count
+        # 3 setup steps, 4 per kept interval, base case, 1 return per call, completion
+        assert result['trace']['total_steps'] == 3 + 4 * count + 1 + count + 1
+        assert result['trace']['total_steps'] <= tracer.MAX_STEPS
+
+    def test_no_python_recursion(self):
+        """Call depth of 300 works with only ~100 Python frames of headroom."""
+        import inspect
+        import sys
+
+        original_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack(0)) + 100)
+        try:
+            result = IntervalCoverageTracer().execute({'intervals': self._chain(300)})
+        finally:
+            sys.setrecursionlimit(original_limit)
+
+        deepest = max(
+            len(step['data']['visualization']['call_stack_state'])
+            for step in result['trace']['steps']
+        )
+        assert deepest == 300
+
+    def test_call_returns_unwind_in_reverse(self):
+        """CALL_RETURN steps pop calls deepest-first with growing suffixes."""
+        result = IntervalCoverageTracer().execute({'intervals': self._chain(200)})
+        returns = [s['data'] for s in result['trace']['steps'] if s['type'] == 'CALL_RETURN']
+
+        assert [r['depth'] for r in returns] == list(range(199, -1, -1))
+        assert [r['kept_count'] for r in returns] == list(range(1, 201))
+        assert returns[-1]['return_value'] == result['result']
+
 
 # ============================================================================
 # TEST GROUP 6: METADATA COMPLIANCE
@@ -0,0 +1,187 @@
+# backend/algorithms/tests/test_interval_sweep.py
+"""
+Tests for the shared interval sweep engine.
+
+Test Categories:
+1. IntervalColumns sort order and storage
+2. Sweeps (merge, coverage, rooms)
+3. IntervalStateTable views, sharing and changes
+4. Interval tracers: summary fast path matches the step loop
+"""
+
+from array import array
+from collections import Counter
+
+import pytest
+
+from algorithms.interval_sweep import (
+    COVERED,
+    KEEP,
+    MERGED,
+    NEW,
+    IntervalColumns,
+    IntervalStateTable,
+    coverage_sweep,
+    merge_sweep,
+    room_sweep,
+)
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+
+
+@pytest.mark.unit
+class TestIntervalColumns:
+    """Columns hold endpoints in stable sorted order."""
+
+    def test_stable_sort_by_start(self):
+        """Equal starts keep their input order."""
+        columns = IntervalColumns([5, 1, 5, 0], [9, 2, 6, 3])
+
+        assert columns.order == [3, 1, 0, 2]
+        assert list(columns.starts) == [0, 1, 5, 5]
+        assert list(columns.ends) == [3, 2, 9, 6]
+        assert len(columns) == 4
+
+    def test_custom_key(self):
+        """A key on input index can break ties (start asc, end desc)."""
+        starts, ends = [1, 1, 0], [3, 8, 2]
+        columns = IntervalColumns(starts, ends, key=lambda i: (starts[i], -ends[i]))
+
+        assert columns.order == [2, 1, 0]
+
+    def test_int_columns_are_arrays(self):
+        """Plain ints are stored compactly; other values stay in lists."""
+        assert isinstance(IntervalColumns([1, 2], [3, 4]).starts, array)
+        assert isinstance(IntervalColumns([1.5, 2], [3, 4]).starts, list)
+        assert isinstance(IntervalColumns([True, 2], [3, 4]).starts, list)
+        assert isinstance(IntervalColumns([2 ** 70, 2], [3, 4]).starts, list)
+
+
+@pytest.mark.unit
+class TestSweeps:
+    """One-pass classification of sorted intervals."""
+
+    def test_merge_sweep(self):
+        """Overlapping (and touching) intervals merge; the rest start new ones."""
+        merged, classes = merge_sweep([1, 2, 6, 8, 9], [3, 4, 7, 10, 9])
+
+        assert merged == [[1, 4], [6, 7], [8, 10]]
+        assert list(classes) == [NEW, MERGED, NEW, NEW, MERGED]
+
+    def test_merge_sweep_stop(self):
+        """stop limits the sweep to a prefix."""
+        merged, classes = merge_sweep([1, 2, 6], [3, 4, 7], stop=2)
+
+        assert merged == [[1, 4]]
+        assert len(classes) == 2
+        assert merge_sweep([], []) == ([], bytearray())
+
+    def test_coverage_sweep(self):
+        """Intervals ending within the coverage so far are covered."""
+        classes, max_end = coverage_sweep([10, 5, 10, 12])
+
+        assert list(classes) == [KEEP, COVERED, COVERED, KEEP]
+        assert max_end == 12
+
+    def test_room_sweep_reuses_earliest_room(self):
+        """A meeting takes the room that freed first, if it has freed."""
+        log = []
+        rooms, heap, rooms_used = room_sweep([0, 5, 10, 15], [30, 10, 20, 40], log=log)
+
+        assert rooms == [1, 2, 2, 3]
+        assert rooms_used == 3
+        assert sorted(heap) == [(20, 2), (30, 1), (40, 3)]
+        assert log[2:4] == [['pop', 10, 2], ['push', 20, 2]]
+
+    def test_room_sweep_continues_from_heap(self):
+        """Sweeping in two parts matches one sweep."""
+        starts, ends = [0, 5, 10, 15, 16], [30, 10, 20, 40, 17]
+        first, heap, used = room_sweep(starts[:2], ends[:2])
+        second, heap, used = room_sweep(starts[2:], ends[2:], heap, used)
+
+        assert first + second == room_sweep(starts, ends)[0]
+
+
+@pytest.mark.unit
+class TestIntervalStateTable:
+    """State codes with cached, shared row views."""
+
+    def make_table(self):
+        rows = [{'id': i, 'start': i, 'end': i + 1} for i in range(3)]
+        return IntervalStateTable(rows, ('pending', 'done'), 'pending', room=None)
+
+    def test_views(self):
+        """Views append 'state' and the extra columns to each row."""
+        table = self.make_table()
+        table.set(1, 'done', room=4)
+
+        assert table.views()[1] == {'id': 1, 'start': 1, 'end': 2, 'state': 'done', 'room': 4}
+        assert list(table.views()[0]) == ['id', 'start', 'end', 'state', 'room']
+        assert table.state(1) == 'done'
+        assert list(table.states) == [0, 1, 0]
+
+    def test_unchanged_views_are_shared(self):
+        """Snapshots and unchanged rows are reused until something changes."""
+        table = self.make_table()
+        first = table.views()
+        table.set(0, 'pending', room=None)
+
+        assert table.views() is first
+        table.set(2, 'done')
+        second = table.views()
+        assert second is not first
+        assert second[0] is first[0] and second[2] is not first[2]
+        assert first[2]['state'] == 'pending'
+
+    def test_take_changes(self):
+        """Changes are listed once, in first-change order, with latest values."""
+        table = self.make_table()
+        table.set(2, 'done')
+        table.set(0, 'done')
+        table.set(2, 'done', room=1)
+
+        assert [(v['id'], v['room']) for v in table.take_changes()] == [(2, 1), (0, None)]
+        assert table.take_changes() == []
+
+
+@pytest.mark.integration
+class TestSummaryFastPath:
+    """At summary granularity the sweep matches the fine step loop."""
+
+    @pytest.mark.parametrize('algorithm_name', ['merge-intervals', 'meeting-rooms', 'interval-coverage'])
+    @pytest.mark.parametrize('size', [1, 2, 3, 40])
+    def test_summary_matches_fine(self, algorithm_name, size):
+        """Same result, final state and step counts as the fine trace."""
+        input_data = generate_input(algorithm_name, size, seed=size)
+        fine = registry.get(algorithm_name)().execute(input_data)
+        tracer = registry.get(algorithm_name)()
+        tracer.set_granularity('summary')
+        summary = tracer.execute(input_data)
+
+        fine_steps = fine['trace']['steps']
+        summary_steps = summary['trace']['steps']
+        assert summary['result'] == fine['result']
+        assert summary['metadata']['fine_steps'] == len(fine_steps)
+        assert summary_steps[-1]['type'] == fine_steps[-1]['type']
+        if len(summary_steps) > 1:
+            assert summary_steps[-1]['data']['aggregated']['step_types'] == \
+                dict(Counter(step['type'] for step in fine_steps[1:]))
+
+    @pytest.mark.parametrize('algorithm_name', ['merge-intervals', 'meeting-rooms', 'interval-coverage'])
+    def test_large_inputs(self, algorithm_name):
+        """Tens of thousands of intervals are handled at summary granularity."""
+        input_data = generate_input(algorithm_name, 20000, seed=1)
+        tracer = registry.get(algorithm_name)()
+        tracer.set_granularity('summary')
+        result = tracer.execute(input_data)
+
+        assert result['trace']['total_steps'] == 2
+        assert len(result['trace']['steps'][-1]['data']['visualization']['all_intervals']) == 20000
+
+    def test_coverage_cap_applies_below_summary(self):
+        """The fine-mode interval cap still applies at other granularities."""
+        input_data = generate_input('interval-coverage', 1500, seed=1)
+        tracer = registry.get('interval-coverage')()
+
+        with pytest.raises(ValueError, match="maximum allowed is 1000"):
+            tracer.execute(input_data)
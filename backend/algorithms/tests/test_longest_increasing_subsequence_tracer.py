@@ -8,8 +8,15 @@ state, prediction points, edge cases, and metadata compliance.
 Target Coverage: ≥90%
 """
 
+import json
+import random
+
 import pytest
-from algorithms.longest_increasing_subsequence_tracer import LongestIncreasingSubsequenceTracer
+from algorithms.longest_increasing_subsequence_tracer import (
+    LongestIncreasingSubsequenceTracer,
+    expand_state_deltas,
+    tails_at_step,
+)
 
 
 # =============================================================================
@@ -921,3 +928,100 @@ class TestLISNarrativeGeneration:
         # Should mention decision logic
         assert "extend" in narrative.lower() or "Extend" in narrative
         assert "replace" in narrative.lower() or "Replace" in narrative
+
+
+# =============================================================================
+# Test Class 8: Delta State Updates (Compact Tails History)
+# =============================================================================
+
+def run_lis(array, granularity='fine', **options):
+    """Execute the tracer at the given granularity; return (tracer, result)."""
+    tracer = LongestIncreasingSubsequenceTracer()
+    tracer.set_granularity(granularity)
+    return tracer, tracer.execute({'array': array, **options})
+
+
+@pytest.mark.unit
+class TestLISStateUpdates:
+    """Test the opt-in delta mode with tail updates and parent pointers."""
+
+    def test_full_mode_is_default(self):
+        """state_updates 'full' matches the default trace and adds no metadata."""
+        _, default = run_lis([3, 1, 4, 1, 5])
+        _, full = run_lis([3, 1, 4, 1, 5], state_updates='full')
+
+        assert 'state_updates' not in default['metadata']
+        assert 'subsequence' not in default['result']
+        assert [s['data'] for s in full['trace']['steps']] == [s['data'] for s in default['trace']['steps']]
+
+    def test_delta_steps_carry_no_tails_copies(self):
+        """After the first step, only tail updates are recorded."""
+        _, result = run_lis([3, 1, 4], state_updates='delta')
+        steps = result['trace']['steps']
+
+        assert result['metadata']['state_updates'] == 'delta'
+        assert 'tails' in steps[0]['data']['visualization']
+        for step in steps[1:]:
+            assert 'tails' not in step['data']['visualization']
+            assert 'tails_before' not in step['data'] and 'tails_after' not in step['data']
+
+        updates = [u for s in steps[1:] for u in s['data']['visualization']['tail_updates']]
+        assert updates == [[0, None, 3], [0, 3, 1], [1, None, 4]]
+
+    def test_parent_pointers_and_subsequence(self):
+        """Each placement records the index it extends; the LIS is rebuilt from them."""
+        _, result = run_lis([10, 9, 2, 5, 3, 7, 101, 18], state_updates='delta')
+        parents = [s['data']['parent'] for s in result['trace']['steps']
+                   if s['type'] in ('EXTEND_TAIL', 'REPLACE_TAIL')]
+
+        assert parents == [None, None, None, 2, 2, 4, 5, 5]
+        assert result['result']['subsequence'] == [2, 3, 7, 18]
+        assert result['result']['subsequence_indices'] == [2, 4, 5, 7]
+
+    @pytest.mark.parametrize('granularity', ['fine', 'phase', 'summary'])
+    def test_delta_expands_to_full(self, granularity):
+        """Expanding a delta trace reproduces the full-mode steps."""
+        rng = random.Random(5)
+        array = [rng.randint(-30, 30) for _ in range(60)]
+        _, full = run_lis(array, granularity)
+        _, delta = run_lis(array, granularity, state_updates='delta')
+
+        expanded = expand_state_deltas(delta)
+        for step in expanded['trace']['steps']:
+            step['data'].pop('parent', None)
+        assert json.dumps([s['data'] for s in expanded['trace']['steps']]) == \
+            json.dumps([s['data'] for s in full['trace']['steps']])
+        assert delta['metadata']['prediction_points'] == full['metadata']['prediction_points']
+
+    def test_tails_at_step(self):
+        """Tails can be rebuilt for any step, in either mode."""
+        array = [5, 2, 8, 6, 3, 6, 9, 7]
+        _, full = run_lis(array)
+        _, delta = run_lis(array, state_updates='delta')
+
+        for index in range(len(full['trace']['steps'])):
+            assert tails_at_step(delta, index) == tails_at_step(full, index)
+        assert tails_at_step(delta, len(delta['trace']['steps']) - 1) == delta['result']['final_tails']
+
+    def test_delta_narrative_matches_full(self):
+        """The narrative is generated from expanded snapshots."""
+        full_tracer, full = run_lis([4, 10, 4, 3, 8, 9])
+        delta_tracer, delta = run_lis([4, 10, 4, 3, 8, 9], state_updates='delta')
+
+        assert delta_tracer.generate_narrative(delta) == full_tracer.generate_narrative(full)
+
+    def test_ten_thousand_elements(self):
+        """A 10k-element sequence at phase granularity stays small in delta mode."""
+        rng = random.Random(1)
+        array = [rng.randint(0, 10 ** 6) for _ in range(10000)]
+        _, result = run_lis(array, 'phase', state_updates='delta')
+
+        subsequence = result['result']['subsequence']
+        assert len(subsequence) == result['result']['lis_length']
+        assert all(a < b for a, b in zip(subsequence, subsequence[1:]))
+        assert len(json.dumps(result)) < 2_000_000
+
+    def test_invalid_state_updates_raises(self):
+        """Unknown state_updates values are rejected."""
+        with pytest.raises(ValueError, match="Invalid state_updates 'compact'. Expected one of: full, delta"):
+            run_lis([1, 2], state_updates='compact')
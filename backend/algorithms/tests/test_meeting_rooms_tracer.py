@@ -8,8 +8,11 @@ visualization state, prediction points, edge cases, and metadata compliance.
 Target Coverage: ≥90%
 """
 
+import json
+import random
+
 import pytest
-from algorithms.meeting_rooms_tracer import MeetingRoomsTracer
+from algorithms.meeting_rooms_tracer import MeetingRoomsTracer, expand_state_deltas
 
 
 # =============================================================================
@@ -678,3 +681,124 @@ class TestMeetingRoomsMetadataCompliance:
         assert 'steps' in result['trace']
         assert 'total_steps' in result['trace']
         assert 'duration' in result['trace']
+
+
+# =============================================================================
+# Test Class 7: Incremental and Delta State Updates
+# =============================================================================
+
+def random_meetings(count, seed):
+    """Generate overlapping meetings with distinct-ish start times."""
+    rng = random.Random(seed)
+    meetings = []
+    for _ in range(count):
+        start = rng.randint(0, count * 2)
+        meetings.append([start, start + rng.randint(1, 40)])
+    return meetings
+
+
+@pytest.mark.unit
+class TestMeetingRoomsStateUpdates:
+    """Test incremental visualization state and the opt-in delta mode."""
+
+    def test_heap_state_matches_heap(self):
+        """heap_state is always the sorted end times of the heap."""
+        tracer = MeetingRoomsTracer()
+        result = tracer.execute({'intervals': random_meetings(60, seed=1)})
+
+        for step in result['trace']['steps']:
+            viz = step['data']['visualization']
+            rooms = sorted(viz['room_assignments'].values())
+            assert len(viz['heap_state']) == len(set(rooms))
+            assert viz['heap_state'] == sorted(viz['heap_state'])
+        assert tracer._heap_end_times == sorted(end for end, _ in tracer.heap)
+
+    def test_full_mode_is_default(self):
+        """state_updates 'full' produces the default trace and no metadata key."""
+        intervals = [[0, 30], [5, 10], [15, 20], [10, 25]]
+        default = MeetingRoomsTracer().execute({'intervals': intervals})
+        full = MeetingRoomsTracer().execute({'intervals': intervals, 'state_updates': 'full'})
+
+        assert 'state_updates' not in default['metadata']
+        assert [s['data'] for s in full['trace']['steps']] == [s['data'] for s in default['trace']['steps']]
+
+    @pytest.mark.parametrize('granularity', ['fine', 'phase', 'summary'])
+    def test_delta_expands_to_full(self, granularity):
+        """Expanding a delta trace reproduces the full-mode snapshots."""
+        intervals = random_meetings(80, seed=2)
+        full_tracer, delta_tracer = MeetingRoomsTracer(), MeetingRoomsTracer()
+        full_tracer.set_granularity(granularity)
+        delta_tracer.set_granularity(granularity)
+        full = full_tracer.execute({'intervals': intervals})
+        delta = delta_tracer.execute({'intervals': intervals, 'state_updates': 'delta'})
+
+        assert delta['metadata']['state_updates'] == 'delta'
+        expanded = expand_state_deltas(delta)
+        assert json.dumps([s['data'] for s in expanded['trace']['steps']]) == \
+            json.dumps([s['data'] for s in full['trace']['steps']])
+
+    def test_delta_expands_after_json_round_trip(self):
+        """String room keys from JSON are not duplicated by later updates."""
+        intervals = random_meetings(40, seed=5)
+        full = MeetingRoomsTracer().execute({'intervals': intervals})
+        delta = MeetingRoomsTracer().execute({'intervals': intervals, 'state_updates': 'delta'})
+
+        expanded = expand_state_deltas(json.loads(json.dumps(delta)))
+        for step, full_step in zip(expanded['trace']['steps'], full['trace']['steps']):
+            assignments = step['data']['visualization']['room_assignments']
+            assert all(isinstance(key, int) for key in assignments)
+            assert assignments == full_step['data']['visualization']['room_assignments']
+
+    def test_delta_steps_carry_only_changes(self):
+        """After the first step, steps hold heap operations and changed intervals."""
+        tracer = MeetingRoomsTracer()
+        result = tracer.execute({'intervals': [[0, 30], [5, 10], [15, 20]], 'state_updates': 'delta'})
+        steps = result['trace']['steps']
+
+        assert 'all_intervals' in steps[0]['data']['visualization']
+        for step in steps[1:]:
+            assert set(step['data']['visualization']) == {'heap_delta', 'interval_updates', 'rooms_used'}
+
+        reuse = next(s for s in steps if s['type'] == 'ALLOCATE_ROOM')
+        assert reuse['data']['visualization']['heap_delta'] == [['pop', 10, 2], ['push', 20, 2]]
+        assert [u['id'] for u in reuse['data']['visualization']['interval_updates']] == [2]
+
+    def test_delta_is_smaller_for_many_meetings(self):
+        """Hundreds of meetings produce a much smaller delta trace."""
+        intervals = random_meetings(400, seed=3)
+        full = MeetingRoomsTracer().execute({'intervals': intervals})
+        delta = MeetingRoomsTracer().execute({'intervals': intervals, 'state_updates': 'delta'})
+
+        assert delta['result'] == full['result']
+        assert len(json.dumps(delta)) < len(json.dumps(full)) / 20
+
+    def test_delta_handles_thousands_of_meetings(self):
+        """Each delta step carries at most one pop, one push and one interval."""
+        result = MeetingRoomsTracer().execute(
+            {'intervals': random_meetings(3000, seed=4), 'state_updates': 'delta'}
+        )
+
+        for step in result['trace']['steps'][1:]:
+            assert len(step['data']['visualization']['interval_updates']) <= 1
+            assert len(step['data']['visualization']['heap_delta']) <= 2
+
+    def test_delta_narrative_matches_full(self):
+        """The narrative is generated from expanded snapshots."""
+        intervals = [[0, 30], [5, 10], [15, 20], [10, 25]]
+        full = MeetingRoomsTracer()
+        delta = MeetingRoomsTracer()
+        full_result = full.execute({'intervals': intervals})
+        delta_result = delta.execute({'intervals': intervals, 'state_updates': 'delta'})
+
+        assert delta.generate_narrative(delta_result) == full.generate_narrative(full_result)
+
+    def test_expand_full_trace_is_noop(self):
+        """Full-mode traces pass through expand_state_deltas unchanged."""
+        result = MeetingRoomsTracer().execute({'intervals': [[0, 30], [5, 10]]})
+
+        assert expand_state_deltas(result) is result
+
+    def test_invalid_state_updates_raises(self):
+        """Unknown state_updates values are rejected."""
+        with pytest.raises(ValueError, match="Invalid state_updates 'diff'. Expected one of: full, delta"):
+            MeetingRoomsTracer().execute({'intervals': [[0, 30]], 'state_updates': 'diff'})
@@ -0,0 +1,107 @@
+# backend/algorithms/tests/test_memory_footprint.py
+"""
+Memory-footprint regression tests for trace generation.
+
+Every tracer snapshots visualization state into each step, so a new
+visualization field multiplies across the whole trace. These tests run each
+registered tracer on a fixed generated input under tracemalloc and assert
+that the peak allocation per recorded step stays within a budget.
+
+Budgets are roughly 1.5x the footprint measured when they were set. If a
+change legitimately needs more memory per step, raise the budget in the
+same commit and explain why in the commit message.
+
+Test Categories:
+1. Budget coverage (every registered algorithm has a budget)
+2. Peak bytes per step within budget
+"""
+
+import tracemalloc
+
+import pytest
+
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+
+
+# algorithm name -> (input size, max peak bytes per step)
+MEMORY_BUDGETS = {
+    'interval-coverage': (20, 18_000),
+    'binary-search': (20, 3_000),
+    'two-pointer': (20, 8_000),
+    'sliding-window': (20, 9_000),
+    'merge-sort': (20, 5_000),
+    'depth-first-search': (20, 17_000),
+    'boyer-moore-voting': (20, 8_000),
+    'breadth-first-search': (20, 17_000),
+    'bubble-sort': (20, 9_000),
+    'container-with-most-water': (20, 9_000),
+    'dijkstras-algorithm': (20, 3_000),
+    'dutch-national-flag': (20, 9_000),
+    'insertion-sort': (20, 9_000),
+    'kadanes-algorithm': (20, 9_000),
+    'longest-increasing-subsequence': (20, 10_000),
+    'meeting-rooms': (20, 9_000),
+    'merge-intervals': (20, 9_000),
+    'quick-sort': (20, 8_000),
+    'topological-sort': (10, 8_000),
+}
+
+SEED = 0
+
+
+def measure_peak_per_step(algorithm_name: str, size: int) -> tuple:
+    """
+    Execute a fresh tracer under tracemalloc.
+
+    Input generation and one warm-up run happen before tracing starts, so
+    only execute() (including building the final result dict) is measured
+    and one-off import/cache allocations are excluded.
+
+    Returns:
+        tuple: (peak_bytes, total_steps)
+    """
+    input_data = generate_input(algorithm_name, size, SEED)
+    registry.get(algorithm_name)().execute(input_data)
+    tracer = registry.get(algorithm_name)()
+
+    tracemalloc.start()
+    try:
+        result = tracer.execute(input_data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, result['trace']['total_steps']
+
+
+@pytest.mark.memory
+class TestMemoryBudgetCoverage:
+    """New tracers must come with a memory budget."""
+
+    def test_every_registered_algorithm_has_budget(self):
+        """Each registered algorithm appears in MEMORY_BUDGETS."""
+        registered = {alg['name'] for alg in registry.list_algorithms()}
+        assert registered - set(MEMORY_BUDGETS) == set()
+
+    def test_no_stale_budgets(self):
+        """Budgets only exist for registered algorithms."""
+        assert set(MEMORY_BUDGETS) <= {alg['name'] for alg in registry.list_algorithms()}
+
+
+@pytest.mark.memory
+class TestPeakAllocationPerStep:
+    """Peak allocation per step stays within budget."""
+
+    @pytest.mark.parametrize('algorithm_name', sorted(MEMORY_BUDGETS))
+    def test_peak_bytes_per_step_within_budget(self, algorithm_name):
+        """Peak traced memory divided by step count is below the budget."""
+        size, budget = MEMORY_BUDGETS[algorithm_name]
+        peak, steps = measure_peak_per_step(algorithm_name, size)
+
+        assert steps > 0
+        per_step = peak / steps
+        assert per_step <= budget, (
+            f"{algorithm_name} (n={size}) used {per_step:,.0f} bytes/step "
+            f"(peak {peak:,} bytes over {steps} steps); budget is {budget:,}"
+        )
@@ -594,3 +594,160 @@ class TestMergeSortMetadataCompliance:
         assert isinstance(metadata['visualization_config'], dict)
         assert isinstance(metadata['input_size'], int)
         assert isinstance(metadata['prediction_points'], list)
+
+
+# =============================================================================
+# Test Class 7: Range Representation
+# =============================================================================
+
+def strip_visualization(data):
+    """Step data without its visualization snapshot."""
+    return {k: v for k, v in data.items() if k != 'visualization'}
+
+
+@pytest.mark.unit
+class TestMergeSortRangeRepresentation:
+    """Test the copy-free 'ranges' representation."""
+
+    ARRAY = [38, 27, 43, 3, 9, 82, 10, 27]
+
+    def run(self, representation, array=None):
+        tracer = MergeSortTracer()
+        return tracer.execute({'array': array or self.ARRAY, 'representation': representation})
+
+    def test_same_result_and_step_sequence(self):
+        """Both representations sort identically and emit the same steps."""
+        lists, ranges = self.run('lists'), self.run('ranges')
+
+        assert ranges['result'] == lists['result']
+        assert [s['type'] for s in ranges['trace']['steps']] == [s['type'] for s in lists['trace']['steps']]
+        for list_step, range_step in zip(lists['trace']['steps'], ranges['trace']['steps']):
+            if list_step['type'] == 'MERGE_COMPARE':
+                assert strip_visualization(range_step['data']) == strip_visualization(list_step['data'])
+
+    def test_ranges_replace_lists(self):
+        """Ranges index the working buffer; they resolve to the list-mode values."""
+        lists, ranges = self.run('lists'), self.run('ranges')
+        array = self.ARRAY
+
+        for list_step, range_step in zip(lists['trace']['steps'], ranges['trace']['steps']):
+            if list_step['type'] == 'SPLIT_ARRAY':
+                start, end = range_step['data']['array_range']
+                assert array[start:end + 1] == list_step['data']['array']
+                assert 'left_half' not in range_step['data']
+            if list_step['type'] == 'MERGE_COMPLETE':
+                start, end = range_step['data']['merged_array_range']
+                assert sorted(array[start:end + 1]) == list_step['data']['merged_array']
+
+    def test_call_stack_omits_arrays(self):
+        """call_stack_state entries carry no array copies; intervals are unchanged."""
+        lists, ranges = self.run('lists'), self.run('ranges')
+
+        for list_step, range_step in zip(lists['trace']['steps'], ranges['trace']['steps']):
+            list_viz = list_step['data']['visualization']
+            range_viz = range_step['data']['visualization']
+            assert range_viz['all_intervals'] == list_viz['all_intervals']
+            assert all('array' not in call for call in range_viz['call_stack_state'])
+
+    def test_predictions_match(self):
+        """Prediction answers match list mode; questions name ranges."""
+        lists, ranges = self.run('lists'), self.run('ranges')
+        list_points = lists['metadata']['prediction_points']
+        range_points = ranges['metadata']['prediction_points']
+
+        assert [p['correct_answer'] for p in range_points] == [p['correct_answer'] for p in list_points]
+        assert [p['choices'] for p in range_points] == [p['choices'] for p in list_points]
+        assert 'arr[' in range_points[0]['question']
+
+    def test_smaller_payload(self):
+        """Range steps serialize smaller than list steps."""
+        import json
+        array = list(range(100, 0, -1))
+
+        assert len(json.dumps(self.run('ranges', array))) < 0.75 * len(json.dumps(self.run('lists', array)))
+
+    def test_metadata_and_narrative(self):
+        """Range mode is reported in metadata and narrates ranges."""
+        tracer = MergeSortTracer()
+        result = tracer.execute({'array': [5, 2, 4, 1], 'representation': 'ranges'})
+        narrative = tracer.generate_narrative(result)
+
+        assert result['metadata']['representation'] == 'ranges'
+        assert 'Left half: arr[0..1]' in narrative
+        assert 'representation' not in self.run('lists')['metadata']
+
+    def test_invalid_representation_raises(self):
+        """Unknown representations are rejected."""
+        with pytest.raises(ValueError, match="Invalid representation"):
+            MergeSortTracer().execute({'array': [2, 1], 'representation': 'views'})
+
+
+# =============================================================================
+# Test Class 8: Bottom-Up Strategy
+# =============================================================================
+
+@pytest.mark.unit
+class TestMergeSortBottomUp:
+    """Test the iterative bottom-up engine."""
+
+    MERGE_TYPES = {'MERGE_START', 'MERGE_COMPARE', 'MERGE_TAKE_LEFT', 'MERGE_TAKE_RIGHT',
+                   'MERGE_REMAINDER', 'MERGE_COMPLETE'}
+
+    @pytest.mark.parametrize("representation", ['lists', 'ranges'])
+    @pytest.mark.parametrize("array", [[1], [2, 1], [5, 2, 4, 1, 3], [3, 3, 1, 2, 2, 1, 0], list(range(17, 0, -1))])
+    def test_sorts_with_merge_steps_only(self, array, representation):
+        """Sorts with n-1 merges and no split/base-case steps."""
+        tracer = MergeSortTracer()
+        result = tracer.execute({'array': array, 'strategy': 'bottom-up', 'representation': representation})
+        inner_types = {s['type'] for s in result['trace']['steps'][1:-1]}
+
+        assert result['result']['sorted_array'] == sorted(array)
+        assert result['result']['merges'] == len(array) - 1
+        assert inner_types <= self.MERGE_TYPES
+
+    def test_runs_double_each_pass(self):
+        """Merges pair adjacent runs left to right; the leftover run waits."""
+        tracer = MergeSortTracer()
+        result = tracer.execute({'array': [5, 2, 4, 1, 3], 'strategy': 'bottom-up'})
+        merges = [(s['data']['left'], s['data']['right'], s['data']['depth'])
+                  for s in result['trace']['steps'] if s['type'] == 'MERGE_START']
+
+        assert merges == [
+            ([5], [2], 2),
+            ([4], [1], 2),
+            ([2, 5], [1, 4], 1),
+            ([1, 2, 4, 5], [3], 0),
+        ]
+
+    def test_same_comparison_count_as_top_down_for_powers_of_two(self):
+        """With 2**k elements both engines merge the same runs."""
+        array = [7, 3, 8, 1, 6, 2, 5, 4]
+        top_down = MergeSortTracer().execute({'array': array})
+        bottom_up = MergeSortTracer().execute({'array': array, 'strategy': 'bottom-up'})
+
+        assert bottom_up['result'] == top_down['result']
+
+    def test_large_input_without_recursion(self):
+        """Inputs far above the schema cap run at summary granularity."""
+        tracer = MergeSortTracer()
+        tracer.set_granularity('summary')
+        array = list(range(5000, 0, -1))
+        result = tracer.execute({'array': array, 'strategy': 'bottom-up', 'representation': 'ranges'})
+
+        assert result['result']['sorted_array'] == sorted(array)
+        assert result['trace']['total_steps'] == 2
+
+    def test_metadata_predictions_and_narrative(self):
+        """Strategy is reported; predictions and narrative still work."""
+        tracer = MergeSortTracer()
+        result = tracer.execute({'array': [5, 2, 4, 1, 3], 'strategy': 'bottom-up'})
+        narrative = tracer.generate_narrative(result)
+
+        assert result['metadata']['strategy'] == 'bottom-up'
+        assert result['metadata']['prediction_points'][0]['correct_answer'] == 'right'
+        assert 'bottom-up' in narrative
+
+    def test_invalid_strategy_raises(self):
+        """Unknown strategies are rejected."""
+        with pytest.raises(ValueError, match="Invalid strategy"):
+            MergeSortTracer().execute({'array': [2, 1], 'strategy': 'sideways'})
@@ -790,3 +790,89 @@ class TestQuickSortNarrativeGeneration:
         assert "Comparisons" in narrative
         assert "Swaps" in narrative
         assert "Partitions" in narrative
+
+
+# =============================================================================
+# Test Class 8: Iterative Execution & Pivot Strategies
+# =============================================================================
+
+@pytest.mark.unit
+class TestQuickSortPivotStrategies:
+    """Test the explicit-stack execution and optional pivot strategies."""
+
+    @pytest.mark.parametrize("strategy", ['last', 'median-of-three', 'random'])
+    def test_strategies_sort_correctly(self, strategy):
+        """Every strategy sorts, including duplicates."""
+        array = [9, 3, 7, 3, 1, 8, 2, 7, 5, 0, 3]
+        tracer = QuickSortTracer()
+        result = tracer.execute({'array': array, 'pivot_strategy': strategy, 'seed': 3})
+
+        assert result['result']['sorted_array'] == sorted(array)
+
+    def test_default_has_no_pivot_moves(self):
+        """The default strategy never emits move_pivot_to_end swaps."""
+        tracer = QuickSortTracer()
+        result = tracer.execute({'array': [10, 7, 8, 9, 1, 5]})
+
+        reasons = [s['data']['reason'] for s in result['trace']['steps'] if s['type'] == 'SWAP']
+        assert 'move_pivot_to_end' not in reasons
+        assert 'pivot_strategy' not in result['metadata']
+
+    def test_median_of_three_moves_pivot_before_select(self):
+        """The median candidate is swapped to the end, then selected."""
+        tracer = QuickSortTracer()
+        result = tracer.execute({'array': [1, 2, 3, 4, 5], 'pivot_strategy': 'median-of-three'})
+        steps = result['trace']['steps']
+
+        assert [s['type'] for s in steps[1:4]] == ['RECURSE', 'SWAP', 'SELECT_PIVOT']
+        assert steps[2]['data']['reason'] == 'move_pivot_to_end'
+        assert steps[2]['data']['index1'] == 2
+        assert steps[3]['data']['pivot_value'] == 3
+        assert result['metadata']['pivot_strategy'] == 'median-of-three'
+
+    def test_random_is_reproducible_per_seed(self):
+        """The same seed gives the same trace; the seed is reported."""
+        array = list(range(30, 0, -1))
+        first = QuickSortTracer().execute({'array': array, 'pivot_strategy': 'random', 'seed': 7})
+        second = QuickSortTracer().execute({'array': array, 'pivot_strategy': 'random', 'seed': 7})
+
+        assert [s['data'] for s in first['trace']['steps']] == [s['data'] for s in second['trace']['steps']]
+        assert first['metadata']['seed'] == 7
+
+    def test_large_sorted_input_stays_n_log_n(self):
+        """Median-of-three keeps sorted inputs well under MAX_STEPS."""
+        tracer = QuickSortTracer()
+        result = tracer.execute({'array': list(range(500)), 'pivot_strategy': 'median-of-three'})
+
+        assert result['result']['sorted_array'] == list(range(500))
+        assert result['result']['max_depth'] <= 10
+        assert result['trace']['total_steps'] < tracer.MAX_STEPS
+
+    def test_deep_partitions_do_not_recurse(self):
+        """Sorted input with the last-element pivot no longer hits the recursion limit."""
+        tracer = QuickSortTracer()
+        tracer.set_granularity('summary')
+        result = tracer.execute({'array': list(range(1050))})
+
+        assert result['result']['max_depth'] == 1049
+        assert result['result']['sorted_array'] == list(range(1050))
+
+    def test_depth_matches_recursive_order(self):
+        """Subarrays are visited left-first with recursive depths."""
+        tracer = QuickSortTracer()
+        result = tracer.execute({'array': [4, 1, 3, 9, 7, 8, 5, 2, 6]})
+
+        recurse = [(s['data']['low'], s['data']['high'], s['data']['depth'])
+                   for s in result['trace']['steps'] if s['type'] == 'RECURSE']
+        assert recurse == [(0, 8, 1), (0, 4, 2), (2, 4, 3), (6, 8, 2)]
+        assert tracer.recursion_depth == 0
+
+    @pytest.mark.parametrize("input_data,match", [
+        ({'array': [2, 1], 'pivot_strategy': 'first'}, "Invalid pivot_strategy"),
+        ({'array': [2, 1], 'pivot_strategy': 'random', 'seed': '1'}, "seed must be an integer"),
+        ({'array': [2, 1], 'pivot_strategy': 'random', 'seed': True}, "seed must be an integer"),
+    ])
+    def test_invalid_options_raise(self, input_data, match):
+        """Unknown strategies and non-integer seeds are rejected."""
+        with pytest.raises(ValueError, match=match):
+            QuickSortTracer().execute(input_data)
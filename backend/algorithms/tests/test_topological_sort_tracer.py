@@ -527,11 +527,11 @@ class TestTopologicalSortEdgeCases:
             tracer.execute({'nodes': [], 'edges': []})
 
     def test_too_many_nodes_raises_error(self):
-        """More than 10 nodes should raise ValueError."""
+        """More than MAX_NODES nodes should raise ValueError."""
         tracer = TopologicalSortTracer()
-        nodes = [f'N{i}' for i in range(11)]
+        nodes = [f'N{i}' for i in range(TopologicalSortTracer.MAX_NODES + 1)]
         
-        with pytest.raises(ValueError, match="Maximum 10 nodes"):
+        with pytest.raises(ValueError, match=f"Maximum {TopologicalSortTracer.MAX_NODES} nodes"):
             tracer.execute({'nodes': nodes, 'edges': []})
 
     def test_invalid_edge_format_raises_error(self):
@@ -597,6 +597,20 @@ class TestTopologicalSortEdgeCases:
         assert result['result']['has_cycle'] is False
         assert len(result['result']['sorted_order']) == 3
 
+    def test_max_nodes_chain(self):
+        """A chain of MAX_NODES nodes sorts in order with one 'ready' node at a time."""
+        nodes = [f'N{i}' for i in range(TopologicalSortTracer.MAX_NODES)]
+        edges = [(nodes[i], nodes[i + 1]) for i in range(len(nodes) - 1)]
+
+        tracer = TopologicalSortTracer()
+        result = tracer.execute({'nodes': nodes, 'edges': edges})
+
+        assert result['result']['sorted_order'] == nodes
+        for step in result['trace']['steps']:
+            state = step['data']['visualization']
+            ready = [n['id'] for n in state['nodes'] if n['state'] == 'ready']
+            assert ready == state['queue']
+
 
 # =============================================================================
 # Test Class 6: Metadata Compliance
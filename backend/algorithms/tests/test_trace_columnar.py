@@ -0,0 +1,143 @@
+# backend/algorithms/tests/test_trace_columnar.py
+"""
+Tests for the columnar trace layout.
+
+Test Categories:
+1. Encoding of synthetic traces (static/dynamic/coded columns)
+2. Tables that stay row-oriented
+3. Round trip on every registered tracer
+"""
+
+import json
+
+import pytest
+
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+from algorithms.trace_columnar import decode_columnar, encode_columnar
+from algorithms.trace_sampling import decimate_trace
+
+
+def make_trace(visualizations, step_type='STEP'):
+    """Build a minimal trace result with one step per visualization."""
+    return {
+        'result': None,
+        'trace': {
+            'steps': [
+                {'step': i, 'type': step_type, 'timestamp': 0.0,
+                 'data': {'visualization': v}, 'description': ''}
+                for i, v in enumerate(visualizations)
+            ],
+            'total_steps': len(visualizations),
+            'duration': 0.0
+        },
+        'metadata': {'algorithm': 'test', 'prediction_points': []}
+    }
+
+
+def array(values, states):
+    return [{'index': i, 'value': v, 'state': s} for i, (v, s) in enumerate(zip(values, states))]
+
+
+def round_trip(trace_result):
+    """Encode, serialize, parse and decode, as a client would."""
+    return decode_columnar(json.loads(json.dumps(encode_columnar(trace_result))))
+
+
+@pytest.mark.unit
+class TestEncodeColumnar:
+    """Tables split into static and per-step columns."""
+
+    def test_static_dynamic_and_coded_columns(self):
+        """Unchanging columns are sent once; string columns become code runs."""
+        trace = make_trace([
+            {'array': array([3, 1], ['default', 'default']), 'pointers': {'i': 0}},
+            {'array': array([1, 3], ['sorted', 'default']), 'pointers': {'i': 1}},
+        ])
+        encoded = encode_columnar(trace)['trace']
+
+        assert encoded['layout'] == 'columnar'
+        assert encoded['tables'] == {
+            'array': {
+                'keys': ['index', 'value', 'state'],
+                'static': {'index': [0, 1]},
+                'dynamic': ['value', 'state'],
+                'coded': ['state']
+            }
+        }
+        assert encoded['strings'] == ['default', 'sorted', 'STEP']
+        first, second = encoded['steps']
+        assert first['type'] == 2
+        assert first['data']['visualization'] == {'array': [[3, 1], [[0, 2, 0]]], 'pointers': {'i': 0}}
+        assert second['data']['visualization']['array'] == [[1, 3], [[0, 1, 1], [1, 2, 0]]]
+
+    def test_input_not_modified(self):
+        """Encoding copies the steps it changes."""
+        trace = make_trace([{'array': array([1], ['a'])}])
+        before = json.dumps(trace)
+        encode_columnar(trace)
+
+        assert json.dumps(trace) == before
+
+    def test_typed_values_are_not_static(self):
+        """1 and True compare equal but serialize differently."""
+        trace = make_trace([{'t': [{'v': 1}]}, {'t': [{'v': True}]}])
+
+        assert encode_columnar(trace)['trace']['tables']['t']['dynamic'] == ['v']
+        assert round_trip(trace) == trace
+
+    def test_varying_row_count(self):
+        """Tables whose length changes keep every column per step."""
+        trace = make_trace([{'t': []}, {'t': [{'id': 'a'}]}, {'t': [{'id': 'a'}, {'id': 'b'}]}])
+
+        assert encode_columnar(trace)['trace']['tables']['t']['static'] == {}
+        assert round_trip(trace) == trace
+
+
+@pytest.mark.edge_case
+class TestRowOrientedFallback:
+    """Values that are not uniform tables are left untouched."""
+
+    @pytest.mark.parametrize('values', [
+        [[{'a': 1}, {'b': 2}]],                  # rows with different keys
+        [[{'a': 1}], [1, 2]],                    # list of dicts, then scalars
+        [[{'a': 1}], None],                      # table, then not a list
+        [[]],                                    # never has rows
+    ])
+    def test_not_a_table(self, values):
+        """Mixed or keyless lists stay row-oriented and still round-trip."""
+        trace = make_trace([{'t': value} for value in values])
+        encoded = encode_columnar(trace)['trace']
+
+        assert 't' not in encoded['tables']
+        assert [s['data']['visualization']['t'] for s in encoded['steps']] == values
+        assert round_trip(trace) == trace
+
+    def test_decode_rows_trace_is_noop(self):
+        """Row-oriented traces pass through decode_columnar unchanged."""
+        trace = make_trace([{'array': array([1], ['a'])}])
+
+        assert decode_columnar(trace) is trace
+
+
+@pytest.mark.integration
+class TestColumnarRoundTripAllAlgorithms:
+    """Every tracer's output decodes back to the identical JSON."""
+
+    @pytest.mark.parametrize('algorithm_name', [a['name'] for a in registry.list_algorithms()])
+    def test_round_trip(self, algorithm_name):
+        """Decoded JSON matches the original byte for byte and is smaller."""
+        result = registry.get(algorithm_name)().execute(generate_input(algorithm_name, 12, seed=3))
+        encoded = json.dumps(encode_columnar(result))
+
+        assert json.dumps(decode_columnar(json.loads(encoded))) == json.dumps(result)
+        assert len(encoded) < len(json.dumps(result))
+
+    def test_round_trip_after_sampling(self):
+        """Sampled traces encode like any other trace."""
+        tracer = registry.get('bubble-sort')()
+        result = decimate_trace(
+            tracer.execute(generate_input('bubble-sort', 30, seed=1)), 40, tracer.DECISION_STEP_TYPES
+        )
+
+        assert round_trip(result) == json.loads(json.dumps(result))
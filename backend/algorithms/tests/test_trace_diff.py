@@ -0,0 +1,188 @@
+# backend/algorithms/tests/test_trace_diff.py
+"""
+Tests for the step-level trace diff.
+
+Test Categories:
+1. Identical traces and ignored fields
+2. Alignment: changed, inserted and removed steps
+3. Result, metadata and input validation
+4. Real tracers, including columnar responses
+"""
+
+import copy
+import json
+
+import pytest
+
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+from algorithms.trace_columnar import encode_columnar
+from algorithms.trace_diff import BLOCK_SIZE, changed_fields, diff_traces
+
+
+def make_step(i, step_type, value=None):
+    return {
+        'step': i, 'type': step_type, 'timestamp': i * 0.25,
+        'data': {'value': i if value is None else value, 'visualization': {'array': [i, i + 1]}},
+        'description': f'step {i}'
+    }
+
+
+def make_trace(types, result=7):
+    return {
+        'result': result,
+        'trace': {'steps': [make_step(i, t) for i, t in enumerate(types)], 'total_steps': len(types), 'duration': 0.1},
+        'metadata': {'algorithm': 'test', 'prediction_points': []}
+    }
+
+
+def renumbered(trace_result):
+    """Renumber steps after an edit, as a tracer would."""
+    for i, step in enumerate(trace_result['trace']['steps']):
+        step['step'] = i
+    return trace_result
+
+
+@pytest.mark.unit
+class TestIdenticalTraces:
+    """Equal traces report no divergence; wall-clock fields are ignored."""
+
+    def test_identical(self):
+        report = diff_traces(make_trace(['A', 'B', 'A']), make_trace(['A', 'B', 'A']))
+
+        assert report['identical'] is True
+        assert report['first_divergence'] is None
+        assert report['summary'] == {'equal': 3, 'changed': 0, 'inserted': 0, 'removed': 0}
+        assert report['blocks'] == [] and report['step_types'] == {}
+
+    def test_timestamps_and_duration_are_ignored(self):
+        right = make_trace(['A', 'B'])
+        right['trace']['duration'] = 9.0
+        for step in right['trace']['steps']:
+            step['timestamp'] += 100
+
+        assert diff_traces(make_trace(['A', 'B']), right)['identical'] is True
+
+    def test_json_types_are_distinguished(self):
+        """1, 1.0 and True serialize differently, so they differ."""
+        left, right = make_trace(['A']), make_trace(['A'])
+        left['trace']['steps'][0]['data']['value'] = 1
+        right['trace']['steps'][0]['data']['value'] = True
+
+        assert diff_traces(left, right)['first_divergence']['changed_fields'] == ['data.value']
+
+
+@pytest.mark.unit
+class TestAlignment:
+    """Steps are aligned so one edit doesn't shift every later step."""
+
+    def test_changed_step(self):
+        types = ['A'] * (BLOCK_SIZE * 3)
+        right = make_trace(types)
+        right['trace']['steps'][150]['data']['visualization']['array'][1] = -1
+
+        report = diff_traces(make_trace(types), right)
+
+        assert report['summary'] == {'equal': len(types) - 1, 'changed': 1, 'inserted': 0, 'removed': 0}
+        assert report['first_divergence'] == {
+            'kind': 'changed', 'left_step': 150, 'right_step': 150, 'left_type': 'A', 'right_type': 'A',
+            'changed_fields': ['data.visualization.array[1]']
+        }
+        assert report['blocks'] == [{'op': 'replace', 'left': [150, 151], 'right': [150, 151]}]
+
+    def test_inserted_step(self):
+        """Later steps still match although their numbers shift."""
+        left = make_trace(['A', 'B', 'C', 'D'])
+        right = copy.deepcopy(left)
+        right['trace']['steps'].insert(2, make_step(0, 'X', value=42))
+        renumbered(right)
+
+        report = diff_traces(left, right)
+
+        assert report['summary'] == {'equal': 4, 'changed': 0, 'inserted': 1, 'removed': 0}
+        assert report['first_divergence']['kind'] == 'inserted'
+        assert report['first_divergence']['right_step'] == 2
+        assert report['first_divergence']['left_step'] is None
+        assert report['step_types'] == {'X': {'left': 0, 'right': 1}}
+        assert report['steps'] == {'left': 4, 'right': 5}
+
+    def test_removed_step(self):
+        left = make_trace(['A', 'B', 'C'])
+        right = copy.deepcopy(left)
+        del right['trace']['steps'][0]
+        renumbered(right)
+
+        report = diff_traces(left, right)
+
+        assert report['summary']['removed'] == 1 and report['summary']['equal'] == 2
+        assert report['first_divergence']['left_type'] == 'A'
+
+    def test_type_change_is_removal_plus_insertion(self):
+        left, right = make_trace(['A', 'B']), make_trace(['A', 'C'])
+
+        report = diff_traces(left, right)
+
+        assert report['summary'] == {'equal': 1, 'changed': 0, 'inserted': 1, 'removed': 1}
+        assert report['first_divergence']['kind'] == 'removed'
+
+    def test_changed_fields_limit_and_paths(self):
+        left = {'a': [1, 2, 3], 'b': {'c': 1}, 'd': 1}
+        right = {'a': [1, 2], 'b': {'c': 2, 'e': 0}}
+
+        assert changed_fields(left, right) == ['a', 'b.c', 'b.e', 'd']
+        assert changed_fields(left, right, limit=2) == ['a', 'b.c']
+
+
+@pytest.mark.edge_case
+class TestResultAndValidation:
+    """Result and metadata are compared; malformed traces raise ValueError."""
+
+    def test_result_and_metadata(self):
+        right = make_trace(['A'], result=8)
+        right['metadata']['extra'] = True
+
+        report = diff_traces(make_trace(['A']), right)
+
+        assert report['identical'] is False
+        assert report['first_divergence'] is None
+        assert report['result_equal'] is False
+        assert report['metadata_changed'] == ['extra']
+
+    def test_empty_traces(self):
+        assert diff_traces(make_trace([]), make_trace([]))['identical'] is True
+
+    @pytest.mark.parametrize('value', [None, [], {'trace': {}}, {'trace': {'steps': [1]}}])
+    def test_invalid_trace_result(self, value):
+        with pytest.raises(ValueError, match="Invalid right"):
+            diff_traces(make_trace(['A']), value)
+
+
+@pytest.mark.integration
+class TestTracerTraces:
+    """Diffs of real tracer output."""
+
+    def test_same_input_is_identical(self):
+        tracer_class = registry.get('merge-sort')
+        input_data = generate_input('merge-sort', 16, seed=4)
+
+        assert diff_traces(tracer_class().execute(input_data), tracer_class().execute(input_data))['identical']
+
+    def test_columnar_matches_rows(self):
+        """A columnar response is decoded before comparing."""
+        result = registry.get('dijkstras-algorithm')().execute(generate_input('dijkstras-algorithm', 8, seed=1))
+        parsed = json.loads(json.dumps(result))
+
+        assert diff_traces(parsed, json.loads(json.dumps(encode_columnar(result))))['identical']
+
+    def test_different_inputs(self):
+        """Two inputs diverge at their first differing step."""
+        tracer_class = registry.get('binary-search')
+        left = tracer_class().execute({'array': [1, 3, 5, 7, 9], 'target': 3})
+        right = tracer_class().execute({'array': [1, 3, 5, 7, 9], 'target': 9})
+
+        report = diff_traces(left, right)
+
+        assert report['identical'] is False
+        assert report['result_equal'] is False
+        assert report['first_divergence']['left_step'] == 0
+        assert 'data.target' in report['first_divergence']['changed_fields']
@@ -0,0 +1,166 @@
+# backend/algorithms/tests/test_trace_projection.py
+"""
+Tests for step filtering and field projection.
+
+Test Categories:
+1. Field projection (fields / exclude_fields)
+2. Step filtering (include_types) and option validation
+3. Streamed serialization matches the projected copy
+"""
+
+import json
+
+import pytest
+
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+from algorithms.trace_columnar import decode_columnar, encode_columnar
+from algorithms.trace_projection import TraceProjection, iter_trace_json, project_trace
+
+
+def make_step(i, step_type):
+    return {
+        'step': i, 'type': step_type, 'timestamp': 0.5,
+        'data': {'value': i, 'visualization': {'array': [i], 'pointers': {'i': i}}},
+        'description': f'step {i}'
+    }
+
+
+def make_trace(types):
+    return {
+        'result': 7,
+        'trace': {'steps': [make_step(i, t) for i, t in enumerate(types)], 'total_steps': len(types), 'duration': 0.1},
+        'metadata': {'algorithm': 'test', 'prediction_points': []}
+    }
+
+
+def compact(obj):
+    return json.dumps(obj, separators=(',', ':'))
+
+
+@pytest.mark.unit
+class TestFieldProjection:
+    """fields keeps, exclude_fields drops, by dotted path."""
+
+    def test_fields_keep_step_key_order(self):
+        """Kept fields stay in the step's own order."""
+        step = TraceProjection(fields=['description', 'step']).project_step(make_step(0, 'A'))
+
+        assert list(step) == ['step', 'description']
+
+    def test_nested_fields(self):
+        """Dotted paths keep part of a nested dict."""
+        step = TraceProjection(fields=['type', 'data.visualization.pointers']).project_step(make_step(3, 'A'))
+
+        assert step == {'type': 'A', 'data': {'visualization': {'pointers': {'i': 3}}}}
+
+    def test_shorter_path_wins(self):
+        """Keeping 'data' keeps all of it, whatever the path order."""
+        for fields in (['data', 'data.value'], ['data.value', 'data']):
+            step = make_step(1, 'A')
+            assert TraceProjection(fields=fields).project_step(step) == {'data': step['data']}
+
+    def test_exclude_fields(self):
+        """Excluded paths are removed; the input step is not modified."""
+        step = make_step(2, 'A')
+        projected = TraceProjection(exclude_fields=['timestamp', 'data.visualization']).project_step(step)
+
+        assert projected == {'step': 2, 'type': 'A', 'data': {'value': 2}, 'description': 'step 2'}
+        assert 'visualization' in step['data']
+
+    def test_missing_paths_are_ignored(self):
+        """Excluding absent fields returns the step itself."""
+        step = make_step(0, 'A')
+
+        assert TraceProjection(exclude_fields=['nope', 'data.nope.deeper']).project_step(step) is step
+        assert TraceProjection(fields=['description.length']).project_step(step) == {'description': 'step 0'}
+
+    def test_fields_then_exclude(self):
+        """exclude_fields applies to what fields kept."""
+        projection = TraceProjection(fields=['data'], exclude_fields=['data.visualization'])
+
+        assert projection.project_step(make_step(4, 'A')) == {'data': {'value': 4}}
+
+
+@pytest.mark.unit
+class TestStepFilter:
+    """include_types selects steps; option values are validated."""
+
+    def test_include_types(self):
+        """Kept steps keep their original numbers; total_steps counts them."""
+        result = project_trace(make_trace(['A', 'B', 'A', 'C']), TraceProjection(include_types=['A', 'C']))
+
+        assert [s['step'] for s in result['trace']['steps']] == [0, 2, 3]
+        assert result['trace']['total_steps'] == 3
+
+    def test_repeated_types_count_once(self):
+        """Listing a type twice keeps each of its steps once."""
+        projection = TraceProjection(include_types=['A', 'A', 'B', 'A'])
+
+        assert projection.include_types == ['A', 'B']
+        assert [s['step'] for s in project_trace(make_trace(['A', 'B', 'A']), projection)['trace']['steps']] == [0, 1, 2]
+
+    def test_known_indices_skip_the_scan(self):
+        """Precomputed indices (e.g. from the tracer) are used as given."""
+        projection = TraceProjection(include_types=['A'])
+
+        assert projection.kept_indices(make_trace(['A', 'B', 'A'])['trace']['steps'], [0, 2]) == [0, 2]
+
+    def test_inactive_without_options(self):
+        """No option leaves the projection inactive; empty lists are options."""
+        assert not TraceProjection().active
+        assert TraceProjection(include_types=[]).active
+        assert project_trace(make_trace(['A']), TraceProjection(include_types=[]))['trace']['steps'] == []
+
+    @pytest.mark.parametrize('kwargs', [
+        {'include_types': 'A'},
+        {'fields': [1]},
+        {'exclude_fields': ['']},
+        {'fields': {'step': True}},
+    ])
+    def test_invalid_options_raise(self, kwargs):
+        with pytest.raises(ValueError, match='expected a list of non-empty strings'):
+            TraceProjection(**kwargs)
+
+
+@pytest.mark.integration
+class TestStreamedSerialization:
+    """iter_trace_json() streams exactly the projected copy."""
+
+    @pytest.mark.parametrize('sort_keys', [False, True])
+    def test_matches_projected_copy(self, sort_keys):
+        """Chunks join to the compact JSON of project_trace()."""
+        trace_result = make_trace(['A', 'B', 'A'])
+        projection = TraceProjection(include_types=['A'], exclude_fields=['data.visualization'])
+
+        def dumps(obj):
+            return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys)
+
+        streamed = ''.join(iter_trace_json(trace_result, projection, dumps))
+        assert streamed == dumps(project_trace(trace_result, projection))
+
+    def test_no_kept_steps(self):
+        """An empty selection is still a valid document."""
+        streamed = ''.join(iter_trace_json(make_trace(['A']), TraceProjection(include_types=['B']), compact))
+
+        assert json.loads(streamed)['trace'] == {'steps': [], 'total_steps': 0, 'duration': 0.1}
+
+    @pytest.mark.parametrize('algorithm_name', ['dijkstras-algorithm', 'merge-sort', 'meeting-rooms'])
+    def test_tracer_index_matches_scan(self, algorithm_name):
+        """The tracer's step-type index selects the same steps as a scan."""
+        tracer = registry.get(algorithm_name)()
+        result = tracer.execute(generate_input(algorithm_name, 12, seed=2))
+        types = sorted(tracer.DECISION_STEP_TYPES)
+        projection = TraceProjection(include_types=types, fields=['step', 'type'])
+
+        indexed = project_trace(result, projection, tracer.step_indices(*types))
+        assert indexed == project_trace(result, projection)
+        assert indexed['trace']['total_steps'] > 0
+
+    def test_columnar_after_projection(self):
+        """Projected steps without 'type' or 'data' still encode and decode."""
+        result = registry.get('bubble-sort')().execute(generate_input('bubble-sort', 8, seed=1))
+        for fields in (['step', 'description'], ['data.visualization.array']):
+            projected = project_trace(result, TraceProjection(fields=fields))
+
+            assert decode_columnar(json.loads(json.dumps(encode_columnar(projected)))) == projected
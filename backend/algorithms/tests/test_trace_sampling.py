@@ -0,0 +1,170 @@
+# backend/algorithms/tests/test_trace_sampling.py
+"""
+Tests for trace step sampling (decimation).
+
+Test Categories:
+1. Index selection (tiers, uniform spread, cap)
+2. decimate_trace() on synthetic traces (remapping, keyframes, validation)
+3. decimate_trace() on every registered tracer
+"""
+
+import pytest
+
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+from algorithms.trace_sampling import decimate_trace, select_step_indices
+
+
+def make_trace(types, prediction_indices=()):
+    """Build a minimal trace result with the given step types."""
+    return {
+        'result': None,
+        'trace': {
+            'steps': [
+                {'step': i, 'type': t, 'timestamp': 0.0, 'data': {'i': i}, 'description': ''}
+                for i, t in enumerate(types)
+            ],
+            'total_steps': len(types),
+            'duration': 0.0
+        },
+        'metadata': {
+            'algorithm': 'test',
+            'prediction_points': [
+                {'step_index': i, 'question': '?', 'choices': [], 'correct_answer': 'a'}
+                for i in prediction_indices
+            ]
+        }
+    }
+
+
+@pytest.mark.unit
+class TestSelectStepIndices:
+    """Test tiered index selection."""
+
+    def test_everything_fits(self):
+        """All indices are kept when the budget allows."""
+        tiers = [[(0,), (9,)], [(i,) for i in range(10)]]
+        assert select_step_indices(10, tiers) == list(range(10))
+
+    def test_uniform_spread(self):
+        """A tier that doesn't fit is sampled at evenly spaced positions."""
+        tiers = [[(i,) for i in range(100)]]
+        assert select_step_indices(4, tiers) == [12, 37, 62, 87]
+
+    def test_higher_tiers_first(self):
+        """Lower tiers only get the budget left over."""
+        tiers = [[(0,), (99,)], [(50,), (60,)], [(i,) for i in range(100)]]
+        kept = select_step_indices(5, tiers)
+
+        assert len(kept) == 5
+        assert {0, 99, 50, 60} <= set(kept)
+
+    def test_groups_are_kept_together(self):
+        """Pairs are never split, even when the budget is odd."""
+        tiers = [[(i, i + 1) for i in range(0, 40, 2)]]
+        kept = select_step_indices(7, tiers)
+
+        assert len(kept) == 6
+        assert all(i + 1 in kept for i in kept if i % 2 == 0)
+
+
+@pytest.mark.unit
+class TestDecimateTrace:
+    """Test decimate_trace() on synthetic traces."""
+
+    def test_cap_and_endpoints(self):
+        """Output has at most max_steps steps and keeps the first and last."""
+        trace = make_trace(['STEP'] * 1000)
+        sampled = decimate_trace(trace, 20)
+        steps = sampled['trace']['steps']
+
+        assert len(steps) == sampled['trace']['total_steps'] == 20
+        assert steps[0]['data']['i'] == 0
+        assert steps[-1]['data']['i'] == 999
+        assert [s['step'] for s in steps] == list(range(20))
+        assert sampled['metadata']['sampling']['step_map'] == [s['data']['i'] for s in steps]
+
+    def test_short_trace_unchanged(self):
+        """Traces within the cap keep every step."""
+        trace = make_trace(['A', 'B', 'C'], prediction_indices=[1])
+        sampled = decimate_trace(trace, 10)
+
+        assert [s['type'] for s in sampled['trace']['steps']] == ['A', 'B', 'C']
+        assert sampled['metadata']['prediction_points'][0]['step_index'] == 1
+
+    def test_predictions_remapped_with_answer_step(self):
+        """Kept predictions point at the same step, and the answer step follows it."""
+        types = ['STEP'] * 200
+        trace = make_trace(types, prediction_indices=[37, 123])
+        sampled = decimate_trace(trace, 10)
+        steps = sampled['trace']['steps']
+
+        indices = [p['step_index'] for p in sampled['metadata']['prediction_points']]
+        assert [steps[i]['data']['i'] for i in indices] == [37, 123]
+        assert [steps[i + 1]['data']['i'] for i in indices] == [38, 124]
+
+    def test_decision_steps_kept(self):
+        """Decision steps are kept in preference to ordinary steps."""
+        types = ['STEP'] * 300
+        for i in (40, 41, 250):
+            types[i] = 'DECIDE'
+        sampled = decimate_trace(make_trace(types), 8, decision_types={'DECIDE'})
+
+        kept = [s['data']['i'] for s in sampled['trace']['steps']]
+        assert {40, 41, 250} <= set(kept)
+        assert len(kept) == 8
+
+    def test_excess_predictions_are_thinned_and_dropped(self):
+        """When predictions alone exceed the cap, survivors stay consistent."""
+        trace = make_trace(['Q', 'A'] * 100, prediction_indices=range(0, 200, 2))
+        sampled = decimate_trace(trace, 21)
+        steps = sampled['trace']['steps']
+        predictions = sampled['metadata']['prediction_points']
+
+        assert len(steps) <= 21
+        assert sampled['metadata']['sampling']['dropped_predictions'] == 100 - len(predictions)
+        for p in predictions:
+            assert steps[p['step_index']]['type'] == 'Q'
+            assert steps[p['step_index'] + 1]['data']['i'] == steps[p['step_index']]['data']['i'] + 1
+
+    def test_input_not_modified(self):
+        """decimate_trace() returns a new result."""
+        trace = make_trace(['STEP'] * 50, prediction_indices=[30])
+        decimate_trace(trace, 5)
+
+        assert trace['trace']['total_steps'] == 50
+        assert trace['trace']['steps'][30]['step'] == 30
+        assert trace['metadata']['prediction_points'][0]['step_index'] == 30
+        assert 'sampling' not in trace['metadata']
+
+    @pytest.mark.parametrize('max_steps', [1, 0, -5, 2.5, '10', True])
+    def test_invalid_max_steps_raises(self, max_steps):
+        """max_steps must be an integer >= 2."""
+        with pytest.raises(ValueError, match="max_output_steps"):
+            decimate_trace(make_trace(['STEP'] * 5), max_steps)
+
+
+@pytest.mark.integration
+class TestDecimateRegisteredTracers:
+    """Sampling works for every registered tracer."""
+
+    @pytest.mark.parametrize('algorithm_name', [alg['name'] for alg in registry.list_algorithms()])
+    def test_sampled_trace_is_consistent(self, algorithm_name):
+        """Cap honoured; predictions reference their original step and answer."""
+        size = 10 if algorithm_name == 'topological-sort' else 60
+        tracer = registry.get(algorithm_name)()
+        full = tracer.execute(generate_input(algorithm_name, size, seed=1))
+        sampled = decimate_trace(full, 40, tracer.DECISION_STEP_TYPES)
+
+        steps = sampled['trace']['steps']
+        step_map = sampled['metadata']['sampling']['step_map']
+        assert len(steps) <= 40
+        assert steps[0]['type'] == full['trace']['steps'][0]['type']
+        assert step_map[-1] == full['trace']['total_steps'] - 1
+
+        original = {p['question']: p for p in full['metadata']['prediction_points']}
+        for p in sampled['metadata']['prediction_points']:
+            assert steps[p['step_index']]['data'] is full['trace']['steps'][step_map[p['step_index']]]['data']
+            if p['step_index'] + 1 < len(steps):
+                assert step_map[p['step_index'] + 1] == step_map[p['step_index']] + 1
+            assert p['question'] in original
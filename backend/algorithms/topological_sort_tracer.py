@@ -15,8 +15,9 @@ VERSION: 1.0 - Initial implementation with Backend Checklist v2.2 compliance
 """
 
 from typing import Any, List, Dict, Set
-from collections import deque, defaultdict
+from collections import Counter, deque
 from .base_tracer import AlgorithmTracer
+from .graph_compiler import compile_graph
 
 
 class TopologicalSortTracer(AlgorithmTracer):
@@ -33,17 +34,36 @@ class TopologicalSortTracer(AlgorithmTracer):
     Prediction points ask: "Which node(s) will be added to queue next?"
     """
 
+    # Bounded by MAX_STEPS (2 + V + E steps), not by per-step cost
+    MAX_NODES = 100
+    PHASE_STEP_TYPES = frozenset({'PROCESS_NODE'})
+    DECISION_STEP_TYPES = frozenset({'ENQUEUE_ZERO_INDEGREE', 'DETECT_CYCLE'})
+
     def __init__(self):
         super().__init__()
         self.nodes = []
         self.edges = []
-        self.adjacency_list = {}
+        self.graph = None  # CompiledGraph (directed)
         self.indegree_map = {}
         self.queue = deque()
+        self.queued = Counter()  # Membership index for self.queue
         self.sorted_order = []
         self.processed_nodes = set()
         self.current_node = None
 
+    def _enqueue(self, node: str) -> None:
+        """Append node to the queue and its membership index."""
+        self.queue.append(node)
+        self.queued[node] += 1
+
+    def _dequeue(self) -> str:
+        """Pop the front node from the queue and its membership index."""
+        node = self.queue.popleft()
+        self.queued[node] -= 1
+        if not self.queued[node]:
+            del self.queued[node]
+        return node
+
     def _get_visualization_state(self) -> dict:
         """
         Return current graph state with node/edge states and algorithm structures.
@@ -90,7 +110,7 @@ class TopologicalSortTracer(AlgorithmTracer):
             return 'sorted'
         if node == self.current_node:
             return 'processing'
-        if node in self.queue:
+        if node in self.queued:
             return 'ready'
         return 'unprocessed'
 
@@ -148,7 +168,7 @@ class TopologicalSortTracer(AlgorithmTracer):
             if step_type == "CALC_INDEGREES":
                 narrative += "**Graph Structure (Adjacency List):**\n"
                 for node in sorted(self.nodes):
-                    neighbors = self.adjacency_list.get(node, [])
+                    neighbors = list(self.graph.neighbors(node))
                     if neighbors:
                         narrative += f"- **{node}** → {neighbors}\n"
                     else:
@@ -382,32 +402,20 @@ class TopologicalSortTracer(AlgorithmTracer):
         if not self.nodes:
             raise ValueError("Nodes list cannot be empty")
         
-        if len(self.nodes) > 10:
-            raise ValueError("Maximum 10 nodes allowed")
-
-        # Validate edges reference valid nodes
-        node_set = set(self.nodes)
-        for edge in self.edges:
-            if len(edge) != 2:
-                raise ValueError(f"Invalid edge format: {edge}")
-            from_node, to_node = edge
-            if from_node not in node_set:
-                raise ValueError(f"Edge references unknown node: {from_node}")
-            if to_node not in node_set:
-                raise ValueError(f"Edge references unknown node: {to_node}")
+        if len(self.nodes) > self.MAX_NODES:
+            raise ValueError(f"Maximum {self.MAX_NODES} nodes allowed")
+
+        # Validate edges and build directed adjacency (shared, cached)
+        self.graph = compile_graph(self.nodes, self.edges, directed=True)
 
         # Initialize data structures
-        self.adjacency_list = defaultdict(list)
         self.indegree_map = {node: 0 for node in self.nodes}
         self.queue = deque()
+        self.queued = Counter()
         self.sorted_order = []
         self.processed_nodes = set()
         self.current_node = None
 
-        # Build adjacency list
-        for from_node, to_node in self.edges:
-            self.adjacency_list[from_node].append(to_node)
-
         # Set metadata
         self.metadata = {
             'algorithm': 'topological-sort',
@@ -438,7 +446,7 @@ class TopologicalSortTracer(AlgorithmTracer):
         initial_zero_indegree = []
         for node in self.nodes:
             if self.indegree_map[node] == 0:
-                self.queue.append(node)
+                self._enqueue(node)
                 initial_zero_indegree.append(node)
 
         self._add_step(
@@ -454,14 +462,14 @@ class TopologicalSortTracer(AlgorithmTracer):
         while self.queue:
             # Dequeue node
             queue_before = list(self.queue)
-            self.current_node = self.queue.popleft()
+            self.current_node = self._dequeue()
             node = self.current_node
             
             # Add to sorted order
             self.sorted_order.append(node)
             self.processed_nodes.add(node)
             
-            neighbors = self.adjacency_list.get(node, [])
+            neighbors = list(self.graph.neighbors(node))
             
             self._add_step(
                 "PROCESS_NODE",
@@ -482,7 +490,7 @@ class TopologicalSortTracer(AlgorithmTracer):
                 
                 # If in-degree becomes 0, enqueue
                 if new_indegree == 0:
-                    self.queue.append(neighbor)
+                    self._enqueue(neighbor)
                 
                 self._add_step(
                     "DECREMENT_NEIGHBOR",
@@ -533,9 +541,10 @@ class TopologicalSortTracer(AlgorithmTracer):
         """
         predictions = []
 
-        for i, step in enumerate(self.trace):
+        for i in self.step_indices("PROCESS_NODE"):
+            step = self.trace[i]
             # Prediction opportunity: After PROCESS_NODE, before DECREMENT_NEIGHBOR
-            if step.type == "PROCESS_NODE" and i + 1 < len(self.trace):
+            if i + 1 < len(self.trace):
                 node = step.data['node']
                 neighbors = step.data['neighbors']
                 
@@ -0,0 +1,230 @@
+# backend/algorithms/trace_columnar.py
+"""
+Columnar trace layout.
+
+Row-oriented steps repeat the same entity keys ('index', 'value', 'state',
+'id', 'start', 'end', ...) for every element of every step. The columnar
+layout splits each visualization table (a list of dicts with the same keys,
+such as 'array', 'all_intervals', 'nodes' or 'edges') into columns:
+
+- Columns identical in every step (array indices, interval geometry, edge
+  endpoints) are sent once in trace['tables'][name]['static'].
+- The remaining columns are sent per step, in trace['tables'][name]['dynamic']
+  order. String columns (states, colors) are integer codes into
+  trace['strings'], run-length encoded as [[start, stop, code], ...].
+- Step 'type' values are codes into trace['strings'] as well.
+
+Everything else in a step is left as is; steps may lack 'type' or 'data'
+(e.g. after a field projection). decode_columnar() restores the
+row-oriented trace exactly.
+
+Encoded trace:
+    {
+        'steps': [...],                 # visualization tables replaced by
+                                        # lists of dynamic columns
+        'total_steps': int,
+        'duration': float,
+        'layout': 'columnar',
+        'strings': [str, ...],
+        'tables': {
+            name: {'keys': [...], 'static': {key: [...]},
+                   'dynamic': [key, ...], 'coded': [key, ...]}
+        }
+    }
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .array_states import expand_state_runs, state_runs
+
+
+TRACE_LAYOUTS = ('rows', 'columnar')
+
+
+class _StringTable:
+    """Assigns dense integer codes to strings in first-use order."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        return self.codes.setdefault(value, len(self.codes))
+
+    @property
+    def values(self) -> List[str]:
+        return list(self.codes)
+
+
+def _same_column(a: Sequence[Any], b: Sequence[Any]) -> bool:
+    """Equal length and values, and equal types (1, 1.0 and True differ in JSON)."""
+    return len(a) == len(b) and all(x == y and type(x) is type(y) for x, y in zip(a, b))
+
+
+def _table_occurrences(steps: Sequence[dict]) -> Dict[str, List[list]]:
+    """
+    Collect each visualization key's row lists across steps.
+
+    A key is a table only if every step that has it holds a list of dicts
+    there, all rows sharing one key order.
+    """
+    occurrences: Dict[str, List[list]] = {}
+    rejected = set()
+    for step in steps:
+        visualization = step.get('data', {}).get('visualization')
+        if not isinstance(visualization, dict):
+            continue
+        for name, value in visualization.items():
+            if name in rejected:
+                continue
+            if not isinstance(value, list) or not all(isinstance(row, dict) for row in value):
+                rejected.add(name)
+                occurrences.pop(name, None)
+                continue
+            occurrences.setdefault(name, []).append(value)
+    return occurrences
+
+
+def _encode_table(occurrences: List[list], strings: _StringTable) -> Optional[tuple]:
+    """
+    Split one table's occurrences into a spec and per-occurrence columns.
+
+    Returns:
+        tuple: (spec, encoded) where encoded[i] is the list of dynamic
+               columns for occurrence i, or None if rows have mixed keys
+    """
+    keys = None
+    for rows in occurrences:
+        for row in rows:
+            if keys is None:
+                keys = tuple(row)
+            elif tuple(row) != keys:
+                return None
+    if keys is None:
+        return None
+
+    columns = {key: [[row[key] for row in rows] for rows in occurrences] for key in keys}
+    static, dynamic, coded = {}, [], []
+    for key, per_step in columns.items():
+        first = per_step[0]
+        if all(_same_column(column, first) for column in per_step[1:]):
+            static[key] = first
+        else:
+            dynamic.append(key)
+            if all(isinstance(value, str) for column in per_step for value in column):
+                coded.append(key)
+
+    encoded = [
+        [
+            state_runs([strings.code(value) for value in columns[key][i]]) if key in coded
+            else columns[key][i]
+            for key in dynamic
+        ]
+        for i in range(len(occurrences))
+    ]
+    spec = {'keys': list(keys), 'static': static, 'dynamic': dynamic, 'coded': coded}
+    return spec, encoded
+
+
+def encode_columnar(trace_result: dict) -> dict:
+    """
+    Return a copy of trace_result with trace['steps'] in columnar layout.
+
+    The input is not modified; steps without visualization tables are only
+    copied shallowly.
+
+    Args:
+        trace_result: Result of AlgorithmTracer.execute() (optionally sampled)
+
+    Returns:
+        dict: Trace result whose trace has 'layout': 'columnar'
+    """
+    trace = trace_result['trace']
+    steps = trace['steps']
+    strings = _StringTable()
+
+    tables: Dict[str, dict] = {}
+    pending: Dict[str, Iterator[list]] = {}
+    for name, occurrences in _table_occurrences(steps).items():
+        table = _encode_table(occurrences, strings)
+        if table is not None:
+            tables[name], encoded = table
+            pending[name] = iter(encoded)
+
+    encoded_steps = []
+    for step in steps:
+        encoded_step = dict(step)
+        if 'type' in step:
+            encoded_step['type'] = strings.code(step['type'])
+        visualization = step.get('data', {}).get('visualization')
+        if isinstance(visualization, dict) and any(name in pending for name in visualization):
+            encoded_step['data'] = {
+                **step['data'],
+                'visualization': {
+                    name: next(pending[name]) if name in pending else value
+                    for name, value in visualization.items()
+                }
+            }
+        encoded_steps.append(encoded_step)
+
+    return {
+        **trace_result,
+        'trace': {
+            **trace,
+            'steps': encoded_steps,
+            'layout': 'columnar',
+            'strings': strings.values,
+            'tables': tables
+        }
+    }
+
+
+def _decode_table(spec: dict, columns: List[list], strings: List[str]) -> List[dict]:
+    """Rebuild one table's rows from its spec and a step's dynamic columns."""
+    values = dict(zip(spec['dynamic'], columns))
+    for key in spec['coded']:
+        values[key] = [strings[code] for code in expand_state_runs(values[key])]
+    values.update(spec['static'])
+    keys = spec['keys']
+    return [dict(zip(keys, row)) for row in zip(*(values[key] for key in keys))]
+
+
+def decode_columnar(trace_result: dict) -> dict:
+    """
+    Restore the row-oriented layout of a trace encoded by encode_columnar().
+
+    Traces that are not columnar are returned unchanged.
+
+    Args:
+        trace_result: Trace result, typically parsed from a JSON response
+
+    Returns:
+        dict: Trace result with row-oriented steps
+    """
+    trace = trace_result['trace']
+    if trace.get('layout') != 'columnar':
+        return trace_result
+
+    strings = trace['strings']
+    tables = trace['tables']
+    steps = []
+    for step in trace['steps']:
+        decoded_step = dict(step)
+        if 'type' in step:
+            decoded_step['type'] = strings[step['type']]
+        visualization = step.get('data', {}).get('visualization')
+        if isinstance(visualization, dict) and any(name in tables for name in visualization):
+            decoded_step['data'] = {
+                **step['data'],
+                'visualization': {
+                    name: _decode_table(tables[name], value, strings) if name in tables else value
+                    for name, value in visualization.items()
+                }
+            }
+        steps.append(decoded_step)
+
+    decoded_trace = {
+        key: value for key, value in trace.items()
+        if key not in ('layout', 'strings', 'tables')
+    }
+    decoded_trace['steps'] = steps
+    return {**trace_result, 'trace': decoded_trace}
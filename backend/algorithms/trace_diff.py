@@ -0,0 +1,225 @@
+# backend/algorithms/trace_diff.py
+"""
+Step-level diff of two traces.
+
+Tuning a tracer needs a quick answer to "which steps changed?". Generic
+JSON diffs of two 10k-step traces are slow and drown in timestamp noise.
+diff_traces() compares two trace results step by step instead:
+
+1. Each step gets a fingerprint: a hash of its canonical JSON without
+   'timestamp' and 'step' (the step number only restates its position).
+2. The common prefix and suffix are skipped by comparing fingerprint
+   blocks, so identical stretches cost one slice comparison per block.
+3. The rest is aligned on fingerprints (difflib), so an inserted or
+   removed step doesn't make every later step differ. Within unmatched
+   runs, steps are paired in order: a pair with the same type is a
+   changed step, anything else is a removal plus an insertion.
+
+The report names the first divergence (with the changed fields of a
+changed step) and summarizes the rest.
+
+Report:
+    {
+        'identical': bool,            # steps, result and metadata all equal
+        'steps': {'left': int, 'right': int},
+        'summary': {'equal': int, 'changed': int, 'inserted': int, 'removed': int},
+        'first_divergence': None | {
+            'kind': 'changed' | 'inserted' | 'removed',
+            'left_step': int | None, 'right_step': int | None,
+            'left_type': str | None, 'right_type': str | None,
+            'changed_fields': [path, ...]   # 'changed' only
+        },
+        'step_types': {type: {'left': int, 'right': int}},   # counts that differ
+        'blocks': [{'op': 'replace' | 'insert' | 'delete',
+                    'left': [start, stop], 'right': [start, stop]}, ...],
+        'result_equal': bool,
+        'metadata_changed': [key, ...]
+    }
+
+Columnar traces are decoded first, so saved API responses of either
+layout can be compared.
+"""
+
+import json
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Any, List, Optional, Sequence
+
+from .trace_columnar import decode_columnar
+
+
+# Step fields that differ between runs without a behaviour change
+IGNORED_STEP_FIELDS = frozenset({'timestamp', 'step'})
+
+# Steps compared per slice when skipping the common prefix and suffix
+BLOCK_SIZE = 64
+
+# Report size limits
+MAX_CHANGED_FIELDS = 20
+MAX_BLOCKS = 50
+
+
+def _canonical(value: Any) -> str:
+    """JSON text with sorted keys; distinguishes 1, 1.0 and True."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def step_fingerprints(steps: Sequence[dict]) -> List[int]:
+    """Hash of each step's content, ignoring IGNORED_STEP_FIELDS."""
+    return [
+        hash(_canonical({key: value for key, value in step.items() if key not in IGNORED_STEP_FIELDS}))
+        for step in steps
+    ]
+
+
+def _common_prefix(left: Sequence[int], right: Sequence[int]) -> int:
+    """Length of the common prefix, skipping equal blocks in one comparison each."""
+    limit = min(len(left), len(right))
+    start = 0
+    while start + BLOCK_SIZE <= limit and left[start:start + BLOCK_SIZE] == right[start:start + BLOCK_SIZE]:
+        start += BLOCK_SIZE
+    while start < limit and left[start] == right[start]:
+        start += 1
+    return start
+
+
+def changed_fields(left: Any, right: Any, path: str = '',
+                   limit: int = MAX_CHANGED_FIELDS) -> List[str]:
+    """
+    Dotted paths ('data.visualization.array[3].state') where two values differ.
+
+    Dicts are compared by key and lists by index; a length or type change
+    is reported at the container's own path. At most limit paths are
+    returned, in traversal order.
+    """
+    changes: List[str] = []
+
+    def walk(a: Any, b: Any, at: str):
+        if len(changes) >= limit:
+            return
+        if isinstance(a, dict) and isinstance(b, dict):
+            for key in list(a) + [key for key in b if key not in a]:
+                child = f"{at}.{key}" if at else str(key)
+                if key not in a or key not in b:
+                    changes.append(child)
+                else:
+                    walk(a[key], b[key], child)
+        elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+            for index, (x, y) in enumerate(zip(a, b)):
+                walk(x, y, f"{at}[{index}]")
+        elif type(a) is not type(b) or a != b:
+            changes.append(at)
+
+    walk(left, right, path)
+    return changes[:limit]
+
+
+def _step_changes(left: dict, right: dict) -> List[str]:
+    """changed_fields() of two steps, ignoring IGNORED_STEP_FIELDS."""
+    def content(step):
+        return {key: value for key, value in step.items() if key not in IGNORED_STEP_FIELDS}
+    return changed_fields(content(left), content(right))
+
+
+def _check_trace_result(name: str, trace_result: Any):
+    """Raise ValueError unless trace_result has a list of step dicts."""
+    trace = trace_result.get('trace') if isinstance(trace_result, dict) else None
+    steps = trace.get('steps') if isinstance(trace, dict) else None
+    if not isinstance(steps, list) or not all(isinstance(step, dict) for step in steps):
+        raise ValueError(f"Invalid {name}: expected a trace result with a 'trace.steps' list")
+
+
+def _divergence(kind: str, left_steps: Sequence[dict], right_steps: Sequence[dict],
+                left_index: Optional[int], right_index: Optional[int]) -> dict:
+    divergence = {
+        'kind': kind,
+        'left_step': left_index,
+        'right_step': right_index,
+        'left_type': left_steps[left_index].get('type') if left_index is not None else None,
+        'right_type': right_steps[right_index].get('type') if right_index is not None else None,
+    }
+    if kind == 'changed':
+        divergence['changed_fields'] = _step_changes(left_steps[left_index], right_steps[right_index])
+    return divergence
+
+
+def diff_traces(left: dict, right: dict) -> dict:
+    """
+    Compare two trace results step by step.
+
+    Args:
+        left: Trace result (e.g. before a change, or for the first input)
+        right: Trace result to compare against left
+
+    Returns:
+        dict: Diff report (see module docstring)
+
+    Raises:
+        ValueError: If either side is not a trace result
+    """
+    _check_trace_result('left', left)
+    _check_trace_result('right', right)
+    left, right = decode_columnar(left), decode_columnar(right)
+    left_steps, right_steps = left['trace']['steps'], right['trace']['steps']
+    left_prints, right_prints = step_fingerprints(left_steps), step_fingerprints(right_steps)
+
+    prefix = _common_prefix(left_prints, right_prints)
+    suffix = _common_prefix(left_prints[prefix:][::-1], right_prints[prefix:][::-1])
+    left_stop, right_stop = len(left_prints) - suffix, len(right_prints) - suffix
+
+    summary = {'equal': prefix + suffix, 'changed': 0, 'inserted': 0, 'removed': 0}
+    blocks = []
+    first: Optional[dict] = None
+
+    matcher = SequenceMatcher(None, left_prints[prefix:left_stop], right_prints[prefix:right_stop], autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        i1, i2, j1, j2 = i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix
+        if op == 'equal':
+            summary['equal'] += i2 - i1
+            continue
+        if len(blocks) < MAX_BLOCKS:
+            blocks.append({'op': op, 'left': [i1, i2], 'right': [j1, j2]})
+
+        for offset in range(max(i2 - i1, j2 - j1)):
+            i = i1 + offset if i1 + offset < i2 else None
+            j = j1 + offset if j1 + offset < j2 else None
+            if i is not None and j is not None and left_steps[i].get('type') == right_steps[j].get('type'):
+                kinds = ['changed']
+            else:
+                kinds = (['removed'] if i is not None else []) + (['inserted'] if j is not None else [])
+            for kind in kinds:
+                summary[kind] += 1
+            if first is None:
+                kind = kinds[0]
+                first = _divergence(
+                    kind, left_steps, right_steps,
+                    i if kind != 'inserted' else None,
+                    j if kind != 'removed' else None
+                )
+
+    left_types = Counter(step['type'] for step in left_steps if 'type' in step)
+    right_types = Counter(step['type'] for step in right_steps if 'type' in step)
+    step_types = {
+        step_type: {'left': left_types[step_type], 'right': right_types[step_type]}
+        for step_type in list(left_types) + [t for t in right_types if t not in left_types]
+        if left_types[step_type] != right_types[step_type]
+    }
+
+    result_equal = _canonical(left.get('result')) == _canonical(right.get('result'))
+    left_metadata, right_metadata = left.get('metadata', {}), right.get('metadata', {})
+    metadata_changed = [
+        key for key in list(left_metadata) + [k for k in right_metadata if k not in left_metadata]
+        if key not in left_metadata or key not in right_metadata
+        or _canonical(left_metadata[key]) != _canonical(right_metadata[key])
+    ]
+
+    return {
+        'identical': first is None and result_equal and not metadata_changed,
+        'steps': {'left': len(left_steps), 'right': len(right_steps)},
+        'summary': summary,
+        'first_divergence': first,
+        'step_types': step_types,
+        'blocks': blocks,
+        'result_equal': result_equal,
+        'metadata_changed': metadata_changed,
+    }
@@ -0,0 +1,201 @@
+# backend/algorithms/trace_projection.py
+"""
+Step filtering and field projection for trace responses.
+
+Specialized consumers need only part of a trace: the SELECT_MIN_DIST steps
+of a Dijkstra run, or every description without its visualization. A
+TraceProjection selects steps and fields:
+
+- include_types: keep only steps of these types
+- fields: keep only these fields of each step
+- exclude_fields: drop these fields from each step
+
+Fields are dotted paths into a step, e.g. 'description', 'data' or
+'data.visualization'. A path that doesn't exist in a step is ignored.
+fields is applied before exclude_fields.
+
+Kept steps keep their original 'step' number, so they still match
+prediction point 'step_index' values; trace['total_steps'] is the number
+of kept steps.
+
+iter_trace_json() applies the projection while serializing: steps are
+projected one at a time as their JSON is produced, without building a
+filtered copy of the trace. project_trace() builds the copy, for layouts
+that transform the steps afterwards.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+PROJECTION_OPTIONS = ('include_types', 'fields', 'exclude_fields')
+
+# Stands in for the steps list when the rest of the response is serialized
+_STEPS_PLACEHOLDER = '\x00projected-steps\x00'
+
+
+def _string_list(name: str, value: Any) -> Optional[List[str]]:
+    """Validate an optional list of non-empty strings."""
+    if value is None:
+        return None
+    if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+        raise ValueError(f"Invalid {name}: expected a list of non-empty strings")
+    return value
+
+
+def _path_tree(paths: List[str]) -> Dict[str, Any]:
+    """
+    Nest dotted paths by key: {'data': {'visualization': None}}.
+
+    None marks a whole field; a shorter path wins over longer ones.
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        *parents, last = path.split('.')
+        node = tree
+        for key in parents:
+            child = node.setdefault(key, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[last] = None
+    return tree
+
+
+def _pick(value: dict, tree: Dict[str, Any]) -> dict:
+    """Keep only the fields in tree, in the value's key order."""
+    return {
+        key: item if tree[key] is None or not isinstance(item, dict) else _pick(item, tree[key])
+        for key, item in value.items() if key in tree
+    }
+
+
+def _drop(value: dict, tree: Dict[str, Any]) -> dict:
+    """Remove the fields in tree; returns value itself if none are present."""
+    changed: Dict[str, Any] = {}
+    for key, subtree in tree.items():
+        if key not in value:
+            continue
+        if subtree is None:
+            changed[key] = None
+        elif isinstance(value[key], dict):
+            item = _drop(value[key], subtree)
+            if item is not value[key]:
+                changed[key] = item
+    if not changed:
+        return value
+    return {
+        key: changed.get(key, item)
+        for key, item in value.items() if not (key in changed and tree[key] is None)
+    }
+
+
+class TraceProjection:
+    """
+    Step filter and field projection, validated once per request.
+
+    Attributes:
+        include_types: Step types to keep (None keeps every step)
+        active: False if no option was given (the trace is sent as is)
+    """
+
+    def __init__(self, include_types: Any = None, fields: Any = None, exclude_fields: Any = None):
+        """
+        Args:
+            include_types: Optional list of step types
+            fields: Optional list of dotted field paths to keep
+            exclude_fields: Optional list of dotted field paths to drop
+
+        Raises:
+            ValueError: If an option is not a list of non-empty strings
+        """
+        include_types = _string_list('include_types', include_types)
+        self.include_types = list(dict.fromkeys(include_types)) if include_types is not None else None
+        fields = _string_list('fields', fields)
+        exclude_fields = _string_list('exclude_fields', exclude_fields)
+        self._pick_tree = _path_tree(fields) if fields is not None else None
+        self._drop_tree = _path_tree(exclude_fields) if exclude_fields else None
+        self.active = not (include_types is None and fields is None and exclude_fields is None)
+
+    def kept_indices(self, steps: Sequence[dict], step_indices: Optional[List[int]] = None) -> Sequence[int]:
+        """
+        Indices of the steps to keep.
+
+        Args:
+            steps: Trace steps
+            step_indices: Indices of the include_types steps, if already
+                          known (e.g. AlgorithmTracer.step_indices())
+        """
+        if self.include_types is None:
+            return range(len(steps))
+        if step_indices is not None:
+            return step_indices
+        types = set(self.include_types)
+        return [i for i, step in enumerate(steps) if step['type'] in types]
+
+    def project_step(self, step: dict) -> dict:
+        """Shallow projection of one step (unchanged branches are shared)."""
+        if self._pick_tree is not None:
+            step = _pick(step, self._pick_tree)
+        if self._drop_tree is not None:
+            step = _drop(step, self._drop_tree)
+        return step
+
+
+def project_trace(trace_result: dict, projection: TraceProjection,
+                  step_indices: Optional[List[int]] = None) -> dict:
+    """
+    Return a copy of trace_result with the projection applied to its steps.
+
+    Args:
+        trace_result: Result of AlgorithmTracer.execute() (optionally sampled)
+        projection: Steps and fields to keep
+        step_indices: Passed to TraceProjection.kept_indices()
+
+    Returns:
+        dict: Trace result with projected steps
+    """
+    trace = trace_result['trace']
+    steps = trace['steps']
+    kept = projection.kept_indices(steps, step_indices)
+    return {
+        **trace_result,
+        'trace': {
+            **trace,
+            'steps': [projection.project_step(steps[i]) for i in kept],
+            'total_steps': len(kept)
+        }
+    }
+
+
+def iter_trace_json(trace_result: dict, projection: TraceProjection, dumps: Callable[[Any], str],
+                    step_indices: Optional[List[int]] = None) -> Iterator[str]:
+    """
+    Serialize trace_result with the projection applied, in chunks.
+
+    Everything but the steps is serialized with one dumps() call; each kept
+    step is then projected and serialized on its own, so the output matches
+    dumps(project_trace(...)) for compact separators without building it.
+
+    Args:
+        trace_result: Result of AlgorithmTracer.execute() (optionally sampled)
+        projection: Steps and fields to keep
+        dumps: JSON serializer (e.g. the Flask app's, for its key order)
+        step_indices: Passed to TraceProjection.kept_indices()
+
+    Yields:
+        str: Consecutive pieces of the JSON document
+    """
+    trace = trace_result['trace']
+    steps = trace['steps']
+    kept = projection.kept_indices(steps, step_indices)
+    outer = dumps({
+        **trace_result,
+        'trace': {**trace, 'steps': _STEPS_PLACEHOLDER, 'total_steps': len(kept)}
+    })
+    before, after = outer.split(dumps(_STEPS_PLACEHOLDER))
+
+    yield before + '['
+    for position, i in enumerate(kept):
+        yield (',' if position else '') + dumps(projection.project_step(steps[i]))
+    yield ']' + after
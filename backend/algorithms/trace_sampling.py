@@ -0,0 +1,154 @@
+# backend/algorithms/trace_sampling.py
+"""
+Step sampling (decimation) for large traces.
+
+Reduces a finished trace to at most max_steps steps. Steps are kept by
+priority tier, each tier sampled uniformly if it does not fit in the
+remaining budget:
+
+1. The first and last step
+2. Prediction points, each together with the step after it (where the
+   answer is revealed)
+3. Steps whose type is one of the tracer's DECISION_STEP_TYPES
+4. All other steps
+
+When the budget allows, every keyframe (tiers 1-3) is kept exactly. When it
+doesn't, prediction points whose question or answer step was dropped are
+removed, so every remaining prediction still has both. Kept steps are
+renumbered 0..M-1 and prediction 'step_index' values are remapped.
+"""
+
+from typing import Iterable, List, Sequence, Set, Tuple
+
+
+MIN_OUTPUT_STEPS = 2
+
+
+def _spread(groups: Sequence[Tuple[int, ...]], count: int) -> List[Tuple[int, ...]]:
+    """Pick 'count' groups evenly spaced through 'groups' (bucket centres)."""
+    return [groups[(2 * j + 1) * len(groups) // (2 * count)] for j in range(count)]
+
+
+def _cost(groups: Iterable[Tuple[int, ...]], kept: Set[int]) -> int:
+    """Number of new indices the groups would add."""
+    return len(set().union(*groups) - kept) if groups else 0
+
+
+def select_step_indices(
+    max_steps: int,
+    tiers: Sequence[Sequence[Tuple[int, ...]]]
+) -> List[int]:
+    """
+    Choose which step indices to keep.
+
+    Each tier is a list of groups; a group's indices are kept together or
+    not at all. Tiers are filled in order. A tier that doesn't fit in the
+    remaining budget contributes the largest evenly spaced subset of its
+    groups that does.
+
+    Args:
+        max_steps: Maximum number of indices to return
+        tiers: Groups of step indices, highest priority first
+
+    Returns:
+        list: Sorted indices to keep
+    """
+    kept: Set[int] = set()
+    for tier in tiers:
+        groups = [group for group in tier if not set(group) <= kept]
+        remaining = max_steps - len(kept)
+        if not groups or remaining <= 0:
+            continue
+
+        if _cost(groups, kept) <= remaining:
+            chosen = groups
+        else:
+            # Largest count of evenly spaced groups that fits
+            low, high = 0, len(groups)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if _cost(_spread(groups, middle), kept) <= remaining:
+                    low = middle
+                else:
+                    high = middle - 1
+            chosen = _spread(groups, low) if low else []
+
+        for group in chosen:
+            kept.update(group)
+
+    return sorted(kept)
+
+
+def decimate_trace(
+    trace_result: dict,
+    max_steps: int,
+    decision_types: Iterable[str] = ()
+) -> dict:
+    """
+    Return a copy of trace_result with at most max_steps steps.
+
+    The input is not modified; step dicts are copied shallowly.
+
+    Args:
+        trace_result: Result of AlgorithmTracer.execute()
+        max_steps: Maximum number of steps (>= MIN_OUTPUT_STEPS)
+        decision_types: Step types kept in preference to ordinary steps
+
+    Returns:
+        dict: Trace result with sampled steps, remapped prediction points and
+              metadata['sampling'] = {'max_steps', 'original_steps',
+              'kept_steps', 'dropped_predictions', 'step_map'}
+
+    Raises:
+        ValueError: If max_steps is not an integer >= MIN_OUTPUT_STEPS
+    """
+    if isinstance(max_steps, bool) or not isinstance(max_steps, int) or max_steps < MIN_OUTPUT_STEPS:
+        raise ValueError(
+            f"max_output_steps must be an integer >= {MIN_OUTPUT_STEPS}, got {max_steps!r}"
+        )
+
+    steps = trace_result['trace']['steps']
+    metadata = trace_result['metadata']
+    predictions = metadata.get('prediction_points', [])
+    decision_types = frozenset(decision_types)
+    last = len(steps) - 1
+
+    prediction_groups = [
+        (p['step_index'], p['step_index'] + 1) if p['step_index'] < last else (p['step_index'],)
+        for p in predictions
+    ]
+    tiers = [
+        [(0,), (last,)] if steps else [],
+        prediction_groups,
+        [(i,) for i, step in enumerate(steps) if step['type'] in decision_types],
+        [(i,) for i in range(len(steps))],
+    ]
+    kept = select_step_indices(max_steps, tiers)
+    new_index = {old: new for new, old in enumerate(kept)}
+
+    sampled_steps = [{**steps[old], 'step': new} for new, old in enumerate(kept)]
+    sampled_predictions = [
+        {**prediction, 'step_index': new_index[prediction['step_index']]}
+        for prediction, group in zip(predictions, prediction_groups)
+        if all(index in new_index for index in group)
+    ]
+
+    return {
+        **trace_result,
+        'trace': {
+            **trace_result['trace'],
+            'steps': sampled_steps,
+            'total_steps': len(sampled_steps)
+        },
+        'metadata': {
+            **metadata,
+            'prediction_points': sampled_predictions,
+            'sampling': {
+                'max_steps': max_steps,
+                'original_steps': len(steps),
+                'kept_steps': len(sampled_steps),
+                'dropped_predictions': len(predictions) - len(sampled_predictions),
+                'step_map': kept
+            }
+        }
+    }
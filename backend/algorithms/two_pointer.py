@@ -12,6 +12,7 @@ VERSION: 2.3 - Backend Checklist v2.2 Compliance
 
 from typing import Any, List, Dict
 from .base_tracer import AlgorithmTracer
+from .array_states import element_rows, paint_states, point
 
 
 class TwoPointerTracer(AlgorithmTracer):
@@ -27,6 +28,9 @@ class TwoPointerTracer(AlgorithmTracer):
     should it be kept or skipped?"
     """
 
+    PHASE_STEP_TYPES = frozenset({'HANDLE_UNIQUE'})
+    DECISION_STEP_TYPES = frozenset({'HANDLE_UNIQUE', 'HANDLE_DUPLICATE'})
+
     def __init__(self):
         super().__init__()
         self.array: List[int] = []
@@ -35,18 +39,17 @@ class TwoPointerTracer(AlgorithmTracer):
         self.fast: int = 1
         self.is_complete: bool = False
 
-    def _get_element_state(self, index: int) -> str:
-        """Determine the visual state of an array element."""
+    def _get_element_states(self) -> List[str]:
+        """Determine the visual state of every array element (later ranges win)."""
+        n = len(self.array)
         if self.is_complete:
-            return 'unique' if index < (self.slow + 1) else 'stale'
+            return paint_states(n, 'stale', [(0, self.slow + 1, 'unique')])
 
-        if index <= self.slow:
-            return 'unique'
-        if index < self.fast:
-            return 'duplicate'
-        if index == self.fast:
-            return 'examining'
-        return 'pending'
+        return paint_states(n, 'pending', [
+            point(self.fast, 'examining'),
+            (0, self.fast, 'duplicate'),
+            (0, self.slow + 1, 'unique'),
+        ])
 
     def _get_visualization_state(self) -> dict:
         """Return current array state with element states and pointers."""
@@ -54,14 +57,7 @@ class TwoPointerTracer(AlgorithmTracer):
             return {}
 
         return {
-            'array': [
-                {
-                    'index': i,
-                    'value': v,
-                    'state': self._get_element_state(i)
-                }
-                for i, v in enumerate(self.array)
-            ],
+            'array': element_rows(self.array, self._get_element_states()),
             'pointers': {
                 'slow': self.slow,
                 'fast': self.fast if self.fast < len(self.array) and not self.is_complete else None,
@@ -182,8 +178,9 @@ class TwoPointerTracer(AlgorithmTracer):
     def get_prediction_points(self) -> List[Dict[str, Any]]:
         """Identify prediction opportunities at each comparison step."""
         predictions = []
-        for i, step in enumerate(self.trace):
-            if step.type == "COMPARE" and i + 1 < len(self.trace):
+        for i in self.step_indices("COMPARE"):
+            step = self.trace[i]
+            if i + 1 < len(self.trace):
                 next_step = self.trace[i + 1]
                 compare_data = step.data
                 slow_val = compare_data['slow_value']
@@ -1,8 +1,19 @@
+from itertools import chain
+
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 
 # Import algorithms to ensure they register themselves with the registry
 from algorithms.registry import registry
+from algorithms.trace_columnar import TRACE_LAYOUTS, encode_columnar
+from algorithms.trace_diff import diff_traces
+from algorithms.trace_projection import (
+    PROJECTION_OPTIONS,
+    TraceProjection,
+    iter_trace_json,
+    project_trace,
+)
+from algorithms.trace_sampling import decimate_trace
 
 app = Flask(__name__)
 CORS(app)
@@ -56,7 +67,14 @@ def generate_trace_unified():
     Input format:
         {
             "algorithm": "binary-search",
-            "input": { ... }
+            "input": { ... },
+            "granularity": "fine" | "phase" | "summary",  # optional, default "fine"
+            "max_output_steps": int,                      # optional, sample the trace
+            "layout": "rows" | "columnar",                # optional, default "rows"
+            "mode": "trace" | "result_only",              # optional, default "trace"
+            "include_types": [str, ...],                  # optional, keep these step types
+            "fields": [str, ...],                         # optional, keep these step fields
+            "exclude_fields": [str, ...]                  # optional, drop these step fields
         }
     """
     try:
@@ -67,6 +85,10 @@ def generate_trace_unified():
         # Extract algorithm name and input
         algorithm_name = data.get("algorithm")
         algorithm_input = data.get("input")
+        granularity = data.get("granularity", "fine")
+        max_output_steps = data.get("max_output_steps")
+        layout = data.get("layout", "rows")
+        mode = data.get("mode", "trace")
 
         if not algorithm_name:
             return (
@@ -97,14 +119,66 @@ def generate_trace_unified():
         if algorithm_input is None:
             return jsonify({"error": "Missing required field: 'input'"}), 400
 
+        if layout not in TRACE_LAYOUTS:
+            return (
+                jsonify(
+                    {
+                        "error": f"Invalid layout '{layout}'. "
+                        f"Expected one of: {', '.join(TRACE_LAYOUTS)}"
+                    }
+                ),
+                400,
+            )
+
+        # Raises ValueError (400) for malformed options
+        projection = TraceProjection(**{name: data.get(name) for name in PROJECTION_OPTIONS})
+
         # Get tracer class and instantiate
         tracer_class = registry.get(algorithm_name)
         tracer = tracer_class()
+        tracer.set_granularity(granularity)
+        tracer.set_mode(mode)
 
         # Execute algorithm with input
         # Note: Algorithm-specific validation happens in tracer.execute()
         result = tracer.execute(algorithm_input)
 
+        # Delta steps build on the previous step, so dropping steps breaks replay
+        if result["metadata"].get("state_updates") == "delta" and (
+            max_output_steps is not None or projection.include_types is not None
+        ):
+            return (
+                jsonify(
+                    {
+                        "error": "state_updates 'delta' cannot be combined with "
+                        "max_output_steps or include_types"
+                    }
+                ),
+                400,
+            )
+
+        if max_output_steps is not None:
+            result = decimate_trace(result, max_output_steps, tracer.DECISION_STEP_TYPES)
+
+        if projection.active:
+            # Sampling renumbers steps, so the tracer's type index only
+            # applies to unsampled traces
+            step_indices = None
+            if projection.include_types is not None and max_output_steps is None:
+                step_indices = tracer.step_indices(*projection.include_types)
+
+            if layout != "columnar":
+                # Project while serializing, without a filtered copy
+                dumps = lambda obj: app.json.dumps(obj, separators=(",", ":"))
+                return app.response_class(
+                    chain(iter_trace_json(result, projection, dumps, step_indices), ["\n"]),
+                    mimetype="application/json",
+                )
+            result = project_trace(result, projection, step_indices)
+
+        if layout == "columnar":
+            result = encode_columnar(result)
+
         return jsonify(result)
 
     except ValueError as e:
@@ -122,6 +196,70 @@ def generate_trace_unified():
         return jsonify({"error": "An unexpected server error occurred"}), 500
 
 
+@app.route("/api/trace/diff", methods=["POST"])
+def diff_trace_results():
+    """
+    Step-level diff of two traces.
+
+    Input format, either two trace results (e.g. saved unified responses):
+        {
+            "left": { ... },
+            "right": { ... }
+        }
+    or one algorithm traced on two inputs:
+        {
+            "algorithm": "binary-search",
+            "inputs": [{ ... }, { ... }],
+            "granularity": "fine" | "phase" | "summary"   # optional, default "fine"
+        }
+    """
+    try:
+        data = request.json
+        if not data:
+            return jsonify({"error": "Request body must be JSON"}), 400
+
+        algorithm_name = data.get("algorithm")
+        if algorithm_name is None:
+            if "left" not in data or "right" not in data:
+                return (
+                    jsonify({"error": "Expected 'left' and 'right', or 'algorithm' and 'inputs'"}),
+                    400,
+                )
+            return jsonify(diff_traces(data["left"], data["right"]))
+
+        if algorithm_name not in registry:
+            available = [alg["name"] for alg in registry.list_algorithms()]
+            return (
+                jsonify(
+                    {
+                        "error": f"Unknown algorithm: '{algorithm_name}'",
+                        "available_algorithms": available,
+                    }
+                ),
+                404,
+            )
+
+        inputs = data.get("inputs")
+        if not isinstance(inputs, list) or len(inputs) != 2:
+            return jsonify({"error": "'inputs' must be a list of two inputs"}), 400
+
+        traces = []
+        for algorithm_input in inputs:
+            tracer = registry.get(algorithm_name)()
+            tracer.set_granularity(data.get("granularity", "fine"))
+            traces.append(tracer.execute(algorithm_input))
+
+        return jsonify(diff_traces(*traces))
+
+    except (ValueError, RuntimeError) as e:
+        # Invalid traces or options, and algorithm validation/execution errors
+        return jsonify({"error": str(e)}), 400
+
+    except Exception as e:
+        app.logger.error(f"Unexpected error in trace diff endpoint: {e}", exc_info=True)
+        return jsonify({"error": "An unexpected server error occurred"}), 500
+
+
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """
@@ -154,6 +292,7 @@ if __name__ == "__main__":
     print("   GET  /api/algorithms               - List all algorithms")
     print("   GET  /api/algorithms/<name>/info   - Get algorithm details")
     print("   POST /api/trace/unified            - Unified trace endpoint")
+    print("   POST /api/trace/diff               - Step-level diff of two traces")
     print("   GET  /api/health                   - Health check")
     print("=" * 60)
     print()
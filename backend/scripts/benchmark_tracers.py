@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Tracer Benchmark Utility Script
+
+This script measures the runtime cost of every registered algorithm tracer
+across a range of input sizes and writes a JSON report. Reports from two
+commits can be compared to catch performance regressions before they ship.
+
+Usage:
+    python backend/scripts/benchmark_tracers.py [options]
+    python backend/scripts/benchmark_tracers.py --sizes 10,100,500
+    python backend/scripts/benchmark_tracers.py --algorithms binary-search,merge-sort
+    python backend/scripts/benchmark_tracers.py --output after.json --baseline before.json
+
+Options:
+    --sizes N,N,...       Input sizes to benchmark (default: 10,50,200)
+    --algorithms A,B,...  Registered algorithm names (default: all)
+    --repeat N            Timed runs per measurement (default: 3)
+    --seed N              Seed for input generation (default: 0)
+    --output PATH         Write the JSON report to PATH (default: stdout summary only)
+    --baseline PATH       Compare against a previous report and exit 1 on regression
+    --threshold FLOAT     Allowed relative slowdown before flagging (default: 0.25)
+
+Measurements (per algorithm and size):
+    - execute() wall time (min / median / max over --repeat runs)
+    - Peak memory allocated during execute() (tracemalloc)
+    - Step count (trace.total_steps)
+    - Serialized response size in bytes (compact JSON, as sent by Flask)
+
+Inputs come from algorithms/input_generators.py, falling back to a generic
+walk of the registered input_schema for algorithms without a generator.
+Generation is seeded, so the same --seed and --sizes always benchmark the
+same data.
+Runs that the tracer rejects (ValueError) or aborts (RuntimeError, e.g. the
+MAX_STEPS limit) are recorded with status 'error' rather than stopping the run.
+"""
+
+import sys
+import json
+import time
+import random
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add backend directory to path to import algorithm modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input, has_generator
+
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = [10, 50, 200]
+DEFAULT_REPEAT = 3
+DEFAULT_SEED = 0
+DEFAULT_THRESHOLD = 0.25
+
+# Metrics compared against a baseline report (key -> human label)
+COMPARED_METRICS = {
+    'time_ms_median': 'time',
+    'peak_memory_bytes': 'memory',
+    'serialized_bytes': 'payload',
+    'steps': 'steps',
+}
+
+
+# =============================================================================
+# Schema-driven input generation
+# =============================================================================
+
+def _integer_value(schema: dict, size: int, rng: random.Random) -> int:
+    """Generate an integer honouring 'enum' and 'minimum' schema keywords."""
+    if 'enum' in schema:
+        return rng.choice(schema['enum'])
+    low = max(schema.get('minimum', 1), 1)
+    return rng.randint(low, low + max(size, 1) * 10)
+
+
+def _tuple_value(schema: dict, size: int, rng: random.Random, pool: List[str]) -> list:
+    """
+    Generate a fixed-length tuple such as [start, end] or [from, to, weight].
+
+    String positions are drawn (without repetition) from the identifier pool
+    so that edges always reference known nodes. Integer-only tuples are
+    returned sorted with distinct values, which keeps [start, end] pairs valid.
+    """
+    length = schema['minItems']
+    items = schema.get('items', {})
+    alternatives = [alt.get('type') for alt in items.get('oneOf', [])] or [items.get('type')]
+
+    if 'string' in alternatives and len(pool) >= 2:
+        endpoints = rng.sample(pool, 2)
+        weights = [_integer_value({}, size, rng) for _ in range(length - 2)]
+        return endpoints + weights
+
+    values = rng.sample(range(0, max(size, length) * 10 + length), length)
+    return sorted(values)
+
+
+def _object_value(schema: dict, index: int, size: int, rng: random.Random) -> dict:
+    """Generate one array element of type 'object' (e.g. an interval)."""
+    obj = {}
+    for name, prop in schema.get('properties', {}).items():
+        if name == 'id':
+            obj[name] = index + 1
+        elif prop.get('type') == 'string':
+            obj[name] = f"{name}-{index}"
+        else:
+            obj[name] = _integer_value(prop, size, rng)
+
+    # Keep start/end pairs well-formed regardless of the random draw
+    if 'start' in obj and 'end' in obj and obj['start'] >= obj['end']:
+        obj['start'], obj['end'] = min(obj['start'], obj['end']), max(obj['start'], obj['end']) + 1
+    return obj
+
+
+def _array_value(schema: dict, size: int, rng: random.Random, context: dict) -> list:
+    """Generate a top-level array property with 'size' elements."""
+    items = schema.get('items', {})
+
+    if items.get('type') == 'string':
+        pool = [f"N{i}" for i in range(size)]
+        context.setdefault('pool', pool)
+        return pool
+
+    if items.get('type') == 'object':
+        return [_object_value(items, i, size, rng) for i in range(size)]
+
+    if items.get('type') == 'array':
+        return [_tuple_value(items, size, rng, context.get('pool', [])) for _ in range(size)]
+
+    values = [_integer_value(items, size, rng) for _ in range(size)]
+    if 'sorted' in schema.get('description', '').lower():
+        values.sort()
+    return values
+
+
+def generate_input_from_schema(schema: Dict[str, Any], size: int, seed: int = DEFAULT_SEED) -> dict:
+    """
+    Build an input dict for an algorithm from its registered input_schema.
+
+    The generator is deliberately generic: array properties get 'size'
+    elements, scalar integers fall in [1, size] (valid for window sizes and
+    search targets), and scalar strings reuse the first generated identifier
+    list (valid for start nodes). Properties with a 'default' (optional
+    tuning knobs such as a pivot strategy) keep it. The schema's 'maxItems'
+    is ignored because it is a UI limit; the tracer's own validation is the
+    authority.
+
+    Args:
+        schema: JSON schema registered with the algorithm
+        size: Length of every generated array
+        seed: Seed for the random generator
+
+    Returns:
+        dict: Input suitable for tracer.execute()
+    """
+    rng = random.Random(f"{seed}:{size}")
+    context: Dict[str, Any] = {}
+    generated = {}
+
+    for name, prop in schema.get('properties', {}).items():
+        prop_type = prop.get('type')
+        if 'default' in prop:
+            generated[name] = prop['default']
+        elif prop_type == 'array':
+            generated[name] = _array_value(prop, size, rng, context)
+        elif prop_type == 'string':
+            pool = context.get('pool') or ['N0']
+            generated[name] = pool[0]
+        elif prop_type in ('integer', 'number'):
+            generated[name] = rng.randint(1, max(size, 1))
+
+    return generated
+
+
+def build_input(algorithm_name: str, schema: Dict[str, Any], size: int, seed: int = DEFAULT_SEED) -> dict:
+    """Use the algorithm's dedicated generator when one exists, else the schema."""
+    if has_generator(algorithm_name):
+        return generate_input(algorithm_name, size, seed)
+    return generate_input_from_schema(schema, size, seed)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def _execute(algorithm_name: str, input_data: dict) -> dict:
+    """Run a fresh tracer instance once."""
+    tracer = registry.get(algorithm_name)()
+    return tracer.execute(input_data)
+
+
+def measure(algorithm_name: str, input_data: dict, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    Measure one algorithm on one input.
+
+    Timing runs and the tracemalloc run are kept separate because tracing
+    allocations slows execution considerably.
+
+    Returns:
+        dict: Measurement record ('status' is 'ok' or 'error')
+    """
+    try:
+        timings = []
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            result = _execute(algorithm_name, input_data)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        try:
+            _execute(algorithm_name, input_data)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    except (ValueError, RuntimeError) as e:
+        return {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+    serialized = json.dumps(result, separators=(',', ':'))
+
+    return {
+        'status': 'ok',
+        'time_ms_min': round(min(timings), 4),
+        'time_ms_median': round(statistics.median(timings), 4),
+        'time_ms_max': round(max(timings), 4),
+        'peak_memory_bytes': peak,
+        'steps': result['trace']['total_steps'],
+        'serialized_bytes': len(serialized.encode('utf-8')),
+    }
+
+
+def run_benchmarks(
+    algorithm_names: List[str],
+    sizes: List[int],
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = DEFAULT_SEED,
+    verbose: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark each algorithm at each size.
+
+    Returns:
+        list: One record per (algorithm, size), in a stable order
+    """
+    results = []
+    for algorithm_name in algorithm_names:
+        schema = registry.get_metadata(algorithm_name).get('input_schema') or {}
+        for size in sizes:
+            record = {'algorithm': algorithm_name, 'size': size}
+            try:
+                input_data = build_input(algorithm_name, schema, size, seed)
+            except ValueError as e:
+                record.update({'status': 'error', 'error': f"ValueError: {e}"})
+            else:
+                record.update(measure(algorithm_name, input_data, repeat))
+            results.append(record)
+
+            if verbose:
+                print(format_record(record))
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current git commit hash, or None outside a repository."""
+    try:
+        completed = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            text=True,
+            cwd=backend_dir,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def build_report(results: List[Dict[str, Any]], sizes: List[int], repeat: int, seed: int) -> dict:
+    """Wrap benchmark records with the environment needed to compare reports."""
+    return {
+        'report_version': REPORT_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'git_commit': _git_commit(),
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+        },
+        'config': {
+            'sizes': sizes,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+# =============================================================================
+# Baseline comparison
+# =============================================================================
+
+def compare_reports(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare two reports and return the regressions found.
+
+    A metric regresses when current > baseline * (1 + threshold). A run that
+    succeeded in the baseline but errors now is always a regression.
+
+    Returns:
+        list: Regression records with algorithm, size, metric, baseline, current
+    """
+    baseline_index = {
+        (r['algorithm'], r['size']): r for r in baseline.get('results', [])
+    }
+
+    regressions = []
+    for record in current.get('results', []):
+        previous = baseline_index.get((record['algorithm'], record['size']))
+        if previous is None or previous['status'] != 'ok':
+            continue
+
+        if record['status'] != 'ok':
+            regressions.append({
+                'algorithm': record['algorithm'],
+                'size': record['size'],
+                'metric': 'status',
+                'baseline': 'ok',
+                'current': record.get('error', 'error'),
+            })
+            continue
+
+        for metric in COMPARED_METRICS:
+            before, after = previous[metric], record[metric]
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append({
+                    'algorithm': record['algorithm'],
+                    'size': record['size'],
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'ratio': round(after / before, 3),
+                })
+    return regressions
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def format_record(record: Dict[str, Any]) -> str:
+    """Format a single benchmark record as one console line."""
+    label = f"{record['algorithm']:<34} n={record['size']:<6}"
+    if record['status'] != 'ok':
+        return f"  {label} ⚠️  {record['error']}"
+    return (
+        f"  {label} {record['time_ms_median']:>10.2f} ms"
+        f" {record['peak_memory_bytes'] / 1024:>10.1f} KiB"
+        f" {record['steps']:>7} steps"
+        f" {record['serialized_bytes'] / 1024:>10.1f} KiB json"
+    )
+
+
+def _parse_int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def parse_args(argv: List[str]) -> dict:
+    """Parse command-line arguments into an options dict."""
+    options = {
+        'sizes': DEFAULT_SIZES,
+        'algorithms': None,
+        'repeat': DEFAULT_REPEAT,
+        'seed': DEFAULT_SEED,
+        'output': None,
+        'baseline': None,
+        'threshold': DEFAULT_THRESHOLD,
+    }
+    converters = {
+        '--sizes': ('sizes', _parse_int_list),
+        '--algorithms': ('algorithms', lambda v: [a for a in v.split(',') if a]),
+        '--repeat': ('repeat', int),
+        '--seed': ('seed', int),
+        '--output': ('output', Path),
+        '--baseline': ('baseline', Path),
+        '--threshold': ('threshold', float),
+    }
+
+    args = list(argv)
+    while args:
+        flag = args.pop(0)
+        if flag in ('-h', '--help'):
+            print(__doc__)
+            sys.exit(0)
+        if flag not in converters or not args:
+            print(f"❌ Invalid argument: {flag}")
+            print(__doc__)
+            sys.exit(1)
+        key, convert = converters[flag]
+        try:
+            options[key] = convert(args.pop(0))
+        except ValueError:
+            print(f"❌ Invalid value for {flag}")
+            sys.exit(1)
+
+    return options
+
+
+def main():
+    """Main entry point for script."""
+    options = parse_args(sys.argv[1:])
+
+    algorithm_names = options['algorithms'] or [alg['name'] for alg in registry.list_algorithms()]
+    unknown = [name for name in algorithm_names if not registry.is_registered(name)]
+    if unknown:
+        print(f"❌ Algorithm(s) not found: {', '.join(unknown)}")
+        print(f"   Available: {', '.join(alg['name'] for alg in registry.list_algorithms())}")
+        sys.exit(1)
+
+    print(f"\n{'='*70}")
+    print(f"Benchmarking {len(algorithm_names)} algorithm(s) at sizes {options['sizes']}")
+    print(f"Repeat: {options['repeat']}  Seed: {options['seed']}")
+    print(f"{'='*70}\n")
+
+    results = run_benchmarks(algorithm_names, options['sizes'], options['repeat'], options['seed'])
+    report = build_report(results, options['sizes'], options['repeat'], options['seed'])
+
+    if options['output']:
+        options['output'].write_text(json.dumps(report, indent=2))
+        print(f"\n📄 Report written to: {options['output']}")
+
+    exit_code = 0
+    if options['baseline']:
+        baseline = json.loads(options['baseline'].read_text())
+        regressions = compare_reports(baseline, report, options['threshold'])
+
+        print(f"\n{'='*70}")
+        if regressions:
+            print(f"⚠️  {len(regressions)} regression(s) vs {options['baseline']}:")
+            for r in regressions:
+                detail = f" (x{r['ratio']})" if 'ratio' in r else ""
+                print(f"   {r['algorithm']} n={r['size']} {r['metric']}: {r['baseline']} → {r['current']}{detail}")
+            exit_code = 1
+        else:
+            print(f"✅ No regressions vs {options['baseline']} (threshold {options['threshold']:.0%})")
+        print(f"{'='*70}\n")
+
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Trace Regression Check Script
+
+This script records the traces of every registered algorithm on seeded
+inputs, and compares a recording against a previous one step by step. Run
+it before and after a tracer refactor that should not change behaviour:
+any step, result or metadata difference is reported with its first
+divergence.
+
+Usage:
+    python backend/scripts/diff_traces.py --output before.json
+    python backend/scripts/diff_traces.py --baseline before.json
+    python backend/scripts/diff_traces.py --algorithms merge-sort --sizes 4,16 --output before.json
+
+Options:
+    --sizes N,N,...       Input sizes to record (default: 5,20)
+    --algorithms A,B,...  Registered algorithm names (default: all)
+    --seed N              Seed for input generation (default: 0)
+    --granularity G       fine | phase | summary (default: fine)
+    --output PATH         Write the recording to PATH
+    --baseline PATH       Re-run the inputs of a previous recording, compare,
+                          and exit 1 on any difference
+
+A recording stores each input with its trace, so a baseline is replayed on
+exactly the same inputs even if the input generators change; --sizes and
+--seed don't apply with --baseline. Wall-clock fields ('timestamp',
+'duration') are not compared.
+
+String hashing is seeded (PYTHONHASHSEED=0), so fields built from sets come
+out in the same order in every run.
+"""
+
+import os
+import sys
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add backend directory to path to import algorithm modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from algorithms.base_tracer import AlgorithmTracer
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+from algorithms.trace_diff import diff_traces
+
+
+RECORDING_VERSION = 1
+DEFAULT_SIZES = [5, 20]
+DEFAULT_SEED = 0
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+def record_trace(algorithm_name: str, input_data: Any, granularity: str = 'fine') -> Dict[str, Any]:
+    """
+    Trace one input.
+
+    Returns:
+        dict: {'trace': trace result} or {'error': str} if the tracer
+              raised ValueError or RuntimeError
+    """
+    tracer = registry.get(algorithm_name)()
+    try:
+        tracer.set_granularity(granularity)
+        return {'trace': tracer.execute(input_data)}
+    except (ValueError, RuntimeError) as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+
+
+def record_traces(
+    algorithm_names: List[str],
+    sizes: List[int],
+    seed: int = DEFAULT_SEED,
+    granularity: str = 'fine'
+) -> dict:
+    """Trace each algorithm at each size on generated inputs."""
+    records = []
+    for algorithm_name in algorithm_names:
+        for size in sizes:
+            input_data = generate_input(algorithm_name, size, seed)
+            records.append({
+                'algorithm': algorithm_name,
+                'size': size,
+                'input': input_data,
+                **record_trace(algorithm_name, input_data, granularity),
+            })
+    return {
+        'recording_version': RECORDING_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'config': {'sizes': sizes, 'seed': seed, 'granularity': granularity},
+        'records': records,
+    }
+
+
+# =============================================================================
+# Baseline comparison
+# =============================================================================
+
+def compare_recording(baseline: dict, algorithm_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Re-run every baseline input and diff the new trace against the recorded one.
+
+    Args:
+        baseline: Recording written by record_traces()
+        algorithm_names: Only compare these algorithms (default: all recorded)
+
+    Returns:
+        list: One comparison per baseline record, with 'algorithm', 'size',
+              'identical' and either 'diff' (a diff_traces() report) or
+              'baseline_error' / 'current_error'
+    """
+    granularity = baseline['config']['granularity']
+    comparisons = []
+    for record in baseline['records']:
+        if algorithm_names is not None and record['algorithm'] not in algorithm_names:
+            continue
+        # Compare as serialized: JSON turns integer dict keys into strings
+        current = json.loads(json.dumps(record_trace(record['algorithm'], record['input'], granularity)))
+        comparison = {'algorithm': record['algorithm'], 'size': record['size']}
+
+        if 'trace' in record and 'trace' in current:
+            diff = diff_traces(record['trace'], current['trace'])
+            comparison.update({'identical': diff['identical'], 'diff': diff})
+        else:
+            baseline_error, current_error = record.get('error'), current.get('error')
+            comparison.update({
+                'identical': baseline_error == current_error,
+                'baseline_error': baseline_error,
+                'current_error': current_error,
+            })
+        comparisons.append(comparison)
+    return comparisons
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    """Format a single comparison as one console line."""
+    label = f"{comparison['algorithm']:<34} n={comparison['size']:<6}"
+    if 'diff' not in comparison:
+        if comparison['identical']:
+            return f"  {label} ✅ same error: {comparison['current_error']}"
+        return f"  {label} ⚠️  error: {comparison['baseline_error']} → {comparison['current_error']}"
+
+    diff = comparison['diff']
+    if diff['identical']:
+        return f"  {label} ✅ {diff['steps']['left']} steps identical"
+
+    details = []
+    first = diff['first_divergence']
+    if first is not None:
+        at = first['left_step'] if first['left_step'] is not None else first['right_step']
+        step_type = first['left_type'] or first['right_type']
+        fields = ', '.join(first.get('changed_fields', [])[:3])
+        details.append(f"step {at} {first['kind']} ({step_type}){': ' + fields if fields else ''}")
+    if not diff['result_equal']:
+        details.append('result differs')
+    if diff['metadata_changed']:
+        details.append(f"metadata: {', '.join(diff['metadata_changed'])}")
+    return f"  {label} ⚠️  {'; '.join(details)}"
+
+
+def _parse_int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def _parse_granularity(value: str) -> str:
+    if value not in AlgorithmTracer.GRANULARITIES:
+        raise ValueError(value)
+    return value
+
+
+def parse_args(argv: List[str]) -> dict:
+    """Parse command-line arguments into an options dict."""
+    options = {
+        'sizes': DEFAULT_SIZES,
+        'algorithms': None,
+        'seed': DEFAULT_SEED,
+        'granularity': 'fine',
+        'output': None,
+        'baseline': None,
+    }
+    converters = {
+        '--sizes': ('sizes', _parse_int_list),
+        '--algorithms': ('algorithms', lambda v: [a for a in v.split(',') if a]),
+        '--seed': ('seed', int),
+        '--granularity': ('granularity', _parse_granularity),
+        '--output': ('output', Path),
+        '--baseline': ('baseline', Path),
+    }
+
+    args = list(argv)
+    while args:
+        flag = args.pop(0)
+        if flag in ('-h', '--help'):
+            print(__doc__)
+            sys.exit(0)
+        if flag not in converters or not args:
+            print(f"❌ Invalid argument: {flag}")
+            print(__doc__)
+            sys.exit(1)
+        key, convert = converters[flag]
+        try:
+            options[key] = convert(args.pop(0))
+        except ValueError:
+            print(f"❌ Invalid value for {flag}")
+            sys.exit(1)
+
+    if options['output'] is None and options['baseline'] is None:
+        print("❌ Nothing to do: pass --output and/or --baseline")
+        print(__doc__)
+        sys.exit(1)
+
+    return options
+
+
+def main():
+    """Main entry point for script."""
+    options = parse_args(sys.argv[1:])
+
+    if os.environ.get('PYTHONHASHSEED') != '0':
+        # Restart with seeded string hashing, so set-ordered fields are reproducible
+        os.execve(sys.executable, [sys.executable, *sys.argv], {**os.environ, 'PYTHONHASHSEED': '0'})
+
+    algorithm_names = options['algorithms']
+    unknown = [name for name in algorithm_names or [] if not registry.is_registered(name)]
+    if unknown:
+        print(f"❌ Algorithm(s) not found: {', '.join(unknown)}")
+        print(f"   Available: {', '.join(alg['name'] for alg in registry.list_algorithms())}")
+        sys.exit(1)
+
+    exit_code = 0
+    if options['baseline']:
+        baseline = json.loads(options['baseline'].read_text())
+        comparisons = compare_recording(baseline, algorithm_names)
+
+        print(f"\n{'='*70}")
+        print(f"Comparing {len(comparisons)} trace(s) against {options['baseline']}")
+        print(f"{'='*70}\n")
+        for comparison in comparisons:
+            print(format_comparison(comparison))
+
+        changed = [c for c in comparisons if not c['identical']]
+        print(f"\n{'='*70}")
+        if changed:
+            print(f"⚠️  {len(changed)} of {len(comparisons)} trace(s) differ from {options['baseline']}")
+            exit_code = 1
+        else:
+            print(f"✅ All {len(comparisons)} trace(s) identical to {options['baseline']}")
+        print(f"{'='*70}\n")
+
+    if options['output']:
+        names = algorithm_names or [alg['name'] for alg in registry.list_algorithms()]
+        recording = record_traces(names, options['sizes'], options['seed'], options['granularity'])
+        options['output'].write_text(json.dumps(recording, separators=(',', ':')))
+        print(f"📄 {len(recording['records'])} trace(s) written to: {options['output']}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
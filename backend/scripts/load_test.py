@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+API Load Test Utility Script
+
+This script replays a realistic mix of API traffic against backend/app.py
+and reports latency percentiles and throughput. Everything runs locally:
+no external network access is needed.
+
+Usage:
+    python backend/scripts/load_test.py [options]
+    python backend/scripts/load_test.py --requests 500 --concurrency 8
+    python backend/scripts/load_test.py --mode http --concurrency 16
+    python backend/scripts/load_test.py --mix list=1,info=1,trace=8 --trace-size 50
+
+Options:
+    --mode client|http    'client' uses the Flask test client in-process (unit-level);
+                          'http' starts a local threaded server on 127.0.0.1 and
+                          sends real HTTP requests over sockets (default: client)
+    --requests N          Total requests to send (default: 200)
+    --concurrency N       Worker threads sending requests (default: 4)
+    --mix K=W,...         Relative weights for list, info and trace traffic
+                          (default: list=1,info=2,trace=7)
+    --trace-size N        Use generated inputs of size N for trace requests instead
+                          of the registered example inputs (default: examples)
+    --seed N              Seed for the request plan (default: 0)
+    --output PATH         Write the JSON report to PATH
+
+Traffic kinds:
+    list   GET  /api/algorithms
+    info   GET  /api/algorithms/<name>/info
+    trace  POST /api/trace/unified
+
+Report:
+    Per kind and overall: request count, status code histogram, p50/p95/p99/max
+    latency in milliseconds, and throughput in requests per second.
+"""
+
+import sys
+import json
+import time
+import random
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add backend directory to path to import algorithm modules
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import app
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input, MIN_SIZES
+
+
+DEFAULT_REQUESTS = 200
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MIX = {'list': 1, 'info': 2, 'trace': 7}
+DEFAULT_SEED = 0
+PERCENTILES = (50, 95, 99)
+
+
+# =============================================================================
+# Request plan
+# =============================================================================
+
+def build_request_plan(
+    total: int,
+    mix: Dict[str, int],
+    seed: int = DEFAULT_SEED,
+    trace_size: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build a deterministic list of requests following the traffic mix.
+
+    Info and trace requests pick registered algorithms at random; trace
+    requests use either the algorithm's example inputs or generated inputs
+    of 'trace_size'.
+
+    Returns:
+        list: [{'kind', 'method', 'path', 'body'}, ...]
+    """
+    rng = random.Random(seed)
+    algorithms = registry.list_algorithms()
+    kinds = [kind for kind in mix if mix[kind] > 0]
+    weights = [mix[kind] for kind in kinds]
+
+    plan = []
+    for index in range(total):
+        kind = rng.choices(kinds, weights)[0]
+        algorithm = rng.choice(algorithms)
+
+        if kind == 'list':
+            plan.append({'kind': kind, 'method': 'GET', 'path': '/api/algorithms', 'body': None})
+        elif kind == 'info':
+            path = f"/api/algorithms/{algorithm['name']}/info"
+            plan.append({'kind': kind, 'method': 'GET', 'path': path, 'body': None})
+        else:
+            if trace_size is None:
+                algorithm_input = rng.choice(algorithm['example_inputs'])['input']
+            else:
+                size = max(trace_size, MIN_SIZES.get(algorithm['name'], 1))
+                algorithm_input = generate_input(algorithm['name'], size, seed + index)
+            body = json.dumps({'algorithm': algorithm['name'], 'input': algorithm_input})
+            plan.append({'kind': kind, 'method': 'POST', 'path': '/api/trace/unified', 'body': body})
+
+    return plan
+
+
+# =============================================================================
+# Transports
+# =============================================================================
+
+class ClientTransport:
+    """Send requests through the Flask test client (one client per thread)."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def send(self, request: Dict[str, Any]) -> int:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = app.test_client()
+        response = client.open(
+            request['path'],
+            method=request['method'],
+            data=request['body'],
+            content_type='application/json' if request['body'] else None
+        )
+        response.get_data()
+        return response.status_code
+
+
+class HTTPTransport:
+    """Serve the app on a local ephemeral port and send real HTTP requests."""
+
+    def __init__(self):
+        self._server = None
+        self._thread = None
+        self.port = None
+
+    def __enter__(self):
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class QuietRequestHandler(WSGIRequestHandler):
+            """Suppress per-request access logs so they don't skew timings."""
+
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self._server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietRequestHandler)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._thread.join(timeout=5)
+        return False
+
+    def send(self, request: Dict[str, Any]) -> int:
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        try:
+            headers = {'Content-Type': 'application/json'} if request['body'] else {}
+            connection.request(request['method'], request['path'], body=request['body'], headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+
+TRANSPORTS = {
+    'client': ClientTransport,
+    'http': HTTPTransport,
+}
+
+
+# =============================================================================
+# Execution and statistics
+# =============================================================================
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def summarize(samples: List[Tuple[str, int, float]], elapsed: float) -> Dict[str, Any]:
+    """
+    Summarize (kind, status, latency_ms) samples.
+
+    Returns:
+        dict: Statistics per kind plus an 'overall' entry
+    """
+    groups: Dict[str, List[Tuple[str, int, float]]] = {'overall': samples}
+    for sample in samples:
+        groups.setdefault(sample[0], []).append(sample)
+
+    summary = {}
+    for kind, group in groups.items():
+        latencies = sorted(latency for _, _, latency in group)
+        statuses: Dict[str, int] = {}
+        for _, status, _ in group:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+        stats = {
+            'requests': len(group),
+            'status_codes': dict(sorted(statuses.items())),
+            'throughput_rps': round(len(group) / elapsed, 2) if elapsed > 0 else 0.0,
+            'latency_ms_max': round(latencies[-1], 3) if latencies else 0.0,
+        }
+        for pct in PERCENTILES:
+            stats[f'latency_ms_p{pct}'] = round(percentile(latencies, pct), 3)
+        summary[kind] = stats
+    return summary
+
+
+def run_load_test(
+    plan: List[Dict[str, Any]],
+    mode: str = 'client',
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> Dict[str, Any]:
+    """
+    Send every planned request with the given concurrency.
+
+    Connection failures are recorded with status 0 instead of aborting.
+
+    Returns:
+        dict: {'elapsed_seconds': float, 'summary': {...}}
+    """
+    samples: List[Tuple[str, int, float]] = []
+    lock = threading.Lock()
+
+    with TRANSPORTS[mode]() as transport:
+        def worker(request):
+            started = time.perf_counter()
+            try:
+                status = transport.send(request)
+            except (OSError, http.client.HTTPException):
+                status = 0
+            latency = (time.perf_counter() - started) * 1000
+            with lock:
+                samples.append((request['kind'], status, latency))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+            list(pool.map(worker, plan))
+        elapsed = time.perf_counter() - started
+
+    return {'elapsed_seconds': round(elapsed, 4), 'summary': summarize(samples, elapsed)}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _parse_mix(value: str) -> Dict[str, int]:
+    mix = {kind: 0 for kind in DEFAULT_MIX}
+    for part in value.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in mix:
+            raise ValueError(f"Unknown traffic kind: {kind}")
+        mix[kind] = int(weight)
+    if not any(mix.values()):
+        raise ValueError("At least one traffic kind needs a positive weight")
+    return mix
+
+
+def _parse_mode(value: str) -> str:
+    if value not in TRANSPORTS:
+        raise ValueError(f"Unknown mode: {value}")
+    return value
+
+
+def parse_args(argv: List[str]) -> dict:
+    """Parse command-line arguments into an options dict."""
+    options = {
+        'mode': 'client',
+        'requests': DEFAULT_REQUESTS,
+        'concurrency': DEFAULT_CONCURRENCY,
+        'mix': dict(DEFAULT_MIX),
+        'trace_size': None,
+        'seed': DEFAULT_SEED,
+        'output': None,
+    }
+    converters = {
+        '--mode': ('mode', _parse_mode),
+        '--requests': ('requests', int),
+        '--concurrency': ('concurrency', int),
+        '--mix': ('mix', _parse_mix),
+        '--trace-size': ('trace_size', int),
+        '--seed': ('seed', int),
+        '--output': ('output', Path),
+    }
+
+    args = list(argv)
+    while args:
+        flag = args.pop(0)
+        if flag in ('-h', '--help'):
+            print(__doc__)
+            sys.exit(0)
+        if flag not in converters or not args:
+            print(f"❌ Invalid argument: {flag}")
+            print(__doc__)
+            sys.exit(1)
+        key, convert = converters[flag]
+        try:
+            options[key] = convert(args.pop(0))
+        except ValueError as e:
+            print(f"❌ Invalid value for {flag}: {e}")
+            sys.exit(1)
+
+    return options
+
+
+def main():
+    """Main entry point for script."""
+    options = parse_args(sys.argv[1:])
+    app.logger.disabled = True
+
+    plan = build_request_plan(options['requests'], options['mix'], options['seed'], options['trace_size'])
+
+    print(f"\n{'='*70}")
+    print(f"Load test: {len(plan)} requests, concurrency {options['concurrency']}, mode '{options['mode']}'")
+    print(f"Mix: {', '.join(f'{k}={w}' for k, w in options['mix'].items())}")
+    print(f"{'='*70}\n")
+
+    outcome = run_load_test(plan, options['mode'], options['concurrency'])
+
+    print(f"{'kind':<10} {'reqs':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10} {'req/s':>10}  status")
+    for kind, stats in outcome['summary'].items():
+        print(
+            f"{kind:<10} {stats['requests']:>6} {stats['latency_ms_p50']:>10.2f} {stats['latency_ms_p95']:>10.2f}"
+            f" {stats['latency_ms_p99']:>10.2f} {stats['latency_ms_max']:>10.2f} {stats['throughput_rps']:>10.2f}"
+            f"  {stats['status_codes']}"
+        )
+
+    report = {
+        'config': {key: (str(value) if isinstance(value, Path) else value) for key, value in options.items()},
+        **outcome,
+    }
+    if options['output']:
+        options['output'].write_text(json.dumps(report, indent=2))
+        print(f"\n📄 Report written to: {options['output']}")
+
+    failures = outcome['summary']['overall']['status_codes'].get('0', 0)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
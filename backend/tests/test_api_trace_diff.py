@@ -0,0 +1,90 @@
+# backend/tests/test_api_trace_diff.py
+
+"""
+Trace Diff Endpoint Tests.
+
+Tests the /api/trace/diff endpoint with saved trace results and with
+one algorithm traced on two inputs.
+"""
+
+import pytest
+
+
+BINARY_SEARCH_ARRAY = [1, 3, 5, 7, 9]
+
+
+@pytest.mark.integration
+class TestTraceDiffEndpoint:
+    """Test /api/trace/diff endpoint."""
+
+    def unified(self, client, **options):
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'binary-search',
+            'input': {'array': BINARY_SEARCH_ARRAY, 'target': 7},
+            **options
+        })
+        assert response.status_code == 200
+        return response.get_json()
+
+    def test_saved_responses_are_identical(self, client):
+        """Two responses for the same input differ only in timing, which is ignored."""
+        left = self.unified(client)
+        right = self.unified(client, layout='columnar')
+
+        response = client.post('/api/trace/diff', json={'left': left, 'right': right})
+
+        assert response.status_code == 200
+        report = response.get_json()
+        assert report['identical'] is True
+        assert report['summary']['equal'] == len(left['trace']['steps'])
+
+    def test_two_inputs(self, client):
+        """The algorithm form traces both inputs and reports the first divergence."""
+        response = client.post('/api/trace/diff', json={
+            'algorithm': 'binary-search',
+            'inputs': [
+                {'array': BINARY_SEARCH_ARRAY, 'target': 7},
+                {'array': BINARY_SEARCH_ARRAY, 'target': 1}
+            ],
+            'granularity': 'fine'
+        })
+
+        assert response.status_code == 200
+        report = response.get_json()
+        assert report['identical'] is False
+        assert report['result_equal'] is False
+        assert report['first_divergence']['left_step'] == 0
+
+    def test_missing_fields_return_400(self, client):
+        response = client.post('/api/trace/diff', json={'left': {}})
+
+        assert response.status_code == 400
+        assert 'left' in response.get_json()['error']
+
+    def test_invalid_trace_returns_400(self, client):
+        response = client.post('/api/trace/diff', json={'left': self.unified(client), 'right': {'trace': 1}})
+
+        assert response.status_code == 400
+        assert 'Invalid right' in response.get_json()['error']
+
+    @pytest.mark.parametrize('inputs', [None, [{'array': [1], 'target': 1}], 'ab'])
+    def test_inputs_must_be_a_pair(self, client, inputs):
+        response = client.post('/api/trace/diff', json={'algorithm': 'binary-search', 'inputs': inputs})
+
+        assert response.status_code == 400
+        assert 'inputs' in response.get_json()['error']
+
+    def test_unknown_algorithm_returns_404(self, client):
+        response = client.post('/api/trace/diff', json={'algorithm': 'nope', 'inputs': [{}, {}]})
+
+        assert response.status_code == 404
+        assert 'available_algorithms' in response.get_json()
+
+    def test_rejected_input_returns_400(self, client):
+        """Tracer validation errors are reported as in the unified endpoint."""
+        response = client.post('/api/trace/diff', json={
+            'algorithm': 'binary-search',
+            'inputs': [{'array': BINARY_SEARCH_ARRAY, 'target': 7}, {'array': [], 'target': 7}]
+        })
+
+        assert response.status_code == 400
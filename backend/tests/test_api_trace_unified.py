@@ -9,6 +9,10 @@ and interval coverage algorithms.
 
 import pytest
 from werkzeug.exceptions import UnsupportedMediaType, BadRequest
+from algorithms.interval_coverage import IntervalCoverageTracer
+from algorithms.registry import registry
+from algorithms.input_generators import generate_input
+from algorithms.trace_columnar import decode_columnar
 
 
 @pytest.mark.integration
@@ -176,10 +180,10 @@ class TestUnifiedTraceEndpoint:
 
     def test_interval_coverage_too_many_intervals_returns_400(self, client):
         """Too many intervals should return 400."""
-        # Create 101 intervals (MAX_INTERVALS = 100)
+        # One more than MAX_INTERVALS
         intervals = [
             {'id': i, 'start': i * 10, 'end': i * 10 + 5, 'color': 'blue'}
-            for i in range(101)
+            for i in range(IntervalCoverageTracer.MAX_INTERVALS + 1)
         ]
 
         response = client.post('/api/trace/unified', json={
@@ -382,3 +386,314 @@ class TestUnifiedTraceErrorHandling:
         data = response.get_json()
         assert 'error' in data
         assert 'unexpected server error' in data['error'].lower()
+
+
+@pytest.mark.integration
+class TestUnifiedTraceGranularity:
+    """Test the optional 'granularity' field of the unified endpoint."""
+
+    ALGORITHM_NAMES = [alg['name'] for alg in registry.list_algorithms()]
+
+    @staticmethod
+    def _trace(client, algorithm, input_data, granularity=None):
+        body = {'algorithm': algorithm, 'input': input_data}
+        if granularity is not None:
+            body['granularity'] = granularity
+        return client.post('/api/trace/unified', json=body)
+
+    def test_explicit_fine_matches_default(self, client):
+        """granularity='fine' returns the same steps as omitting it."""
+        input_data = {'array': [1, 3, 5, 7, 9], 'target': 9}
+        default = self._trace(client, 'binary-search', input_data).get_json()
+        fine = self._trace(client, 'binary-search', input_data, 'fine').get_json()
+
+        assert [s['type'] for s in default['trace']['steps']] == [s['type'] for s in fine['trace']['steps']]
+        assert 'granularity' not in fine['metadata']
+
+    def test_invalid_granularity_returns_400(self, client):
+        """Unknown granularity values are rejected."""
+        response = self._trace(client, 'binary-search', {'array': [1, 2], 'target': 2}, 'coarse')
+
+        assert response.status_code == 400
+        assert 'Invalid granularity' in response.get_json()['error']
+
+    @pytest.mark.parametrize('granularity', ['phase', 'summary'])
+    @pytest.mark.parametrize('algorithm', ALGORITHM_NAMES)
+    def test_coarse_trace_summarizes_fine_trace(self, client, algorithm, granularity):
+        """Coarse traces keep first/last steps and account for every fine step."""
+        input_data = generate_input(algorithm, 10 if algorithm == 'topological-sort' else 30, seed=1)
+        fine = self._trace(client, algorithm, input_data).get_json()
+        coarse_response = self._trace(client, algorithm, input_data, granularity)
+
+        assert coarse_response.status_code == 200
+        coarse = coarse_response.get_json()
+        steps = coarse['trace']['steps']
+        fine_steps = fine['trace']['steps']
+
+        assert coarse['result'] == fine['result']
+        assert [s['step'] for s in steps] == list(range(len(steps)))
+        assert steps[0]['type'] == fine_steps[0]['type']
+        assert steps[-1]['type'] == fine_steps[-1]['type']
+        assert coarse['metadata']['fine_steps'] == len(fine_steps)
+        assert sum(s['data']['aggregated']['fine_steps'] for s in steps) == len(fine_steps)
+        if granularity == 'summary':
+            assert len(steps) <= 2
+        # A coarse prediction must ask and answer as the fine one at the same
+        # fine step (each coarse step ends the fine steps it aggregates)
+        fine_points = {p['step_index']: p for p in fine['metadata']['prediction_points']}
+        for point in coarse['metadata']['prediction_points']:
+            index = point['step_index']
+            fine_index = sum(s['data']['aggregated']['fine_steps'] for s in steps[:index + 1]) - 1
+            assert point == {**fine_points[fine_index], 'step_index': index}
+
+    def test_phase_traces_input_too_large_for_fine(self, client):
+        """Bubble sort on 300 elements exceeds MAX_STEPS at fine granularity only."""
+        input_data = generate_input('bubble-sort', 300)
+
+        assert self._trace(client, 'bubble-sort', input_data).status_code == 400
+
+        response = self._trace(client, 'bubble-sort', input_data, 'phase')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['result']['sorted_array'] == sorted(input_data['array'])
+        assert {s['type'] for s in data['trace']['steps'][1:-1]} == {'PASS_COMPLETE'}
+
+
+@pytest.mark.integration
+class TestUnifiedTraceSampling:
+    """Test the optional 'max_output_steps' field of the unified endpoint."""
+
+    def test_caps_steps_and_remaps_predictions(self, client):
+        """Sampled responses stay within the cap with valid prediction indices."""
+        input_data = generate_input('bubble-sort', 40, seed=2)
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'bubble-sort',
+            'input': input_data,
+            'max_output_steps': 50
+        })
+
+        assert response.status_code == 200
+        data = response.get_json()
+        steps = data['trace']['steps']
+        assert len(steps) <= 50
+        assert data['metadata']['sampling']['original_steps'] > 50
+        assert data['result']['sorted_array'] == sorted(input_data['array'])
+        for point in data['metadata']['prediction_points']:
+            assert steps[point['step_index']]['type'] == 'COMPARE'
+            assert steps[point['step_index'] + 1]['type'] in ('SWAP', 'NO_SWAP')
+
+    def test_omitted_leaves_trace_unsampled(self, client):
+        """Without max_output_steps there is no sampling metadata."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'binary-search',
+            'input': {'array': [1, 3, 5, 7], 'target': 7}
+        })
+
+        assert 'sampling' not in response.get_json()['metadata']
+
+    def test_combines_with_granularity(self, client):
+        """Sampling applies to the steps recorded at the chosen granularity."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'insertion-sort',
+            'input': generate_input('insertion-sort', 200),
+            'granularity': 'phase',
+            'max_output_steps': 25
+        })
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['metadata']['sampling']['original_steps'] == 201
+        assert data['trace']['total_steps'] == 25
+
+    @pytest.mark.parametrize('value', [1, 'ten', 3.5])
+    def test_invalid_value_returns_400(self, client, value):
+        """Non-integer or too small caps are rejected."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'binary-search',
+            'input': {'array': [1, 3, 5, 7], 'target': 7},
+            'max_output_steps': value
+        })
+
+        assert response.status_code == 400
+        assert 'max_output_steps' in response.get_json()['error']
+
+    @pytest.mark.parametrize('algorithm, option', [
+        ('meeting-rooms', {'max_output_steps': 20}),
+        ('meeting-rooms', {'include_types': ['NEW_ROOM']}),
+        ('longest-increasing-subsequence', {'max_output_steps': 20}),
+        ('longest-increasing-subsequence', {'include_types': ['EXTEND_TAIL', 'REPLACE_TAIL']}),
+    ])
+    def test_delta_state_updates_cannot_drop_steps(self, client, algorithm, option):
+        """Delta steps build on the previous step, so they can't be sampled or filtered."""
+        input_data = generate_input(algorithm, 40, seed=1)
+        request = {'algorithm': algorithm, 'input': input_data, **option}
+
+        assert client.post('/api/trace/unified', json=request).status_code == 200
+
+        response = client.post('/api/trace/unified', json={
+            **request, 'input': {**input_data, 'state_updates': 'delta'}
+        })
+        assert response.status_code == 400
+        assert "state_updates 'delta'" in response.get_json()['error']
+
+
+@pytest.mark.integration
+class TestUnifiedTraceLayout:
+    """Test the optional 'layout' field of the unified endpoint."""
+
+    def test_columnar_decodes_to_rows(self, client):
+        """A columnar response decodes to the default row-oriented response."""
+        request = {'algorithm': 'insertion-sort', 'input': generate_input('insertion-sort', 30, seed=5)}
+        rows = client.post('/api/trace/unified', json=request)
+        columnar = client.post('/api/trace/unified', json={**request, 'layout': 'columnar'})
+
+        assert columnar.status_code == 200
+        assert columnar.get_json()['trace']['layout'] == 'columnar'
+        assert len(columnar.data) < len(rows.data)
+
+        expected, decoded = rows.get_json(), decode_columnar(columnar.get_json())
+        for trace in (expected, decoded):
+            trace['trace'].pop('duration')
+            for step in trace['trace']['steps']:
+                step.pop('timestamp')
+        assert decoded == expected
+
+    def test_default_is_rows(self, client):
+        """Without 'layout' the trace has no columnar fields."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'binary-search',
+            'input': {'array': [1, 3, 5, 7], 'target': 7}
+        })
+
+        assert 'layout' not in response.get_json()['trace']
+
+    def test_combines_with_sampling(self, client):
+        """Sampling applies first; the sampled steps are encoded."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'bubble-sort',
+            'input': generate_input('bubble-sort', 40, seed=2),
+            'max_output_steps': 50,
+            'layout': 'columnar'
+        })
+
+        data = response.get_json()
+        assert data['trace']['total_steps'] == 50
+        assert len(decode_columnar(data)['trace']['steps']) == 50
+
+    @pytest.mark.parametrize('value', ['columns', 1, None])
+    def test_invalid_value_returns_400(self, client, value):
+        """Unknown layouts are rejected."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'binary-search',
+            'input': {'array': [1, 3, 5, 7], 'target': 7},
+            'layout': value
+        })
+
+        assert response.status_code == 400
+        assert 'Invalid layout' in response.get_json()['error']
+
+
+@pytest.mark.integration
+class TestUnifiedTraceResultOnly:
+    """Test the optional 'mode' field of the unified endpoint."""
+
+    @pytest.mark.parametrize('algorithm', [alg['name'] for alg in registry.list_algorithms()])
+    def test_result_matches_traced_result(self, client, algorithm):
+        """result_only returns the traced result with empty steps."""
+        request = {'algorithm': algorithm, 'input': generate_input(algorithm, 15, seed=4)}
+        traced = client.post('/api/trace/unified', json=request).get_json()
+        response = client.post('/api/trace/unified', json={**request, 'mode': 'result_only'})
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['result'] == traced['result']
+        assert data['trace']['steps'] == []
+        assert data['metadata']['fine_steps'] == traced['trace']['total_steps']
+
+    def test_input_too_large_to_trace(self, client):
+        """Inputs that exceed MAX_STEPS when traced still return a result."""
+        input_data = generate_input('bubble-sort', 300, seed=1)
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'bubble-sort', 'input': input_data, 'mode': 'result_only'
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()['metadata']['fine_steps'] > registry.get('bubble-sort').MAX_STEPS
+
+    def test_invalid_value_returns_400(self, client):
+        """Unknown modes are rejected."""
+        response = client.post('/api/trace/unified', json={
+            'algorithm': 'binary-search',
+            'input': {'array': [1, 3, 5, 7], 'target': 7},
+            'mode': 'fast'
+        })
+
+        assert response.status_code == 400
+        assert 'Invalid mode' in response.get_json()['error']
+
+
+@pytest.mark.integration
+class TestUnifiedTraceProjection:
+    """Test the optional 'include_types', 'fields' and 'exclude_fields' fields."""
+
+    REQUEST = {'algorithm': 'dijkstras-algorithm', 'input': generate_input('dijkstras-algorithm', 12, seed=3)}
+
+    def test_include_types(self, client):
+        """Only steps of the requested types are returned, with original numbers."""
+        full = client.post('/api/trace/unified', json=self.REQUEST).get_json()
+        response = client.post('/api/trace/unified', json={**self.REQUEST, 'include_types': ['SELECT_MIN_DIST']})
+
+        data = response.get_json()
+        expected = [s for s in full['trace']['steps'] if s['type'] == 'SELECT_MIN_DIST']
+        assert response.status_code == 200
+        assert [s['step'] for s in data['trace']['steps']] == [s['step'] for s in expected]
+        assert data['trace']['total_steps'] == len(expected)
+        assert data['result'] == full['result']
+
+    @pytest.mark.parametrize('sampling', [{}, {'max_output_steps': 1000}])
+    def test_repeated_include_types(self, client, sampling):
+        """A type listed twice returns its steps once, with or without sampling."""
+        request = {'algorithm': 'binary-search', 'input': {'array': [1, 3, 5, 7, 9, 11, 13], 'target': 13}, **sampling}
+        once = client.post('/api/trace/unified', json={**request, 'include_types': ['CALCULATE_MID']}).get_json()
+        twice = client.post('/api/trace/unified', json={
+            **request, 'include_types': ['CALCULATE_MID', 'CALCULATE_MID']
+        }).get_json()
+
+        steps = [s['step'] for s in twice['trace']['steps']]
+        assert steps == [s['step'] for s in once['trace']['steps']] == sorted(set(steps))
+        assert twice['trace']['total_steps'] == len(steps) > 1
+
+    def test_descriptions_without_visualization(self, client):
+        """fields and exclude_fields shrink each step."""
+        full = client.post('/api/trace/unified', json=self.REQUEST)
+        response = client.post('/api/trace/unified', json={
+            **self.REQUEST, 'fields': ['step', 'description', 'data'], 'exclude_fields': ['data.visualization']
+        })
+
+        steps = response.get_json()['trace']['steps']
+        assert len(response.data) < len(full.data) // 4
+        assert set(steps[0]) == {'step', 'description', 'data'}
+        assert all('visualization' not in s['data'] for s in steps)
+
+    def test_combines_with_sampling_and_layout(self, client):
+        """Projection applies after sampling and before the columnar layout."""
+        response = client.post('/api/trace/unified', json={
+            **self.REQUEST,
+            'max_output_steps': 20,
+            'include_types': ['SELECT_MIN_DIST'],
+            'fields': ['step', 'type', 'data.visualization.nodes'],
+            'layout': 'columnar'
+        })
+
+        steps = decode_columnar(response.get_json())['trace']['steps']
+        assert response.status_code == 200
+        assert steps and [s['step'] for s in steps] == sorted(s['step'] for s in steps)
+        assert all(s['type'] == 'SELECT_MIN_DIST' and list(s['data']['visualization']) == ['nodes'] for s in steps)
+
+    @pytest.mark.parametrize('option', ['include_types', 'fields', 'exclude_fields'])
+    def test_invalid_value_returns_400(self, client, option):
+        """Options must be lists of strings."""
+        response = client.post('/api/trace/unified', json={**self.REQUEST, option: 'description'})
+
+        assert response.status_code == 400
+        assert f'Invalid {option}' in response.get_json()['error']
@@ -0,0 +1,164 @@
+# backend/tests/test_benchmark_tracers_script.py
+"""
+Integration tests for the tracer benchmark utility script.
+
+Tests the scripts/benchmark_tracers.py functionality including:
+- Schema-driven input generation for every registered algorithm
+- JSON report structure
+- Baseline comparison and regression exit codes
+- Command-line error handling
+"""
+
+import pytest
+import subprocess
+import sys
+import json
+import importlib.util
+from pathlib import Path
+
+from algorithms.registry import registry
+
+
+SCRIPT_PATH = Path(__file__).parent.parent / 'scripts' / 'benchmark_tracers.py'
+
+
+@pytest.fixture(scope='module')
+def bench():
+    """Import the benchmark script as a module."""
+    spec = importlib.util.spec_from_file_location('benchmark_tracers', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_script(*args):
+    """Run the benchmark script with the given arguments."""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), *args],
+        capture_output=True,
+        text=True
+    )
+
+
+@pytest.mark.script
+class TestSchemaInputGeneration:
+    """Generated inputs must be accepted by every registered tracer."""
+
+    @pytest.mark.parametrize('algorithm_name', [alg['name'] for alg in registry.list_algorithms()])
+    def test_generated_input_is_valid(self, bench, algorithm_name):
+        """Small generated inputs execute without validation errors."""
+        schema = registry.get_metadata(algorithm_name)['input_schema']
+        input_data = bench.generate_input_from_schema(schema, 6, seed=1)
+
+        tracer = registry.get(algorithm_name)()
+        result = tracer.execute(input_data)
+        assert result['trace']['total_steps'] > 0
+
+    def test_generation_is_deterministic(self, bench):
+        """Same schema, size and seed produce identical inputs."""
+        schema = registry.get_metadata('merge-intervals')['input_schema']
+        first = bench.generate_input_from_schema(schema, 20, seed=3)
+        second = bench.generate_input_from_schema(schema, 20, seed=3)
+        assert first == second
+
+    def test_sorted_arrays_for_sorted_schemas(self, bench):
+        """Schemas describing sorted arrays get sorted arrays."""
+        schema = registry.get_metadata('binary-search')['input_schema']
+        input_data = bench.generate_input_from_schema(schema, 50)
+        assert input_data['array'] == sorted(input_data['array'])
+
+    def test_edges_reference_known_nodes(self, bench):
+        """Graph edges only use generated node identifiers."""
+        schema = registry.get_metadata('dijkstras-algorithm')['input_schema']
+        input_data = bench.generate_input_from_schema(schema, 15)
+        nodes = set(input_data['nodes'])
+        for u, v, weight in input_data['edges']:
+            assert u in nodes and v in nodes
+            assert weight >= 0
+
+
+@pytest.mark.script
+class TestMeasurement:
+    """Test measurement records and report comparison."""
+
+    def test_measure_ok_record(self, bench):
+        """Successful runs record all metrics."""
+        record = bench.measure('binary-search', {'array': [1, 3, 5, 7], 'target': 5}, repeat=2)
+        assert record['status'] == 'ok'
+        assert record['steps'] > 0
+        assert record['serialized_bytes'] > 0
+        assert record['peak_memory_bytes'] > 0
+        assert record['time_ms_min'] <= record['time_ms_median'] <= record['time_ms_max']
+
+    def test_measure_error_record(self, bench):
+        """Rejected inputs are recorded instead of raised."""
+        record = bench.measure('binary-search', {'array': [5, 1], 'target': 5}, repeat=1)
+        assert record['status'] == 'error'
+        assert 'ValueError' in record['error']
+
+    def test_compare_flags_regressions(self, bench):
+        """Metrics above the threshold are reported as regressions."""
+        base = {'algorithm': 'binary-search', 'size': 10, 'status': 'ok',
+                'time_ms_median': 1.0, 'peak_memory_bytes': 100,
+                'serialized_bytes': 100, 'steps': 5}
+        slower = dict(base, time_ms_median=2.0)
+
+        regressions = bench.compare_reports({'results': [base]}, {'results': [slower]}, 0.25)
+        assert [r['metric'] for r in regressions] == ['time_ms_median']
+
+        assert bench.compare_reports({'results': [base]}, {'results': [base]}, 0.25) == []
+
+    def test_compare_flags_new_errors(self, bench):
+        """A run that used to succeed but now errors is a regression."""
+        base = {'algorithm': 'bubble-sort', 'size': 10, 'status': 'ok',
+                'time_ms_median': 1.0, 'peak_memory_bytes': 100,
+                'serialized_bytes': 100, 'steps': 5}
+        failed = {'algorithm': 'bubble-sort', 'size': 10, 'status': 'error',
+                  'error': 'RuntimeError: too many steps'}
+
+        regressions = bench.compare_reports({'results': [base]}, {'results': [failed]})
+        assert regressions[0]['metric'] == 'status'
+
+
+@pytest.mark.script
+class TestBenchmarkScriptCLI:
+    """Test the script end to end."""
+
+    def test_writes_json_report(self, tmp_path):
+        """Report file contains config, environment and one record per size."""
+        output = tmp_path / 'report.json'
+        result = run_script('--algorithms', 'binary-search', '--sizes', '5,10',
+                            '--repeat', '1', '--output', str(output))
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        report = json.loads(output.read_text())
+        assert report['report_version'] == 1
+        assert report['config'] == {'sizes': [5, 10], 'repeat': 1, 'seed': 0}
+        assert 'python' in report['environment']
+        assert [(r['algorithm'], r['size']) for r in report['results']] == [
+            ('binary-search', 5), ('binary-search', 10)
+        ]
+
+    def test_baseline_without_regressions_exits_zero(self, tmp_path):
+        """Comparing a report against a generous threshold passes."""
+        baseline = tmp_path / 'baseline.json'
+        run_script('--algorithms', 'kadanes-algorithm', '--sizes', '5',
+                   '--repeat', '1', '--output', str(baseline))
+
+        result = run_script('--algorithms', 'kadanes-algorithm', '--sizes', '5',
+                            '--repeat', '1', '--baseline', str(baseline),
+                            '--threshold', '100')
+        assert result.returncode == 0
+        assert 'No regressions' in result.stdout
+
+    def test_unknown_algorithm_fails(self):
+        """Unknown algorithm names exit with an error."""
+        result = run_script('--algorithms', 'nonexistent-algorithm')
+        assert result.returncode == 1
+        assert 'not found' in result.stdout
+
+    def test_invalid_argument_fails(self):
+        """Unknown flags print usage and exit with an error."""
+        result = run_script('--bogus')
+        assert result.returncode == 1
+        assert 'Usage:' in result.stdout
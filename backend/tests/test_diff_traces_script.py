@@ -0,0 +1,118 @@
+# backend/tests/test_diff_traces_script.py
+"""
+Integration tests for the trace regression check script.
+
+Tests the scripts/diff_traces.py functionality including:
+- Recording traces with their inputs
+- Baseline comparison and exit codes
+- Command-line error handling
+"""
+
+import pytest
+import subprocess
+import sys
+import json
+import importlib.util
+from pathlib import Path
+
+
+SCRIPT_PATH = Path(__file__).parent.parent / 'scripts' / 'diff_traces.py'
+
+
+@pytest.fixture(scope='module')
+def diff_script():
+    """Import the diff script as a module."""
+    spec = importlib.util.spec_from_file_location('diff_traces', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_script(*args):
+    """Run the diff script with the given arguments."""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), *args],
+        capture_output=True,
+        text=True
+    )
+
+
+@pytest.mark.script
+class TestRecordingComparison:
+    """Test recordings and their comparison in process."""
+
+    def test_recording_stores_inputs(self, diff_script):
+        recording = diff_script.record_traces(['kadanes-algorithm'], [4, 8], seed=2)
+
+        assert recording['config'] == {'sizes': [4, 8], 'seed': 2, 'granularity': 'fine'}
+        assert [r['size'] for r in recording['records']] == [4, 8]
+        assert all(len(r['input']['array']) == r['size'] and 'trace' in r for r in recording['records'])
+
+    def test_unchanged_traces_are_identical(self, diff_script):
+        """A JSON round-tripped recording matches a fresh run."""
+        recording = json.loads(json.dumps(diff_script.record_traces(['meeting-rooms', 'merge-sort'], [12])))
+
+        comparisons = diff_script.compare_recording(recording)
+
+        assert [c['identical'] for c in comparisons] == [True, True]
+
+    def test_changed_trace_is_reported(self, diff_script):
+        recording = json.loads(json.dumps(diff_script.record_traces(['bubble-sort'], [6])))
+        recording['records'][0]['trace']['trace']['steps'][3]['description'] = 'edited'
+
+        comparison, = diff_script.compare_recording(recording)
+
+        assert comparison['identical'] is False
+        assert comparison['diff']['first_divergence']['changed_fields'] == ['description']
+        assert 'step 3 changed' in diff_script.format_comparison(comparison)
+
+    def test_error_records(self, diff_script):
+        """A run that used to fail but now succeeds is a difference."""
+        recording = {'config': {'granularity': 'fine'}, 'records': [
+            {'algorithm': 'binary-search', 'size': 0, 'input': {'array': [], 'target': 1},
+             'error': 'ValueError: old message'},
+        ]}
+
+        comparison, = diff_script.compare_recording(recording)
+
+        assert comparison['identical'] is False
+        assert comparison['current_error'].startswith('ValueError')
+
+
+@pytest.mark.script
+class TestDiffScriptCLI:
+    """Test the script end to end."""
+
+    def test_baseline_round_trip(self, tmp_path):
+        """A recording compared against itself exits zero; an edited one exits 1."""
+        baseline = tmp_path / 'baseline.json'
+        result = run_script('--algorithms', 'dijkstras-algorithm,quick-sort', '--sizes', '6',
+                            '--output', str(baseline))
+        assert result.returncode == 0, result.stdout + result.stderr
+
+        result = run_script('--baseline', str(baseline))
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert 'All 2 trace(s) identical' in result.stdout
+
+        recording = json.loads(baseline.read_text())
+        recording['records'][1]['trace']['result']['sorted_array'] = []
+        baseline.write_text(json.dumps(recording))
+
+        result = run_script('--baseline', str(baseline))
+        assert result.returncode == 1
+        assert 'result differs' in result.stdout
+
+    def test_nothing_to_do_fails(self):
+        result = run_script('--sizes', '5')
+        assert result.returncode == 1
+        assert 'Usage:' in result.stdout
+
+    def test_unknown_algorithm_fails(self, tmp_path):
+        result = run_script('--algorithms', 'nonexistent-algorithm', '--output', str(tmp_path / 'out.json'))
+        assert result.returncode == 1
+        assert 'not found' in result.stdout
+
+    def test_invalid_granularity_fails(self, tmp_path):
+        result = run_script('--granularity', 'coarse', '--output', str(tmp_path / 'out.json'))
+        assert result.returncode == 1
+        assert 'Invalid value for --granularity' in result.stdout
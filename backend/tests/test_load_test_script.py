@@ -0,0 +1,126 @@
+# backend/tests/test_load_test_script.py
+"""
+Integration tests for the API load test utility script.
+
+Tests the scripts/load_test.py functionality including:
+- Deterministic request plans that follow the traffic mix
+- Percentile and summary statistics
+- Flask test client and local HTTP server transports
+- Command-line error handling
+"""
+
+import pytest
+import subprocess
+import sys
+import json
+import importlib.util
+from pathlib import Path
+
+
+SCRIPT_PATH = Path(__file__).parent.parent / 'scripts' / 'load_test.py'
+
+
+@pytest.fixture(scope='module')
+def load_test():
+    """Import the load test script as a module."""
+    spec = importlib.util.spec_from_file_location('load_test', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.script
+class TestRequestPlan:
+    """Test request plan generation."""
+
+    def test_plan_is_deterministic(self, load_test):
+        """Same seed produces the same plan."""
+        mix = {'list': 1, 'info': 1, 'trace': 1}
+        assert load_test.build_request_plan(30, mix, seed=4) == load_test.build_request_plan(30, mix, seed=4)
+
+    def test_plan_respects_zero_weights(self, load_test):
+        """Kinds with zero weight never appear."""
+        plan = load_test.build_request_plan(50, {'list': 0, 'info': 0, 'trace': 1})
+        assert {request['kind'] for request in plan} == {'trace'}
+        assert all(request['path'] == '/api/trace/unified' for request in plan)
+
+    def test_trace_bodies_use_generated_inputs(self, load_test):
+        """--trace-size produces bodies with generated inputs of that size."""
+        plan = load_test.build_request_plan(10, {'list': 0, 'info': 0, 'trace': 1}, trace_size=15)
+        for request in plan:
+            body = json.loads(request['body'])
+            collection = next(v for v in body['input'].values() if isinstance(v, list))
+            assert len(collection) == 15
+
+
+@pytest.mark.script
+class TestStatistics:
+    """Test percentile and summary helpers."""
+
+    def test_percentile_interpolates(self, load_test):
+        """Percentiles interpolate between ranks."""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert load_test.percentile(values, 50) == 3.0
+        assert load_test.percentile(values, 100) == 5.0
+        assert load_test.percentile(values, 0) == 1.0
+        assert load_test.percentile([1.0, 2.0], 50) == 1.5
+        assert load_test.percentile([], 99) == 0.0
+
+    def test_summary_groups_by_kind(self, load_test):
+        """Summary has an overall entry and one per kind."""
+        samples = [('list', 200, 1.0), ('trace', 200, 3.0), ('trace', 400, 5.0)]
+        summary = load_test.summarize(samples, elapsed=2.0)
+
+        assert summary['overall']['requests'] == 3
+        assert summary['overall']['throughput_rps'] == 1.5
+        assert summary['trace']['status_codes'] == {'200': 1, '400': 1}
+        assert summary['trace']['latency_ms_p50'] == 4.0
+        assert summary['list']['latency_ms_max'] == 1.0
+
+
+@pytest.mark.script
+class TestTransports:
+    """Run small load tests through both transports."""
+
+    @pytest.mark.parametrize('mode', ['client', 'http'])
+    def test_run_load_test(self, load_test, mode):
+        """All requests complete and are reported."""
+        plan = load_test.build_request_plan(24, {'list': 1, 'info': 1, 'trace': 2}, seed=1)
+        outcome = load_test.run_load_test(plan, mode=mode, concurrency=4)
+
+        overall = outcome['summary']['overall']
+        assert overall['requests'] == 24
+        assert '0' not in overall['status_codes']
+        assert overall['latency_ms_p50'] <= overall['latency_ms_p95'] <= overall['latency_ms_p99']
+        assert overall['throughput_rps'] > 0
+
+
+@pytest.mark.script
+class TestLoadTestScriptCLI:
+    """Test the script end to end."""
+
+    def test_writes_json_report(self, tmp_path):
+        """Report contains config and summary."""
+        output = tmp_path / 'load.json'
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT_PATH), '--requests', '20', '--concurrency', '2',
+             '--output', str(output)],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        report = json.loads(output.read_text())
+        assert report['config']['requests'] == 20
+        assert report['summary']['overall']['requests'] == 20
+        assert 'latency_ms_p99' in report['summary']['overall']
+
+    def test_invalid_mix_fails(self):
+        """Unknown traffic kinds exit with an error."""
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT_PATH), '--mix', 'bogus=1'],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 1
+        assert 'Unknown traffic kind' in result.stdout